@@ -0,0 +1,294 @@
+# Çok yılanlı arena: yüzlerce yapay zekâ yılanı aynı tahtada meyve ve güçlendirme için yarışır.
+# Tüm yılanlar tek bir doluluk ızgarasını paylaşır: her hücrenin tipi (snake_core'daki
+# EMPTY/BODY/FRUIT/POWER_UP kodları) ve sahibi (yılan numarası + 1) tutulur. Baş-gövde
+# çarpışması tek bir ızgara okuması, baş-başa çarpışma aynı tikte aynı hücreyi isteyen
+# başların sözlüğüdür; yılan çiftleri hiçbir zaman karşılaştırılmaz.
+#
+# Bir tikte tüm yılanlar aynı anda hareket eder:
+#   1. Her yılan yönünü seçer (hedef meyveye açgözlü, dolu hücrelerden kaçınarak)
+#   2. Büyümeyen yılanların kuyrukları boşalır (bir baş az önce boşalan kuyruğa girebilir)
+#   3. Aynı hücreye giren başlar ve duvara/gövdeye çarpan başlar ölür
+#   4. Ölen yılanların gövdesi meyveye dönüşür; yılan RESPAWN_TICKS sonra yeniden doğar
+#
+# Hız ölçümü:  python arena.py [yılan sayısı] [tahta boyu] [tik sayısı]
+# İzlemek için: python arena.py 200 200 --izle   (pygame gerektirir)
+import sys
+import time
+from array import array
+from collections import deque
+
+from snake_core import GameRandom, DIRECTIONS, EMPTY, BODY, FRUIT, POWER_UP
+
+ARENA_SIZE = 200
+START_LENGTH = 3
+RESPAWN_TICKS = 20
+FRUIT_SCORE = 10
+POWER_UP_SCORE = 30  # Güçlendirme: daha fazla puan ve büyüme
+POWER_UP_GROWTH = 3
+POWER_UP_CHANCE = 0.1  # Yeni yem yerine güçlendirme çıkma olasılığı
+CORPSE_FRUIT_CHANCE = 0.3  # Ölen yılanın her gövde hücresinin meyveye dönüşme olasılığı
+
+
+class ArenaSnake:
+    __slots__ = ("number", "body", "direction", "pending_growth", "score", "alive",
+                 "respawn_tick", "target", "deaths")
+
+    def __init__(self, number):
+        self.number = number
+        self.body = deque()
+        self.direction = 0
+        self.pending_growth = 0
+        self.score = 0
+        self.alive = False
+        self.respawn_tick = 0
+        self.target = -1
+        self.deaths = 0
+
+
+class Arena:
+    def __init__(self, num_snakes=200, cell_number=ARENA_SIZE, seed=None, num_fruits=None):
+        self.cell_number = cell_number
+        self.random = GameRandom(seed)
+        self.seed = self.random.seed
+        self.spawn_rng = self.random.split("spawn")
+        self.fruit_rng = self.random.split("fruit")
+        self.ai_rng = self.random.split("ai")
+
+        cells = cell_number * cell_number
+        self.grid = bytearray(cells)
+        self.owner = array('H', bytes(2 * cells))  # Gövde hücresinin sahibi: yılan numarası + 1
+
+        # Tahta içindeki komşular (yön koduna göre, dışarısı -1)
+        n = cell_number
+        self.neighbors = [tuple((y + dy) * n + x + dx if 0 <= x + dx < n and 0 <= y + dy < n else -1
+                                for dx, dy in DIRECTIONS)
+                          for y in range(n) for x in range(n)]
+
+        # Meyve ve güçlendirme hücreleri; fruit_slot hücrenin listedeki yeri (-1 = yok),
+        # böylece yenen meyve snake_core'daki boş hücreler gibi swap-remove ile O(1) çıkar
+        self.fruits = []
+        self.fruit_slot = array('i', [-1]) * cells
+        self.num_fruits = num_fruits if num_fruits is not None else max(1, num_snakes // 2)
+        self.ticks = 0
+        self.snakes = [ArenaSnake(number) for number in range(num_snakes)]
+        for snake in self.snakes:
+            self.spawn_snake(snake)
+        while len(self.fruits) < self.num_fruits:
+            if not self.place_fruit():
+                break
+
+    def random_empty_cell(self, rng):
+        # Arena çoğunlukla boştur; rastgele deneme birkaç adımda boş hücre bulur
+        grid = self.grid
+        size = len(grid)
+        for _ in range(64):
+            cell = rng.randrange(size)
+            if grid[cell] == EMPTY:
+                return cell
+        return -1
+
+    def place_fruit(self):
+        cell = self.random_empty_cell(self.fruit_rng)
+        if cell < 0:
+            return False
+        self.grid[cell] = POWER_UP if self.fruit_rng.random() < POWER_UP_CHANCE else FRUIT
+        self.add_fruit(cell)
+        return True
+
+    def add_fruit(self, cell):
+        self.fruit_slot[cell] = len(self.fruits)
+        self.fruits.append(cell)
+
+    def remove_fruit(self, cell):
+        # Son elemanı boşalan yere taşı (swap-remove)
+        slot = self.fruit_slot[cell]
+        last = self.fruits.pop()
+        if last != cell:
+            self.fruits[slot] = last
+            self.fruit_slot[last] = slot
+        self.fruit_slot[cell] = -1
+
+    def spawn_snake(self, snake):
+        # Yatay, START_LENGTH hücrelik boş bir şerit bul; baş sağda, sağa bakar
+        grid, n = self.grid, self.cell_number
+        for _ in range(64):
+            head = self.random_empty_cell(self.spawn_rng)
+            if head < 0:
+                break
+            x = head % n
+            cells = [head - i for i in range(START_LENGTH)]
+            if x >= START_LENGTH - 1 and x < n - 1 and all(grid[cell] == EMPTY for cell in cells):
+                snake.body = deque(cells)
+                snake.direction = 1
+                snake.pending_growth = 0
+                snake.alive = True
+                snake.target = -1
+                for cell in cells:
+                    grid[cell] = BODY
+                    self.owner[cell] = snake.number + 1
+                return True
+        snake.respawn_tick = self.ticks + RESPAWN_TICKS
+        return False
+
+    def choose(self, snake):
+        # Hedef meyveye en çok yaklaştıran, gövdeye veya duvara girmeyen yön
+        grid, n = self.grid, self.cell_number
+        target = snake.target
+        if target < 0 or grid[target] not in (FRUIT, POWER_UP):
+            if not self.fruits:
+                target = -1
+            else:
+                target = self.fruits[self.ai_rng.randrange(len(self.fruits))]
+            snake.target = target
+        head = snake.body[0]
+        neighbors = self.neighbors[head]
+        reverse = (snake.direction + 2) % 4
+        target_y, target_x = divmod(target, n) if target >= 0 else divmod(head, n)
+
+        best_direction = snake.direction
+        best_distance = None
+        for direction in range(4):
+            cell = neighbors[direction]
+            if direction == reverse or cell < 0 or grid[cell] == BODY:
+                continue
+            y, x = divmod(cell, n)
+            distance = abs(target_x - x) + abs(target_y - y)
+            if best_distance is None or distance < best_distance:
+                best_distance = distance
+                best_direction = direction
+        return best_direction
+
+    def step(self):
+        self.ticks += 1
+        grid, owner = self.grid, self.owner
+        alive = [snake for snake in self.snakes if snake.alive]
+
+        # 1. Yön seçimi ve yeni baş hücreleri
+        moves = []
+        for snake in alive:
+            snake.direction = self.choose(snake)
+            moves.append((snake, self.neighbors[snake.body[0]][snake.direction]))
+
+        # 2. Kuyruklar boşalır
+        for snake in alive:
+            if snake.pending_growth:
+                snake.pending_growth -= 1
+            else:
+                tail = snake.body.pop()
+                grid[tail] = EMPTY
+                owner[tail] = 0
+
+        # 3. Çarpışmalar: aynı hücreyi isteyen başlar sözlükte toplanır
+        claims = {}
+        for snake, cell in moves:
+            if cell in claims:
+                claims[cell].append(snake)
+            else:
+                claims[cell] = [snake]
+
+        dead = []
+        for cell, snakes in claims.items():
+            if cell < 0 or len(snakes) > 1 or grid[cell] == BODY:
+                dead.extend(snakes)
+                continue
+            snake = snakes[0]
+            kind = grid[cell]
+            snake.body.appendleft(cell)
+            grid[cell] = BODY
+            owner[cell] = snake.number + 1
+            if kind == FRUIT or kind == POWER_UP:
+                self.remove_fruit(cell)
+                if kind == FRUIT:
+                    snake.score += FRUIT_SCORE
+                    snake.pending_growth += 1
+                else:
+                    snake.score += POWER_UP_SCORE
+                    snake.pending_growth += POWER_UP_GROWTH
+                snake.target = -1
+
+        # 4. Ölen yılanların gövdesi kalkar, bir kısmı meyve olur
+        for snake in dead:
+            self.kill(snake)
+        while len(self.fruits) < self.num_fruits:
+            if not self.place_fruit():
+                break
+
+        # Süresi gelen yılanlar yeniden doğar
+        for snake in self.snakes:
+            if not snake.alive and snake.respawn_tick <= self.ticks:
+                self.spawn_snake(snake)
+
+    def kill(self, snake):
+        grid, owner = self.grid, self.owner
+        number = snake.number + 1
+        rng = self.fruit_rng
+        for cell in snake.body:
+            if owner[cell] != number:
+                continue
+            owner[cell] = 0
+            if rng.random() < CORPSE_FRUIT_CHANCE:
+                grid[cell] = FRUIT
+                self.add_fruit(cell)
+            else:
+                grid[cell] = EMPTY
+        snake.body.clear()
+        snake.alive = False
+        snake.deaths += 1
+        snake.respawn_tick = self.ticks + RESPAWN_TICKS
+
+
+def watch(arena):
+    # Arenayı pencerede izle: her yılan kendi renginde, meyveler kırmızı
+    import pygame
+
+    n = arena.cell_number
+    cell_size = max(1, 800 // n)
+    pygame.init()
+    screen = pygame.display.set_mode((n * cell_size, n * cell_size))
+    pygame.display.set_caption("Yılan Arenası")
+    clock = pygame.time.Clock()
+    colors = [((number * 97) % 200 + 30, (number * 57) % 200 + 30, (number * 37) % 200 + 30)
+              for number in range(len(arena.snakes))]
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        arena.step()
+        screen.fill((175, 215, 70))
+        for cell in arena.fruits:
+            y, x = divmod(cell, n)
+            color = (255, 0, 0) if arena.grid[cell] == FRUIT else (128, 0, 128)
+            screen.fill(color, (x * cell_size, y * cell_size, cell_size, cell_size))
+        for snake in arena.snakes:
+            color = colors[snake.number]
+            for cell in snake.body:
+                y, x = divmod(cell, n)
+                screen.fill(color, (x * cell_size, y * cell_size, cell_size, cell_size))
+        pygame.display.flip()
+        clock.tick(20)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    num_snakes = int(args[0]) if len(args) > 0 else 200
+    cell_number = int(args[1]) if len(args) > 1 else ARENA_SIZE
+    num_ticks = int(args[2]) if len(args) > 2 else 1000
+    arena = Arena(num_snakes, cell_number, seed=0)
+    if "--izle" in sys.argv:
+        watch(arena)
+        sys.exit()
+
+    tick_times = []
+    for _ in range(num_ticks):
+        start = time.perf_counter()
+        arena.step()
+        tick_times.append(time.perf_counter() - start)
+    tick_times.sort()
+    deaths = sum(snake.deaths for snake in arena.snakes)
+    longest = max(len(snake.body) for snake in arena.snakes)
+    print(f"{num_snakes} yılan, {cell_number}x{cell_number} tahta, {num_ticks} tik: "
+          f"ortalama {sum(tick_times) / num_ticks * 1000:.2f} ms, "
+          f"p99 {tick_times[int(num_ticks * 0.99)] * 1000:.2f} ms, "
+          f"en kötü {tick_times[-1] * 1000:.2f} ms ({deaths} ölüm, en uzun yılan {longest})")
@@ -0,0 +1,292 @@
+# Otopilot: yılanı meyveye en kısa yoldan götürür; yol güvenli değilse kuyruğa ulaşan
+# veya en geniş alana açılan yönü seçer.
+# Meyveden başlayan BFS uzaklık alanı tikler arasında saklanır. Her tikte yalnızca
+# başın girdiği hücre kapanır ve kuyruğun bıraktığı hücre açılır; alan bu iki hücrenin
+# çevresinde yerel olarak onarılır. Tam BFS yalnızca meyve yer değiştirdiğinde, engeller
+# değiştiğinde veya yeni bir oyun başladığında yapılır.
+#
+# Tam BFS büyük tahtalarda tek tike sığmaz (200x200 tahtada 25 ms ve üzeri): alan
+# FILL_BUDGET hücrelik parçalarla birkaç tike yayılır. Dolum sürerken yılanın hareketi
+# yalnızca engel bilgisine yazılır; dolum bitince değişen hücreler yerel onarımla alana
+# işlenir. Baş dar bir geçidi kapatınca yerel onarım da büyüyebilir; REPAIR_LIMIT
+# hücreyi aşan onarım bırakılıp yayılan dolum yeniden başlatılır. Alan hazır değilken
+# meyveye yol yok sayılır ve aşağıdaki yedek kural çalışır.
+#
+# Bir yön ancak başın o hücreden sonra en az yılan boyu kadar alana (veya kuyruğa)
+# ulaşabildiği durumda seçilir; böylece yılan meyveye giderken kendini kapatmaz.
+# Bu alan kontrolü yılan boyuyla sınırlı bir taşma aramasıdır. Meyveye güvenli yol
+# yoksa kuyruğa giden yol izlenmez; taşma aramasında kuyruğa ulaşan, o da yoksa en
+# geniş alana açılan yön seçilir (kuyruğu kovalamaya yakın, ucuz bir sezgi).
+#
+# Autopilot örneği GameCore alıp yön kodu döndüren bir ajandır; yılanOyunu.py'deki
+# otopilot modu ve tournament.py (python -m tournament --agents autopilot:autopilot) kullanır.
+from collections import deque
+
+from snake_core import DIRECTIONS, OBSTACLE
+
+UNREACHABLE = 1 << 30
+FILL_BUDGET = 8000  # Tik başına BFS ile işlenen en fazla hücre (30x30 tahta tek tikte dolar)
+REPAIR_LIMIT = FILL_BUDGET // 4  # Bunu aşan yerel onarım bırakılır, yayılan dolum başlar
+
+# Tahta boyuna göre komşu tabloları; aynı boydaki tüm otopilotlar paylaşır
+neighbor_tables = {}
+
+
+class Autopilot:
+    def __init__(self):
+        self.core = None
+        self.cell_number = None
+        self.frontier = []  # Yarım kalan BFS'in sıradaki seviyesi
+
+    def __call__(self, core):
+        self.sync(core)
+        return self.choose(core)
+
+    def build_neighbors(self, n):
+        # Her hücrenin tahta içindeki komşuları (DIRECTIONS sırasıyla) - tahta boyu başına bir
+        # kez kurulur. İç hücreler tek bir liste üretimiyle, kenarlar ayrıca doldurulur.
+        self.cell_number = n
+        neighbors = neighbor_tables.get(n)
+        if neighbors is None:
+            neighbors = [(cell - n, cell + 1, cell + n, cell - 1) for cell in range(n * n)]
+            edges = {cell for i in range(n) for cell in (i, n * n - n + i, i * n, i * n + n - 1)}
+            for cell in edges:
+                y, x = divmod(cell, n)
+                neighbors[cell] = tuple((y + dy) * n + x + dx for dx, dy in DIRECTIONS
+                                        if 0 <= x + dx < n and 0 <= y + dy < n)
+            neighbor_tables[n] = neighbors
+        self.neighbors = neighbors
+
+    def sync(self, core):
+        # Son çağrıdan bu yana tek bir tik geçtiyse alanı yerel olarak güncelle
+        fruit = core.cell_index(core.fruit_pos) if core.fruit_pos is not None else -1
+        if (core is not self.core or core.ticks != self.ticks + 1 or core.level != self.level
+                or len(core.obstacles) != self.obstacle_count):
+            self.rebuild(core)
+            self.fill_distance(fruit)
+            return
+
+        self.ticks = core.ticks
+        body = core.snake_body
+        # Meyve yer değiştirdiyse alan zaten baştan kurulacak; yalnızca engel bilgisi güncellenir.
+        # Dolum sürüyorsa değişen hücreler dolum bitince onarılmak üzere not edilir.
+        refill = fruit != self.fruit
+        direct = refill or bool(self.frontier)
+        # Dokunulmazlıkta kuyruk bir engelin üzerinden çekilmiş olabilir; engel kapalı kalır
+        tail = self.tail
+        if tail != body[-1] and not core.body_count[tail] and core.grid[tail] != OBSTACLE:
+            if direct:
+                self.blocked[tail] = 0
+                self.changed.add(tail)
+            else:
+                self.unblock(tail)
+        self.tail = body[-1]
+        if not self.blocked[body[0]]:
+            if direct or self.frontier:
+                self.blocked[body[0]] = 1
+                self.changed.add(body[0])
+            else:
+                self.block(body[0])
+        if refill:
+            self.fill_distance(fruit)
+        elif self.frontier:
+            self.continue_fill()
+
+    def rebuild(self, core):
+        n = core.cell_number
+        if n != self.cell_number:
+            self.build_neighbors(n)
+        self.core = core
+        self.ticks = core.ticks
+        self.level = core.level
+        self.obstacle_count = len(core.obstacles)
+        self.tail = core.snake_body[-1]
+
+        blocked = bytearray(n * n)
+        for index in core.snake_body:
+            blocked[index] = 1
+        for x, y in core.obstacles:
+            blocked[y * n + x] = 1
+        self.blocked = blocked
+
+    def fill_distance(self, fruit):
+        # Meyveden tam BFS, seviye seviye; bu tikte en fazla FILL_BUDGET hücre işlenir
+        self.start_fill(fruit)
+        self.continue_fill()
+
+    def start_fill(self, fruit):
+        self.fruit = fruit
+        self.distance = distance = [UNREACHABLE] * len(self.blocked)
+        self.changed = set()
+        self.frontier = []
+        if fruit < 0:
+            return
+        distance[fruit] = 0
+        self.frontier = [fruit]
+        self.fill_level = 0
+
+    def continue_fill(self):
+        # Yarım kalan BFS'i bütçe kadar sürdür; bitince dolum sırasında değişen hücreleri onar
+        blocked, neighbors, distance = self.blocked, self.neighbors, self.distance
+        frontier = self.frontier
+        level = self.fill_level
+        budget = FILL_BUDGET
+        while frontier and budget > 0:
+            budget -= len(frontier)
+            level += 1
+            next_frontier = []
+            for cell in frontier:
+                for neighbor in neighbors[cell]:
+                    if distance[neighbor] > level and not blocked[neighbor]:
+                        distance[neighbor] = level
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        self.frontier = frontier
+        self.fill_level = level
+        if frontier:
+            return
+        changed, self.changed = self.changed, set()
+        for cell in changed:
+            # BFS hücreyi geçtikten sonra kapananlar yetimlerini, açılanlar uzaklığını alır
+            if blocked[cell]:
+                self.block(cell)
+            elif distance[cell] >= UNREACHABLE:
+                self.unblock(cell)
+            if self.frontier:
+                # Onarım sınırı aştı ve dolum yeniden başladı; kalan hücreleri o okur
+                return
+
+    def unblock(self, cell):
+        # Açılan hücre en yakın komşusundan bir fazla uzaklık alır; kısalan yollar dışa yayılır
+        blocked, distance, neighbors = self.blocked, self.distance, self.neighbors
+        blocked[cell] = 0
+        best = min(distance[neighbor] for neighbor in neighbors[cell]) + 1
+        if best >= UNREACHABLE:
+            return
+        distance[cell] = best
+        queue = deque((cell,))
+        processed = 0
+        while queue:
+            processed += 1
+            if processed > REPAIR_LIMIT:
+                self.start_fill(self.fruit)
+                return
+            current = queue.popleft()
+            next_distance = distance[current] + 1
+            for neighbor in neighbors[current]:
+                if not blocked[neighbor] and distance[neighbor] > next_distance:
+                    distance[neighbor] = next_distance
+                    queue.append(neighbor)
+
+    def block(self, cell):
+        blocked, distance, neighbors = self.blocked, self.distance, self.neighbors
+        blocked[cell] = 1
+        if distance[cell] >= UNREACHABLE:
+            return
+
+        # 1. En kısa yolu yalnızca bu hücreden geçen hücreleri bul (seviye seviye ilerler,
+        #    böylece bir hücre denetlenirken bir alt seviyedeki tüm yetimler bilinir)
+        orphans = {cell}
+        queue = deque((cell,))
+        while queue:
+            current = queue.popleft()
+            child_distance = distance[current] + 1
+            for child in neighbors[current]:
+                if blocked[child] or child in orphans or distance[child] != child_distance:
+                    continue
+                for parent in neighbors[child]:
+                    if (distance[parent] == child_distance - 1 and not blocked[parent]
+                            and parent not in orphans):
+                        break
+                else:
+                    orphans.add(child)
+                    queue.append(child)
+            if len(orphans) > REPAIR_LIMIT:
+                # Dar bir geçit kapandı; büyük bölgeyi yerelde onarmak yerine dolumu yeniden başlat
+                self.start_fill(self.fruit)
+                return
+
+        # 2. Yetimleri alanın geri kalanından, sınırdaki uzaklıklarla yeniden doldur
+        for orphan in orphans:
+            distance[orphan] = UNREACHABLE
+        seeds = []
+        for orphan in orphans:
+            if orphan != cell:
+                best = min(distance[neighbor] for neighbor in neighbors[orphan]) + 1
+                if best < UNREACHABLE:
+                    seeds.append((best, orphan))
+        seeds.sort()
+
+        # Sıralı tohumlar ve BFS kuyruğu birleştirilerek artan uzaklık sırasıyla işlenir
+        queue = deque()
+        i = 0
+        while i < len(seeds) or queue:
+            if queue and (i == len(seeds) or distance[queue[0]] <= seeds[i][0]):
+                current = queue.popleft()
+            else:
+                seed_distance, current = seeds[i]
+                i += 1
+                if seed_distance >= distance[current]:
+                    continue
+                distance[current] = seed_distance
+            next_distance = distance[current] + 1
+            for neighbor in neighbors[current]:
+                if not blocked[neighbor] and distance[neighbor] > next_distance:
+                    distance[neighbor] = next_distance
+                    queue.append(neighbor)
+
+    def flood(self, core, start, limit):
+        # start hücresinden ulaşılabilen alan (en fazla limit hücre) ve kuyruğa varılıp varılmadığı
+        blocked, neighbors = self.blocked, self.neighbors
+        tail = core.snake_body[-1]
+        if start == tail:
+            return 1, True
+        seen = {start}
+        queue = deque((start,))
+        while queue and len(seen) < limit:
+            for neighbor in neighbors[queue.popleft()]:
+                if neighbor == tail:
+                    return len(seen), True
+                if not blocked[neighbor] and neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        return len(seen), False
+
+    def choose(self, core):
+        n = core.cell_number
+        body = core.snake_body
+        head_y, head_x = divmod(body[0], n)
+        tail = body[-1]
+        # Kuyruk bu tik hareket edecekse onun hücresine girmek güvenlidir
+        tail_moves = not core.pending_growth and len(body) > 2
+        reverse = (core.direction + 2) % 4
+
+        moves = []
+        for direction, (dx, dy) in enumerate(DIRECTIONS):
+            x, y = head_x + dx, head_y + dy
+            if direction == reverse or not (0 <= x < n and 0 <= y < n):
+                continue
+            cell = y * n + x
+            if self.blocked[cell] and not (cell == tail and tail_moves):
+                continue
+            if core.grid[cell] == OBSTACLE:
+                continue
+            moves.append((self.distance[cell], direction, cell))
+        if not moves:
+            return None
+
+        # Meyveye en kısa yol, ancak sonrasında yeterli alan kalıyorsa
+        limit = len(body) + 1
+        areas = {}
+        moves.sort()
+        for distance, direction, cell in moves:
+            areas[direction] = area, reaches_tail = self.flood(core, cell, limit)
+            if distance < UNREACHABLE and (area >= limit or reaches_tail):
+                return direction
+
+        # Meyve güvenli değil: kuyruğa ulaşan, yoksa en geniş alana açılan yönü izle
+        return max(moves, key=lambda move: areas[move[1]][::-1])[1]
+
+
+# Tek bir örnek de ajan olarak kullanılabilir: yeni bir oyun görünce alanı baştan kurar
+autopilot = Autopilot()
@@ -0,0 +1,344 @@
+# N adet yılan oyununu NumPy dizileri üzerinde aynı anda (lockstep) ilerleten toplu simülatör.
+# level_up_threshold, snake_speeds ve güçlendirme olasılıklarını dengelemek için
+# çok sayıda oyun oynatmakta kullanılır. Kurallar snake_core.GameCore ile aynıdır
+# (güçlendirme etkileri ve seviye engel yerleşimleri dahil); rastgele sayılar
+# NumPy üretecinden geldiği için aynı seed tek tek oyunlarla birebir aynı oyunu üretmez.
+import sys
+import time
+
+import numpy as np
+
+from snake_core import (CELL_NUMBER, DIRECTIONS, RIGHT, EMPTY, BODY, OBSTACLE, FRUIT, POWER_UP,
+                        POWER_UP_TYPES, SNAKE_SPEEDS, LEVEL_UP_THRESHOLD,
+                        POWER_UP_EFFECT_DURATION, POWER_UP_SPAWN_INTERVAL,
+                        POWER_UP_SPAWN_CHANCE, POWER_UP_FRUIT_INTERVAL)
+
+# Güç kodları POWER_UP_TYPES sırasını izler; NO_POWER_UP aktif güç olmadığını belirtir
+SPEED, INVINCIBILITY, SLOW, EAT_OBSTACLES = range(len(POWER_UP_TYPES))
+NO_POWER_UP = len(POWER_UP_TYPES)
+SPEED_MULTIPLIERS = (1.5, 1.0, 0.7, 1.0, 1.0)
+
+# Oyun sonu nedenleri (final_cause dizisi)
+ALIVE, DEATH_WALL, DEATH_SELF, DEATH_OBSTACLE, WON = range(5)
+CAUSE_NAMES = (None, "wall", "self", "obstacle", "won")
+
+DX = np.array([d[0] for d in DIRECTIONS])
+DY = np.array([d[1] for d in DIRECTIONS])
+
+SAFE_ZONE = 5  # Seviye 0 engellerinin girmediği köşe bölgesi
+WALL_LENGTH = 6  # Seviye 1 duvarı
+L_LENGTH = 5  # Seviye 2 L engeli
+
+
+class BatchSimulator:
+    def __init__(self, num_boards, cell_number=CELL_NUMBER, seed=None,
+                 snake_speeds=SNAKE_SPEEDS, level_up_threshold=LEVEL_UP_THRESHOLD,
+                 power_up_spawn_chance=POWER_UP_SPAWN_CHANCE):
+        self.num_boards = num_boards
+        self.cell_number = cell_number
+        self.cells = cell_number * cell_number
+        self.level_up_threshold = level_up_threshold
+        self.power_up_spawn_chance = power_up_spawn_chance
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.arange(num_boards)
+
+        # Tick süresi tablosu [seviye, aktif güç] - GameCore.tick_ms ile aynı hesap
+        self.tick_table = np.array([[int(1000 / (speed * m)) for m in SPEED_MULTIPLIERS]
+                                    for speed in snake_speeds], dtype=np.int64)
+        self.max_level_index = len(snake_speeds) - 1
+
+        # Tahtalar: hücre tipi ve gövde sayısı (dokunulmazlıkta üst üste binme için)
+        self.grid = np.zeros((num_boards, self.cells), dtype=np.uint8)
+        self.body_count = np.zeros((num_boards, self.cells), dtype=np.uint16)
+
+        # Gövde: tahta başına halka tampon; baş head_ptr'de, kuyruk length-1 geride
+        self.capacity = 2 * self.cells
+        self.body = np.zeros((num_boards, self.capacity), dtype=np.int64)
+        self.head_ptr = np.zeros(num_boards, dtype=np.int64)
+        self.length = np.zeros(num_boards, dtype=np.int64)
+        self.pending_growth = np.zeros(num_boards, dtype=np.int64)
+        self.direction = np.zeros(num_boards, dtype=np.int64)
+
+        self.fruit = np.full(num_boards, -1, dtype=np.int64)
+        self.power_up_cell = np.full(num_boards, -1, dtype=np.int64)
+        self.power_up_type = np.zeros(num_boards, dtype=np.int64)
+        self.active_power_up = np.full(num_boards, NO_POWER_UP, dtype=np.int64)
+        self.power_up_effect_start = np.zeros(num_boards, dtype=np.int64)
+
+        self.level = np.zeros(num_boards, dtype=np.int64)
+        self.score = np.zeros(num_boards, dtype=np.int64)
+        self.fruits_eaten = np.zeros(num_boards, dtype=np.int64)
+        self.power_up_spawn_counter = np.zeros(num_boards, dtype=np.int64)
+        self.ticks = np.zeros(num_boards, dtype=np.int64)
+        self.time_ms = np.zeros(num_boards, dtype=np.int64)
+        self.next_power_up_roll = np.zeros(num_boards, dtype=np.int64)
+        self.won = np.zeros(num_boards, dtype=bool)
+
+        # Biten son oyunun sonuçları (tahta otomatik sıfırlanmadan önce kopyalanır)
+        self.episodes = np.zeros(num_boards, dtype=np.int64)
+        self.final_score = np.zeros(num_boards, dtype=np.int64)
+        self.final_level = np.zeros(num_boards, dtype=np.int64)
+        self.final_ticks = np.zeros(num_boards, dtype=np.int64)
+        self.final_cause = np.zeros(num_boards, dtype=np.int64)
+
+        self.reset_boards(np.ones(num_boards, dtype=bool))
+
+    def reset_boards(self, mask):
+        b = np.flatnonzero(mask)
+        if not b.size:
+            return
+        n = self.cell_number
+        self.grid[b] = EMPTY
+        self.body_count[b] = 0
+
+        # Başlangıç yılanı: (5,10) baş, (3,10) kuyruk - sağa bakıyor
+        start = np.array([10 * n + 3, 10 * n + 4, 10 * n + 5])
+        self.body[b[:, None], np.arange(3)] = start
+        self.head_ptr[b] = 2
+        self.length[b] = 3
+        self.grid[b[:, None], start] = BODY
+        self.body_count[b[:, None], start] = 1
+        self.direction[b] = RIGHT
+        self.pending_growth[b] = 0
+
+        self.level[b] = 0
+        self.score[b] = 0
+        self.fruits_eaten[b] = 0
+        self.power_up_spawn_counter[b] = 0
+        self.power_up_cell[b] = -1
+        self.power_up_type[b] = 0
+        self.active_power_up[b] = NO_POWER_UP
+        self.power_up_effect_start[b] = 0
+        self.ticks[b] = 0
+        self.time_ms[b] = 0
+        self.next_power_up_roll[b] = POWER_UP_SPAWN_INTERVAL
+        self.won[b] = False
+        self.fruit[b] = -1
+
+        self.create_obstacles(b, np.zeros(b.size, dtype=np.int64))
+        self.place_fruit(b)
+
+    def step(self, actions):
+        # Tüm tahtalara aynı anda bir tik uygular. actions: tahta başına yön kodu, -1 = değişiklik yok.
+        # Bu tikte biten tahtaların maskesini döndürür; bu tahtalar sıfırlanmış olarak döner.
+        n = self.cell_number
+        boards = self.boards
+        actions = np.asarray(actions)
+
+        # Ters yöne dönüş yok sayılır
+        turn = (actions >= 0) & (actions != (self.direction + 2) % 4)
+        self.direction = np.where(turn, actions, self.direction)
+
+        level_index = np.minimum(self.level, self.max_level_index)
+        self.time_ms += self.tick_table[level_index, self.active_power_up]
+        self.ticks += 1
+
+        # Yeni baş - dokunulmazlıkta duvardan diğer tarafa geçilir
+        head = self.body[boards, self.head_ptr]
+        head_y, head_x = np.divmod(head, n)
+        head_x += DX[self.direction]
+        head_y += DY[self.direction]
+        invincible = self.active_power_up == INVINCIBILITY
+        outside = (head_x < 0) | (head_x >= n) | (head_y < 0) | (head_y >= n)
+        cause = np.where(outside & ~invincible, DEATH_WALL, ALIVE)
+        new_head = (head_y % n) * n + head_x % n
+        alive = cause == ALIVE
+
+        # Kuyruk önce boşalır (büyüme bekleyen tahtalar hariç)
+        growing = alive & (self.pending_growth > 0)
+        self.pending_growth -= growing
+        b = boards[alive & ~growing]
+        tail = self.body[b, (self.head_ptr[b] - self.length[b] + 1) % self.capacity]
+        self.body_count[b, tail] -= 1
+        freed = (self.body_count[b, tail] == 0) & (self.grid[b, tail] == BODY)
+        self.grid[b[freed], tail[freed]] = EMPTY
+        self.length[b] -= 1
+
+        # Baş eklenir ve girdiği hücrenin eski tipi tek okumayla alınır
+        a = boards[alive]
+        cell = new_head[a]
+        hit = self.grid[a, cell]
+        self.head_ptr[a] = (self.head_ptr[a] + 1) % self.capacity
+        self.body[a, self.head_ptr[a]] = cell
+        self.length[a] += 1
+        self.body_count[a, cell] += 1
+        over = hit != OBSTACLE
+        self.grid[a[over], cell[over]] = BODY
+
+        # Çarpışmalar
+        active = self.active_power_up[a]
+        shielded = active == INVINCIBILITY
+        cause[a[(hit == BODY) & ~shielded]] = DEATH_SELF
+        on_obstacle = hit == OBSTACLE
+        eat = on_obstacle & (active == EAT_OBSTACLES)
+        cause[a[on_obstacle & ~eat & ~shielded]] = DEATH_OBSTACLE
+
+        # Engel yeme - yılan uzar ve skor artar
+        e = a[eat]
+        self.grid[e, cell[eat]] = BODY
+        self.pending_growth[e] += 1
+        self.score[e] += 20
+
+        # Meyve
+        f = a[hit == FRUIT]
+        if f.size:
+            self.eat_fruit(f)
+
+        # Güçlendirme alma - yeni güç öncekinin yerini alır
+        p = a[hit == POWER_UP]
+        self.active_power_up[p] = self.power_up_type[p]
+        self.power_up_effect_start[p] = self.time_ms[p]
+        self.power_up_cell[p] = -1
+
+        # Etki süresi doldu mu
+        expired = ((self.active_power_up != NO_POWER_UP) &
+                   (self.time_ms - self.power_up_effect_start > POWER_UP_EFFECT_DURATION))
+        self.active_power_up[expired] = NO_POWER_UP
+
+        # Periyodik güçlendirme zarı
+        due = np.flatnonzero(self.time_ms >= self.next_power_up_roll)
+        while due.size:
+            self.next_power_up_roll[due] += POWER_UP_SPAWN_INTERVAL
+            self.spawn_power_up(due[self.rng.random(due.size) < self.power_up_spawn_chance])
+            due = due[self.time_ms[due] >= self.next_power_up_roll[due]]
+
+        # Gövde halka tamponu doldu veya meyve koyacak yer kalmadı: kazanıldı
+        self.won |= self.length >= self.capacity
+        cause[self.won & (cause == ALIVE)] = WON
+
+        done = cause != ALIVE
+        if done.any():
+            self.episodes[done] += 1
+            self.final_score[done] = self.score[done]
+            self.final_level[done] = self.level[done]
+            self.final_ticks[done] = self.ticks[done]
+            self.final_cause[done] = cause[done]
+            self.reset_boards(done)
+        return done
+
+    def eat_fruit(self, f):
+        self.pending_growth[f] += 1
+        self.score[f] += 10
+        self.fruits_eaten[f] += 1
+        self.place_fruit(f)
+
+        # Her 4 meyvede bir güçlendirme ortaya çıkar
+        self.power_up_spawn_counter[f] += 1
+        spawn = f[self.power_up_spawn_counter[f] >= POWER_UP_FRUIT_INTERVAL]
+        self.power_up_spawn_counter[spawn] = 0
+        self.spawn_power_up(spawn)
+
+        # Seviye atlama - yeni engeller, sonra meyve yeniden yerleştirilir
+        up = f[self.fruits_eaten[f] >= self.level_up_threshold]
+        if up.size:
+            self.level[up] += 1
+            self.create_obstacles(up, self.level[up])
+            self.fruits_eaten[up] = 0
+            self.place_fruit(up)
+
+    def random_empty_cells(self, boards, avoid_safe_zone=False):
+        # Her tahta için rastgele bir boş hücre; hiç yoksa -1.
+        # Önce toplu rastgele deneme yapılır, çok dolu tahtalar için tam arama yapılır.
+        n = self.cell_number
+        result = np.full(boards.size, -1, dtype=np.int64)
+        todo = np.arange(boards.size)
+        for _ in range(16):
+            if not todo.size:
+                return result
+            candidate = self.rng.integers(0, self.cells, todo.size)
+            ok = self.grid[boards[todo], candidate] == EMPTY
+            if avoid_safe_zone:
+                ok &= ~((candidate % n < SAFE_ZONE) & (candidate // n < SAFE_ZONE))
+            result[todo[ok]] = candidate[ok]
+            todo = todo[~ok]
+        for i in todo:
+            free = np.flatnonzero(self.grid[boards[i]] == EMPTY)
+            if avoid_safe_zone:
+                free = free[~((free % n < SAFE_ZONE) & (free // n < SAFE_ZONE))]
+            if free.size:
+                result[i] = self.rng.choice(free)
+        return result
+
+    def place_fruit(self, boards):
+        # Eski meyve hâlâ ızgaradaysa hücresini boşalt
+        old = self.fruit[boards]
+        has = old >= 0
+        ob, oc = boards[has], old[has]
+        still = self.grid[ob, oc] == FRUIT
+        self.grid[ob[still], oc[still]] = EMPTY
+
+        cells = self.random_empty_cells(boards)
+        self.fruit[boards] = cells
+        ok = cells >= 0
+        self.grid[boards[ok], cells[ok]] = FRUIT
+        # Tahta doldu - oyun kazanıldı
+        self.won[boards[~ok]] = True
+
+    def spawn_power_up(self, boards):
+        # Sahada zaten bir güçlendirme varsa yenisi çıkmaz
+        boards = boards[self.power_up_cell[boards] < 0]
+        if not boards.size:
+            return
+        cells = self.random_empty_cells(boards)
+        ok = cells >= 0
+        boards, cells = boards[ok], cells[ok]
+        self.power_up_type[boards] = self.rng.integers(0, len(POWER_UP_TYPES), boards.size)
+        self.power_up_cell[boards] = cells
+        self.grid[boards, cells] = POWER_UP
+
+    def add_obstacles(self, boards, cells):
+        # Aynı tahtada tekrar eden hücre olmamalı (her yerleşim kendi içinde benzersizdir)
+        kind = self.grid[boards, cells]
+        fresh = kind != OBSTACLE
+        boards, cells, kind = boards[fresh], cells[fresh], kind[fresh]
+        # Engel meyvenin veya güçlendirmenin üzerine düştüyse onlar sahadan kalkar
+        self.fruit[boards[kind == FRUIT]] = -1
+        self.power_up_cell[boards[kind == POWER_UP]] = -1
+        self.grid[boards, cells] = OBSTACLE
+
+    def create_obstacles(self, boards, levels):
+        n = self.cell_number
+
+        # Seviye 0: güvenli bölge dışında 3 rastgele tekil engel
+        b = boards[levels == 0]
+        for _ in range(3):
+            cells = self.random_empty_cells(b, avoid_safe_zone=True)
+            ok = cells >= 0
+            self.add_obstacles(b[ok], cells[ok])
+
+        # Seviye 1: rastgele bir kenarda duvar
+        b = boards[levels == 1]
+        if b.size:
+            side = self.rng.integers(0, 4, b.size)[:, None]  # 0 üst, 1 sağ, 2 alt, 3 sol
+            along = self.rng.integers(5, n - WALL_LENGTH - 5 + 1, b.size)[:, None] + np.arange(WALL_LENGTH)
+            x = np.select([side == 0, side == 1, side == 2], [along, n - 6, along], 5)
+            y = np.select([side == 0, side == 1, side == 2], [5, along, n - 6], along)
+            self.add_obstacles(np.repeat(b, WALL_LENGTH), (y * n + x).ravel())
+
+        # Seviye 2: L şeklinde engel
+        b = boards[levels == 2]
+        if b.size:
+            start_x = self.rng.integers(10, n - 10 + 1, b.size)[:, None]
+            start_y = self.rng.integers(10, n - 10 + 1, b.size)[:, None]
+            offsets = np.arange(L_LENGTH)
+            x = np.concatenate([start_x + 0 * offsets, start_x + offsets[1:]], axis=1)
+            y = np.concatenate([start_y + offsets, start_y + 0 * offsets[1:]], axis=1)
+            inside = (x < n) & (y < n)
+            self.add_obstacles(np.repeat(b, x.shape[1])[inside.ravel()], (y * n + x)[inside])
+
+
+# Toplu simülatörün hızını ölçer: python batch_sim.py [tahta sayısı] [tik sayısı]
+if __name__ == "__main__":
+    num_boards = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    num_ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    sim = BatchSimulator(num_boards, seed=0)
+    rng = np.random.default_rng(1)
+    # %30 olasılıkla rastgele yön, aksi halde düz devam
+    actions = np.where(rng.random((num_ticks, num_boards)) < 0.3,
+                       rng.integers(0, 4, (num_ticks, num_boards)), -1)
+    start = time.perf_counter()
+    for t in range(num_ticks):
+        sim.step(actions[t])
+    elapsed = time.perf_counter() - start
+    print(f"{num_boards * num_ticks / elapsed:,.0f} tahta-adımı/saniye "
+          f"({sim.episodes.sum()} oyun bitti, ortalama skor {sim.final_score.mean():.1f})")
@@ -0,0 +1,695 @@
+# Ağ üzerinden oyun: asyncio sunucusu tiklerin sahibidir, istemciler yalnızca yön gönderir ve çizer.
+# Her oda kendi GameCore'unu kendi tik süresiyle ilerletir; tek süreçte onlarca oda çalışabilir.
+# Odaya ilk katılan istemci oyuncudur, diğerleri izleyicidir.
+#
+# Çerçeve: uzunluk (I) + ileti. İlk bayt ileti tipidir (little-endian):
+#   istemci -> sunucu
+#     JOIN     b"J" oda (H), rol (B: 0 oyuncu, 1 izleyici)
+#     INPUT    b"D" yön (B)
+#   sunucu -> istemci
+#     SNAPSHOT b"S" GameState.to_bytes() - katılınca ve her yeni oyunda
+#     DELTA    b"T" tik (I), simülasyon zamanı (I), yeni baş (I), yön (B), bayraklar (B)
+#              ve bayraklara göre sırasıyla: çıkan kuyruk (I), meyve hücresi (i),
+#              güçlendirme hücresi ve tipi (ib), durum (skor I, seviye H, yem H, aktif güç b,
+#              etki başlangıcı I), kalkan engeller (H + I...), eklenen engeller (H + I...),
+#              oyun sonu (kazanıldı B, ölüm nedeni b)
+# Bir tikte yalnızca değişen alanlar gönderilir; sıradan bir tik (baş + kuyruk) 19 bayttır.
+#
+# Yayın: her tikin deltası bir kez kodlanır ve aynı bayt nesnesi odadaki tüm bağlantılara
+# yazılır. Okumayan (yavaş) istemciler için sınırsız tampon tutulmaz: yazma tamponu
+# HIGH_WATER'ı aşan istemciye delta gönderilmez, tamponu LOW_WATER'ın altına inince o tikin
+# anlık görüntüsü (anahtar kare) gönderilir ve deltalara devam edilir. Aynı tikte toparlanan
+# tüm istemciler aynı anahtar kareyi paylaşır.
+#
+#   python multiplayer.py server [port]
+#   python multiplayer.py client [host] [port] [oda]     (pygame istemcisi)
+#   python multiplayer.py test [oda] [oda başına istemci] [saniye]
+#   python multiplayer.py load [izleyici] [saniye] [yavaş oranı]   (yayın yük testi)
+import asyncio
+import json
+import socket
+import struct
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
+
+from snake_core import (GameCore, GameRandom, GameState, DIRECTIONS, POWER_UP_TYPES, EMPTY, BODY,
+                        OBSTACLE, FRUIT, POWER_UP, POWER_UP_EFFECT_DURATION)
+
+PORT = 8765
+RESET_DELAY = 2.0  # Oyun bittikten sonra odanın yeni oyuna geçmesi (saniye)
+REPORT_INTERVAL = 5.0
+HIGH_WATER = 64 * 1024  # Bu kadar bayt bekleyen istemci anahtar kareye düşer
+LOW_WATER = 16 * 1024  # Tampon bunun altına inince anahtar kare gönderilir
+
+# Yük testi: odalar 20 kat hızlı tikler, tamponlar küçüktür; yavaş izleyiciler düzenli durur
+LOAD_TIME_SCALE = 20.0
+LOAD_HIGH_WATER = 8 * 1024
+LOAD_LOW_WATER = 2 * 1024
+LOAD_SEND_BUFFER = 4096
+SLOW_RECEIVE_BUFFER = 2048
+SLOW_READ_SECONDS = 1.0
+SLOW_STALL_SECONDS = 3.0
+
+PLAYER, SPECTATOR = 0, 1
+
+LENGTH = struct.Struct("<I")
+JOIN = struct.Struct("<cHB")
+INPUT = struct.Struct("<cB")
+DELTA = struct.Struct("<cIIIBB")
+CELL = struct.Struct("<I")
+FRUIT_CELL = struct.Struct("<i")
+POWER_UP_CELL = struct.Struct("<ib")
+STATUS = struct.Struct("<IHHbI")
+COUNT = struct.Struct("<H")
+GAME_OVER = struct.Struct("<Bb")
+# İstemcinin gönderebileceği en büyük çerçeve (JOIN ve INPUT); sunucu daha uzun bir
+# uzunluk önekini okumadan reddeder, tek istemci sunucu belleğini dolduramaz
+MAX_FRAME = max(JOIN.size, INPUT.size)
+
+# Delta bayrakları
+TAIL_REMOVED = 1
+FRUIT_MOVED = 2
+POWER_UP_CHANGED = 4
+STATUS_CHANGED = 8
+OBSTACLES_REMOVED = 16
+OBSTACLES_ADDED = 32
+GAME_ENDED = 64
+NO_HEAD = 0xFFFFFFFF  # Yılan bu tik hareket etmedi (duvara çarptı)
+
+
+def power_code(power):
+    return POWER_UP_TYPES.index(power) if power is not None else -1
+
+
+def frame(payload):
+    return LENGTH.pack(len(payload)) + payload
+
+
+async def read_frame(reader, limit=None):
+    (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+    if limit is not None and length > limit:
+        raise struct.error(f"Çerçeve çok uzun: {length} bayt")
+    return await reader.readexactly(length)
+
+
+class Room:
+    def __init__(self, server, room_id):
+        self.server = server
+        self.room_id = room_id
+        self.seeds = server.random.split(f"room-{room_id}")
+        self.core = GameCore(seed=self.seeds.getrandbits(64))
+        self.clients = []
+        self.player = None
+        self.next_direction = None
+        self.task = None
+        self.remember()
+
+        # İstatistikler
+        self.ticks = 0
+        self.encode_seconds = 0.0
+        self.broadcast_seconds = 0.0
+        self.delta_bytes = 0
+
+    def remember(self):
+        # Sonraki deltanın karşılaştırılacağı durum
+        core = self.core
+        self.fruit_pos = core.fruit_pos
+        self.power_up = (core.power_up_pos, core.power_up_type)
+        self.status = (core.score, core.level, core.fruits_eaten, core.active_power_up,
+                       core.power_up_effect_start)
+        self.obstacle_cells = {core.cell_index(pos) for pos in core.obstacles}
+        self.level = core.level
+
+    def snapshot_frame(self):
+        return frame(b"S" + self.core.snapshot().to_bytes())
+
+    def add(self, client, role):
+        self.clients.append(client)
+        if role == PLAYER and self.player is None:
+            self.player = client
+        client.send(self.snapshot_frame())
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    def remove(self, client):
+        self.clients.remove(client)
+        if self.player is client:
+            self.player = None
+        if not self.clients and self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            if self.core.game_over:
+                await asyncio.sleep(RESET_DELAY / self.server.time_scale)
+                self.core.reset(self.seeds.getrandbits(64))
+                self.remember()
+                self.broadcast(self.snapshot_frame())
+                next_tick = loop.time()
+
+            # Sabit aralık: uyuma süresi bir önceki tikin hedef zamanından hesaplanır
+            next_tick += self.core.tick_ms / 1000 / self.server.time_scale
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            if self.server.paused:
+                continue
+            self.tick()
+
+    def tick(self):
+        core = self.core
+        previous_head = core.snake_body[0]
+        previous_length = len(core.snake_body)
+        previous_tail = core.snake_body[-1]
+        core.step(self.next_direction)
+        self.next_direction = None
+
+        start = time.perf_counter()
+        payload = self.encode_delta(previous_head, previous_length, previous_tail)
+        self.encode_seconds += time.perf_counter() - start
+        self.ticks += 1
+        self.delta_bytes += len(payload)
+        start = time.perf_counter()
+        self.broadcast(frame(payload))
+        self.broadcast_seconds += time.perf_counter() - start
+
+    def encode_delta(self, previous_head, previous_length, previous_tail):
+        core = self.core
+        flags = 0
+        parts = []
+
+        # Duvara çarpınca yılan hareket etmez; hareket ettiyse ve uzamadıysa eski kuyruk çıkmıştır
+        head = core.snake_body[0]
+        moved = head != previous_head
+        if moved and len(core.snake_body) == previous_length:
+            flags |= TAIL_REMOVED
+            parts.append(CELL.pack(previous_tail))
+        if core.fruit_pos != self.fruit_pos:
+            self.fruit_pos = core.fruit_pos
+            flags |= FRUIT_MOVED
+            parts.append(FRUIT_CELL.pack(core.cell_index(core.fruit_pos) if core.fruit_pos else -1))
+        power_up = (core.power_up_pos, core.power_up_type)
+        if power_up != self.power_up:
+            self.power_up = power_up
+            flags |= POWER_UP_CHANGED
+            cell = core.cell_index(core.power_up_pos) if core.power_up_pos else -1
+            parts.append(POWER_UP_CELL.pack(cell, POWER_UP_TYPES.index(core.power_up_type)))
+        status = (core.score, core.level, core.fruits_eaten, core.active_power_up,
+                  core.power_up_effect_start)
+        if status != self.status:
+            self.status = status
+            flags |= STATUS_CHANGED
+            parts.append(STATUS.pack(core.score, core.level, core.fruits_eaten,
+                                     power_code(core.active_power_up), core.power_up_effect_start))
+
+        # Engeller yalnızca yenince veya seviye atlayınca değişir
+        if len(core.obstacles) != len(self.obstacle_cells) or core.level != self.level:
+            self.level = core.level
+            cells = {core.cell_index(pos) for pos in core.obstacles}
+            removed = self.obstacle_cells - cells
+            added = cells - self.obstacle_cells
+            self.obstacle_cells = cells
+            if removed:
+                flags |= OBSTACLES_REMOVED
+                parts.append(COUNT.pack(len(removed)) + array('I', sorted(removed)).tobytes())
+            if added:
+                flags |= OBSTACLES_ADDED
+                parts.append(COUNT.pack(len(added)) + array('I', sorted(added)).tobytes())
+
+        if core.game_over:
+            flags |= GAME_ENDED
+            parts.append(GAME_OVER.pack(core.won, GameState.DEATH_CAUSES.index(core.death_cause)))
+
+        header = DELTA.pack(b"T", core.ticks, core.time_ms, head if moved else NO_HEAD,
+                            core.direction, flags)
+        return header + b"".join(parts)
+
+    def broadcast(self, data):
+        # Aynı çerçeve herkese yazılır; geride kalanlar deltaları atlar ve anahtar kareyle döner
+        server = self.server
+        keyframe = None
+        for client in self.clients:
+            buffered = client.buffered()
+            if client.lagging:
+                if buffered > server.low_water:
+                    client.dropped += 1
+                    continue
+                if keyframe is None:
+                    keyframe = self.snapshot_frame()
+                client.lagging = False
+                client.keyframes += 1
+                client.send(keyframe)
+            elif buffered > server.high_water:
+                client.lagging = True
+                client.dropped += 1
+            else:
+                client.send(data)
+
+
+class ServerClient:
+    def __init__(self, writer):
+        self.writer = writer
+        self.bytes_sent = 0
+        self.frames_sent = 0
+        self.lagging = False  # Deltalar atlanıyor, anahtar kare bekleniyor
+        self.dropped = 0
+        self.keyframes = 0
+
+    def send(self, data):
+        self.writer.write(data)
+        self.bytes_sent += len(data)
+        self.frames_sent += 1
+
+    def buffered(self):
+        return self.writer.transport.get_write_buffer_size()
+
+
+class Server:
+    def __init__(self, seed=None, high_water=HIGH_WATER, low_water=LOW_WATER, send_buffer=None,
+                 time_scale=1.0):
+        self.random = GameRandom(seed)
+        self.rooms = {}
+        self.clients = []
+        self.paused = False
+        self.started = time.perf_counter()
+        self.high_water = high_water
+        self.low_water = low_water
+        # Çekirdeğin gönderme tamponu küçültülürse geri basınç daha çabuk uygulama katmanına çıkar
+        self.send_buffer = send_buffer
+        self.time_scale = time_scale  # Yük testinde odalar daha hızlı tikleyebilir
+
+    async def start(self, host="127.0.0.1", port=PORT, backlog=100):
+        self.server = await asyncio.start_server(self.handle_client, host, port, backlog=backlog)
+        return self.server
+
+    async def handle_client(self, reader, writer):
+        client = ServerClient(writer)
+        if self.send_buffer:
+            writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF,
+                                                       self.send_buffer)
+        room = None
+        try:
+            _, room_id, role = JOIN.unpack(await read_frame(reader, MAX_FRAME))
+            room = self.rooms.get(room_id)
+            if room is None:
+                room = self.rooms[room_id] = Room(self, room_id)
+            self.clients.append(client)
+            room.add(client, role)
+            while True:
+                message = await read_frame(reader, MAX_FRAME)
+                if message[:1] == b"D" and client is room.player and len(message) == INPUT.size:
+                    # Geçersiz yön kodu çekirdeği bozar; böyle çerçeveler yok sayılır
+                    direction = INPUT.unpack(message)[1]
+                    if direction < len(DIRECTIONS):
+                        room.next_direction = direction
+        except (asyncio.IncompleteReadError, ConnectionError, struct.error):
+            # Kısa veya bozuk bir çerçeve yalnızca bu istemcinin bağlantısını kapatır
+            pass
+        finally:
+            if room is not None and client in room.clients:
+                room.remove(client)
+            if client in self.clients:
+                self.clients.remove(client)
+            writer.close()
+
+    def report(self):
+        # Tik başına serileştirme maliyeti ve istemci başına gönderilen bayt
+        ticks = sum(room.ticks for room in self.rooms.values())
+        encode = sum(room.encode_seconds for room in self.rooms.values())
+        delta_bytes = sum(room.delta_bytes for room in self.rooms.values())
+        elapsed = time.perf_counter() - self.started
+        clients = len(self.clients)
+        sent = sum(client.bytes_sent for client in self.clients)
+        lagging = sum(client.lagging for client in self.clients)
+        keyframes = sum(client.keyframes for client in self.clients)
+        return (f"{len(self.rooms)} oda, {clients} istemci, {ticks} tik: "
+                f"tik başına serileştirme {encode / max(ticks, 1) * 1e6:.1f} µs, "
+                f"ortalama delta {delta_bytes / max(ticks, 1):.1f} B, "
+                f"istemci başına {sent / max(clients, 1) / elapsed:.0f} B/s, "
+                f"{lagging} geride, {keyframes} anahtar kare")
+
+    async def report_forever(self):
+        while True:
+            await asyncio.sleep(REPORT_INTERVAL)
+            print(self.report(), flush=True)
+
+
+class RemoteGame:
+    # İstemci tarafındaki oyun durumu: anlık görüntüden kurulur, deltalarla güncellenir.
+    # Çizim için GameCore'un kullanılan alanlarını ve özelliklerini taklit eder.
+    def __init__(self):
+        self.cell_number = 0
+        self.ticks = 0
+        self.game_over = True
+
+    def load(self, state):
+        self.cell_number = n = state.cell_number
+        self.grid = bytearray(state.grid)
+        self.body_count = array('H')
+        self.body_count.frombytes(state.body_counts)
+        self.snake_body = deque(state.body)
+        self.direction = state.direction
+        self.obstacles = dict.fromkeys(divmod(cell, n)[::-1] for cell in state.obstacles)
+        self.fruit_pos = self.cell_pos(state.fruit_cell) if state.fruit_cell >= 0 else None
+        self.power_up_pos = self.cell_pos(state.power_up_cell) if state.power_up_cell >= 0 else None
+        self.power_up_type = state.power_up_type
+        self.score = state.score
+        self.level = state.level
+        self.fruits_eaten = state.fruits_eaten
+        self.active_power_up = state.active_power_up
+        self.power_up_effect_start = state.power_up_effect_start
+        self.ticks = state.ticks
+        self.time_ms = state.time_ms
+        self.game_over = state.game_over
+        self.won = state.won
+        self.death_cause = state.death_cause
+
+    def cell_pos(self, index):
+        y, x = divmod(index, self.cell_number)
+        return x, y
+
+    def cell_index(self, pos):
+        return pos[1] * self.cell_number + pos[0]
+
+    @property
+    def head_pos(self):
+        return self.cell_pos(self.snake_body[0])
+
+    @property
+    def power_up_remaining_ms(self):
+        if self.active_power_up is None:
+            return 0
+        return max(0, POWER_UP_EFFECT_DURATION - (self.time_ms - self.power_up_effect_start))
+
+    def apply(self, message):
+        # Çekirdekteki adım sırasıyla: kuyruk, baş, engeller, meyve, güçlendirme, durum
+        _, self.ticks, self.time_ms, head, self.direction, flags = DELTA.unpack_from(message)
+        grid, body_count = self.grid, self.body_count
+        offset = DELTA.size
+        if flags & TAIL_REMOVED:
+            (tail,) = CELL.unpack_from(message, offset)
+            offset += CELL.size
+            self.snake_body.pop()
+            body_count[tail] -= 1
+            if not body_count[tail] and grid[tail] == BODY:
+                grid[tail] = EMPTY
+        if head != NO_HEAD:
+            self.snake_body.appendleft(head)
+            body_count[head] += 1
+            if grid[head] != OBSTACLE:
+                grid[head] = BODY
+
+        removed = added = ()
+        if flags & FRUIT_MOVED:
+            (fruit,) = FRUIT_CELL.unpack_from(message, offset)
+            offset += FRUIT_CELL.size
+        if flags & POWER_UP_CHANGED:
+            power_up, power_type = POWER_UP_CELL.unpack_from(message, offset)
+            offset += POWER_UP_CELL.size
+        if flags & STATUS_CHANGED:
+            (self.score, self.level, self.fruits_eaten, active,
+             self.power_up_effect_start) = STATUS.unpack_from(message, offset)
+            self.active_power_up = POWER_UP_TYPES[active] if active >= 0 else None
+            offset += STATUS.size
+        if flags & OBSTACLES_REMOVED:
+            removed, offset = self.read_cells(message, offset)
+        if flags & OBSTACLES_ADDED:
+            added, offset = self.read_cells(message, offset)
+        if flags & GAME_ENDED:
+            won, cause = GAME_OVER.unpack_from(message, offset)
+            self.game_over = True
+            self.won = bool(won)
+            self.death_cause = GameState.DEATH_CAUSES[cause]
+
+        for cell in removed:
+            del self.obstacles[self.cell_pos(cell)]
+            grid[cell] = BODY if body_count[cell] else EMPTY
+        for cell in added:
+            self.obstacles[self.cell_pos(cell)] = None
+            grid[cell] = OBSTACLE
+        if flags & FRUIT_MOVED:
+            if self.fruit_pos is not None and grid[self.cell_index(self.fruit_pos)] == FRUIT:
+                grid[self.cell_index(self.fruit_pos)] = EMPTY
+            self.fruit_pos = self.cell_pos(fruit) if fruit >= 0 else None
+            if fruit >= 0:
+                grid[fruit] = FRUIT
+        if flags & POWER_UP_CHANGED:
+            if self.power_up_pos is not None and grid[self.cell_index(self.power_up_pos)] == POWER_UP:
+                grid[self.cell_index(self.power_up_pos)] = EMPTY
+            self.power_up_pos = self.cell_pos(power_up) if power_up >= 0 else None
+            self.power_up_type = POWER_UP_TYPES[power_type]
+            if power_up >= 0:
+                grid[power_up] = POWER_UP
+
+    @staticmethod
+    def read_cells(message, offset):
+        (count,) = COUNT.unpack_from(message, offset)
+        offset += COUNT.size
+        cells = array('I')
+        cells.frombytes(message[offset:offset + 4 * count])
+        return cells, offset + 4 * count
+
+
+def receive(game, message):
+    # Sunucu iletisini istemci durumuna uygula
+    if message[:1] == b"S":
+        game.load(GameState.from_bytes(message[1:]))
+    elif message[:1] == b"T":
+        game.apply(message)
+
+
+async def headless_client(host, port, room_id, role, seed, stop):
+    # Penceresiz istemci: durumu deltalardan kurar, oyuncuysa ara sıra rastgele döner
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(frame(JOIN.pack(b"J", room_id, role)))
+    game = RemoteGame()
+    rng = GameRandom(seed).split("input")
+    try:
+        while not stop.is_set():
+            try:
+                message = await asyncio.wait_for(read_frame(reader), 0.5)
+            except asyncio.TimeoutError:
+                continue
+            receive(game, message)
+            if role == PLAYER and message[:1] == b"T" and rng.random() < 0.2:
+                writer.write(frame(INPUT.pack(b"D", rng.randrange(4))))
+    finally:
+        writer.close()
+    return game
+
+
+async def run_test(num_rooms, clients_per_room, seconds, port=PORT + 1):
+    # Yerel sunucu + penceresiz istemciler; sonunda her istemcinin durumu sunucuyla karşılaştırılır
+    server = Server(seed=0)
+    await server.start(port=port)
+    stop = asyncio.Event()
+    tasks = [asyncio.create_task(headless_client("127.0.0.1", port, room,
+                                                 PLAYER if i == 0 else SPECTATOR, room * 100 + i, stop))
+             for room in range(num_rooms) for i in range(clients_per_room)]
+    await asyncio.sleep(seconds)
+    server.paused = True
+    await asyncio.sleep(0.5)  # Yoldaki deltalar istemcilere ulaşsın
+    report = server.report()
+    stop.set()
+    games = await asyncio.gather(*tasks)
+
+    mismatches = 0
+    for index, game in enumerate(games):
+        core = server.rooms[index // clients_per_room].core
+        if (game.ticks != core.ticks or tuple(game.snake_body) != tuple(core.snake_body)
+                or bytes(game.grid) != bytes(core.grid) or game.score != core.score
+                or game.fruit_pos != core.fruit_pos or set(game.obstacles) != set(core.obstacles)):
+            mismatches += 1
+    print(report)
+    print(f"{len(games)} istemci, {mismatches} uyuşmazlık")
+    server.server.close()
+
+
+async def fake_spectator(host, port, room_id, slow, stop, counts):
+    # Yük testi izleyicisi: iletileri çözmeden sayar. Yavaş olanlar küçük alma tamponuyla
+    # bağlanır ve düzenli aralıklarla okumayı tamamen durdurur.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if slow:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SLOW_RECEIVE_BUFFER)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, (host, port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    writer.write(frame(JOIN.pack(b"J", room_id, SPECTATOR)))
+    loop = asyncio.get_running_loop()
+    stall_at = loop.time() + SLOW_READ_SECONDS
+    try:
+        while not stop.is_set():
+            if slow and loop.time() >= stall_at:
+                writer.transport.pause_reading()
+                await asyncio.sleep(SLOW_STALL_SECONDS)
+                writer.transport.resume_reading()
+                stall_at = loop.time() + SLOW_READ_SECONDS
+            try:
+                message = await asyncio.wait_for(read_frame(reader), 0.5)
+            except asyncio.TimeoutError:
+                continue
+            counts["frames"] += 1
+            counts["bytes"] += LENGTH.size + len(message)
+            if message[:1] == b"S":
+                counts["slow_snapshots" if slow else "snapshots"] += 1
+    except (asyncio.IncompleteReadError, ConnectionError):
+        counts["errors"] += 1
+    finally:
+        writer.close()
+
+
+async def run_spectators(host, port, room_id, count, seconds, slow_fraction):
+    # Yük testinin alt süreci: count izleyici açar, süre sonunda sayaçları JSON olarak yazar
+    stop = asyncio.Event()
+    counts = dict.fromkeys(("frames", "bytes", "snapshots", "slow_snapshots", "errors"), 0)
+    slow_count = int(count * slow_fraction)
+    tasks = [asyncio.create_task(fake_spectator(host, port, room_id, i < slow_count, stop, counts))
+             for i in range(count)]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    counts["slow"] = slow_count
+    print(json.dumps(counts), flush=True)
+
+
+async def run_load(spectators, seconds, slow_fraction, port=PORT + 2):
+    # Tek odaya çok sayıda izleyici: yayın hızı, tik başına yayın süresi ve bağlantı başına
+    # sunucu belleği. İzleyiciler ayrı süreçte çalışır, böylece bellek ölçümüne karışmazlar.
+    tracemalloc.start()
+    server = Server(seed=0, high_water=LOAD_HIGH_WATER, low_water=LOAD_LOW_WATER,
+                    send_buffer=LOAD_SEND_BUFFER, time_scale=LOAD_TIME_SCALE)
+    await server.start(port=port, backlog=spectators + 1)
+    stop = asyncio.Event()
+    # Oyuncu rastgele döner; odanın oyunu izleyicilerden bağımsız sürer
+    player = asyncio.create_task(headless_client("127.0.0.1", port, 0, PLAYER, 0, stop))
+    while not server.clients:
+        await asyncio.sleep(0.05)
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    connect_seconds = 5.0
+    child = await asyncio.create_subprocess_exec(
+        sys.executable, __file__, "spectators", "127.0.0.1", str(port), "0", str(spectators),
+        str(seconds + connect_seconds), str(slow_fraction), stdout=asyncio.subprocess.PIPE)
+    deadline = time.perf_counter() + connect_seconds
+    while len(server.clients) < spectators + 1 and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+    connected = len(server.clients) - 1
+    memory = (tracemalloc.get_traced_memory()[0] - baseline) / max(connected, 1)
+    tracemalloc.stop()
+    await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+
+    room = server.rooms[0]
+    frames = sum(client.frames_sent for client in server.clients)
+    sent = sum(client.bytes_sent for client in server.clients)
+    ticks, broadcast = room.ticks, room.broadcast_seconds
+    start = time.perf_counter()
+    await asyncio.sleep(seconds)
+    elapsed = time.perf_counter() - start
+    frames = sum(client.frames_sent for client in server.clients) - frames
+    sent = sum(client.bytes_sent for client in server.clients) - sent
+    ticks, broadcast = room.ticks - ticks, room.broadcast_seconds - broadcast
+    report = server.report()
+
+    counts = json.loads((await child.communicate())[0])
+    stop.set()
+    await player
+    await asyncio.sleep(0.1)  # Sunucu tarafı bağlantılar kapansın
+    server.server.close()
+    print(report)
+    print(f"{connected} izleyici ({counts['slow']} yavaş), {ticks / elapsed:.0f} tik/s: "
+          f"{frames / elapsed:.0f} çerçeve/s, {sent / elapsed / 1024:.0f} KiB/s yayın, "
+          f"tik başına yayın {broadcast / max(ticks, 1) * 1e6:.0f} µs, "
+          f"bağlantı başına sunucu belleği {memory / 1024:.1f} KiB")
+    print(f"izleyiciler {counts['frames']} çerçeve, {counts['bytes'] / 1024:.0f} KiB aldı; "
+          f"yavaş izleyicilere {counts['slow_snapshots']} anahtar kare, "
+          f"{counts['errors']} kopan bağlantı")
+
+
+async def run_server(port):
+    server = Server()
+    await server.start("0.0.0.0", port)
+    print(f"Sunucu {port} portunda")
+    await server.report_forever()
+
+
+async def run_client(host, port, room_id):
+    # pygame istemcisi: yerel oyunun çizim katmanı, tikler sunucudan gelir
+    from yılanOyunu import Game, Camera, POWER_UP_COLORS, FPS
+
+    class NetworkGame(Game):
+        def update(self):
+            # Oyun sunucuda ilerler
+            pass
+
+        def reset_game(self, autopilot=False):
+            pass
+
+        def save_high_score(self):
+            # Ağ oyunlarının kaydı yerelde yok; rekor dosyasına yazılmaz
+            pass
+
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(frame(JOIN.pack(b"J", room_id, PLAYER)))
+    game = NetworkGame()
+    game.core = RemoteGame()
+    game.in_menu = False
+
+    def handle(message):
+        previous_power_up = getattr(game.core, "active_power_up", None)
+        receive(game.core, message)
+        if message[:1] == b"S":
+            if game.camera.board_size != game.core.cell_number:
+                game.camera = Camera(game.core.cell_number)
+            game.game_active = True
+        elif game.core.game_over:
+            game.game_active = False
+        if game.core.active_power_up != previous_power_up:
+            if game.core.active_power_up is None:
+                game.snake.restore_original_color()
+            else:
+                game.snake.change_color(POWER_UP_COLORS[game.core.active_power_up])
+
+    async def receive_forever():
+        while True:
+            handle(await read_frame(reader))
+
+    # Çizime ilk anlık görüntü geldikten sonra başlanır
+    handle(await read_frame(reader))
+    receiver = asyncio.create_task(receive_forever())
+    while game.running and not receiver.done():
+        game.handle_events()
+        if game.in_menu:  # ESC: çıkış
+            break
+        if game.next_direction is not None:
+            writer.write(frame(INPUT.pack(b"D", game.next_direction)))
+            game.next_direction = None
+        game.draw()
+        await asyncio.sleep(1 / FPS)
+    receiver.cancel()
+    writer.close()
+
+
+if __name__ == "__main__":
+    mode = sys.argv[1] if len(sys.argv) > 1 else "test"
+    args = sys.argv[2:]
+    if mode == "server":
+        asyncio.run(run_server(int(args[0]) if args else PORT))
+    elif mode == "client":
+        asyncio.run(run_client(args[0] if args else "127.0.0.1",
+                               int(args[1]) if len(args) > 1 else PORT,
+                               int(args[2]) if len(args) > 2 else 0))
+    elif mode == "load":
+        asyncio.run(run_load(int(args[0]) if args else 500,
+                             float(args[1]) if len(args) > 1 else 10.0,
+                             float(args[2]) if len(args) > 2 else 0.1))
+    elif mode == "spectators":
+        asyncio.run(run_spectators(args[0], int(args[1]), int(args[2]), int(args[3]),
+                                   float(args[4]), float(args[5])))
+    else:
+        asyncio.run(run_test(int(args[0]) if args else 24,
+                             int(args[1]) if len(args) > 1 else 3,
+                             float(args[2]) if len(args) > 2 else 5.0))
@@ -0,0 +1,222 @@
+# Oyun kayıtları: seed + tik başına 2 bitlik yön kodu.
+# Her tikten sonra yılanın gerçek yönü saklanır; ters yön girişleri zaten yok
+# sayıldığı için bu, oyunu yeniden üretmek için yeterlidir ve "değişiklik yok"
+# için ayrı bir koda gerek kalmaz. Oynatma zamanlayıcı kullanmadan GameCore'u
+# CPU'nun izin verdiği hızda ilerletir; yüksek skor denetimi ve hata raporlarını
+# yeniden üretmek için kullanılır.
+#
+# Dosya yapısı (little-endian):
+#   başlık: MAGIC, sürüm (B), CELL_NUMBER (H), level_up_threshold (H),
+#           seed (Q), tik sayısı (I), skor (I), hız sayısı (B), hızlar (B * hız sayısı)
+#   gövde:  tik başına 2 bit yön, bayt başına 4 tik
+#
+# Uzun oturumlar için aranabilir kayıt (SeekableReplayWriter / SeekableReplay):
+#   başlık: SEEKABLE_MAGIC, sürüm, CELL_NUMBER, level_up_threshold, seed, tik sayısı,
+#           skor, anahtar kare aralığı K (I), hız sayısı, hızlar
+#   parçalar: [durum uzunluğu (I)][GameState.to_bytes][K tiklik yön baytları] ...
+#   dizin:  parça başına dosya ofseti (Q)
+#   son:    dizin ofseti (Q), parça sayısı (I), SEEKABLE_MAGIC
+# Dosya mmap ile açılır; herhangi bir tike atlamak bir anahtar kare yükleyip en fazla K tik
+# ilerlemek demektir ve bellek kullanımı kaydın uzunluğundan bağımsızdır.
+import mmap
+import struct
+import sys
+import time
+
+from snake_core import GameCore, GameState
+
+MAGIC = b"YLNR"
+VERSION = 1
+HEADER = struct.Struct("<4sBHHQIIB")
+
+SEEKABLE_MAGIC = b"YLNS"
+SEEKABLE_HEADER = struct.Struct("<4sBHHQIIIB")
+FOOTER = struct.Struct("<QI4s")
+STATE_LENGTH = struct.Struct("<I")
+
+
+class ReplayRecorder:
+    def __init__(self, core):
+        self.cell_number = core.cell_number
+        self.snake_speeds = core.snake_speeds
+        self.level_up_threshold = core.level_up_threshold
+        self.seed = core.seed
+        self.ticks = 0
+        self.moves = bytearray()
+
+    def record(self, direction):
+        # Her GameCore.step çağrısından sonra yılanın yönüyle çağrılır
+        if self.ticks & 3 == 0:
+            self.moves.append(0)
+        self.moves[-1] |= direction << ((self.ticks & 3) * 2)
+        self.ticks += 1
+
+    def to_replay(self, score):
+        return Replay(self.seed, self.cell_number, self.snake_speeds,
+                      self.level_up_threshold, self.ticks, score, bytes(self.moves))
+
+
+class Replay:
+    def __init__(self, seed, cell_number, snake_speeds, level_up_threshold, ticks, score, moves):
+        self.seed = seed
+        self.cell_number = cell_number
+        self.snake_speeds = tuple(snake_speeds)
+        self.level_up_threshold = level_up_threshold
+        self.ticks = ticks
+        self.score = score
+        self.moves = moves
+
+    def directions(self):
+        moves = self.moves
+        for tick in range(self.ticks):
+            yield (moves[tick >> 2] >> ((tick & 3) * 2)) & 3
+
+    def to_bytes(self):
+        header = HEADER.pack(MAGIC, VERSION, self.cell_number, self.level_up_threshold,
+                             self.seed, self.ticks, self.score, len(self.snake_speeds))
+        return header + bytes(self.snake_speeds) + self.moves
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, cell_number, threshold, seed, ticks, score, speed_count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Geçersiz kayıt dosyası")
+        if version != VERSION:
+            raise ValueError(f"Desteklenmeyen kayıt sürümü: {version}")
+        offset = HEADER.size
+        speeds = tuple(data[offset:offset + speed_count])
+        offset += speed_count
+        moves = bytes(data[offset:offset + (ticks + 3) // 4])
+        return cls(seed, cell_number, speeds, threshold, ticks, score, moves)
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def play(replay):
+    # Kaydı zamanlayıcı olmadan baştan sona yeniden simüle eder ve son durumu döndürür
+    core = GameCore(replay.cell_number, seed=replay.seed, snake_speeds=replay.snake_speeds,
+                    level_up_threshold=replay.level_up_threshold)
+    step = core.step
+    for direction in replay.directions():
+        step(direction)
+    return core
+
+
+def verify(replay):
+    # Kaydedilen skor yeniden simülasyonla aynı mı
+    return play(replay).score == replay.score
+
+
+class SeekableReplayWriter:
+    def __init__(self, path, core, keyframe_interval=1024):
+        if keyframe_interval % 4:
+            raise ValueError("Anahtar kare aralığı 4'ün katı olmalı")
+        self.core = core
+        self.keyframe_interval = keyframe_interval
+        self.ticks = 0
+        self.moves = bytearray()
+        self.offsets = []
+        self.file = open(path, "wb")
+        self.file.write(self.header(0, 0))
+        self.write_keyframe()
+
+    def header(self, ticks, score):
+        core = self.core
+        return SEEKABLE_HEADER.pack(SEEKABLE_MAGIC, VERSION, core.cell_number,
+                                    core.level_up_threshold, core.seed, ticks, score,
+                                    self.keyframe_interval, len(core.snake_speeds)) + bytes(core.snake_speeds)
+
+    def write_keyframe(self):
+        self.offsets.append(self.file.tell())
+        state = self.core.snapshot().to_bytes()
+        self.file.write(STATE_LENGTH.pack(len(state)))
+        self.file.write(state)
+
+    def record(self, direction):
+        # Her GameCore.step çağrısından sonra yılanın yönüyle çağrılır
+        if self.ticks & 3 == 0:
+            self.moves.append(0)
+        self.moves[-1] |= direction << ((self.ticks & 3) * 2)
+        self.ticks += 1
+        # Parça doldu: yönleri yaz ve sıradaki tikin durumunu anahtar kare olarak ekle
+        if self.ticks % self.keyframe_interval == 0:
+            self.file.write(self.moves)
+            self.moves.clear()
+            self.write_keyframe()
+
+    def close(self):
+        self.file.write(self.moves)
+        index_offset = self.file.tell()
+        self.file.write(struct.pack(f"<{len(self.offsets)}Q", *self.offsets))
+        self.file.write(FOOTER.pack(index_offset, len(self.offsets), SEEKABLE_MAGIC))
+        # Başlıktaki tik sayısını ve skoru güncelle
+        self.file.seek(0)
+        self.file.write(self.header(self.ticks, self.core.score))
+        self.file.close()
+
+
+class SeekableReplay:
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.cell_number, self.level_up_threshold, self.seed, self.ticks,
+         self.score, self.keyframe_interval, speed_count) = SEEKABLE_HEADER.unpack_from(self.data)
+        if magic != SEEKABLE_MAGIC:
+            raise ValueError("Geçersiz kayıt dosyası")
+        if version != VERSION:
+            raise ValueError(f"Desteklenmeyen kayıt sürümü: {version}")
+        self.snake_speeds = tuple(self.data[SEEKABLE_HEADER.size:SEEKABLE_HEADER.size + speed_count])
+        self.index_offset, self.chunks, magic = FOOTER.unpack_from(self.data, len(self.data) - FOOTER.size)
+        if magic != SEEKABLE_MAGIC:
+            raise ValueError("Kayıt dizini eksik (dosya kapatılmamış olabilir)")
+
+    def close(self):
+        self.data.close()
+
+    def state_at(self, tick):
+        # tick kadar adım atılmış oyunun durumu: bir anahtar kare + en fazla K tik
+        tick = max(0, min(tick, self.ticks))
+        chunk = min(tick // self.keyframe_interval, self.chunks - 1)
+        # Dizin kopyalanmadan doğrudan eşlenmiş bellekten okunur
+        (offset,) = struct.unpack_from("<Q", self.data, self.index_offset + 8 * chunk)
+        (length,) = STATE_LENGTH.unpack_from(self.data, offset)
+        offset += STATE_LENGTH.size
+        core = GameCore(self.cell_number, seed=self.seed, snake_speeds=self.snake_speeds,
+                        level_up_threshold=self.level_up_threshold)
+        core.restore(GameState.from_bytes(self.data[offset:offset + length]))
+
+        moves = offset + length
+        for i in range(tick - chunk * self.keyframe_interval):
+            core.step((self.data[moves + (i >> 2)] >> ((i & 3) * 2)) & 3)
+        return core
+
+
+# Kayıt denetimi: python replay.py high_score.replay [tik]
+if __name__ == "__main__":
+    with open(sys.argv[1], "rb") as file:
+        seekable = file.read(len(SEEKABLE_MAGIC)) == SEEKABLE_MAGIC
+    if seekable:
+        replay = SeekableReplay(sys.argv[1])
+        tick = int(sys.argv[2]) if len(sys.argv) > 2 else replay.ticks
+        start = time.perf_counter()
+        core = replay.state_at(tick)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Tik {core.ticks}/{replay.ticks}: skor {core.score}, seviye {core.level + 1}, "
+              f"uzunluk {len(core.snake_body)} ({elapsed:.1f} ms)")
+        replay.close()
+        sys.exit()
+
+    replay = Replay.load(sys.argv[1])
+    start = time.perf_counter()
+    core = play(replay)
+    elapsed = (time.perf_counter() - start) * 1000
+    status = "GEÇERLİ" if core.score == replay.score else "GEÇERSİZ"
+    print(f"{status}: kayıtlı skor {replay.score}, yeniden simüle edilen skor {core.score} "
+          f"({replay.ticks} tik, {elapsed:.1f} ms)")
@@ -0,0 +1,377 @@
+# İki oyunculu kafa kafaya mod için geri sarmalı (rollback) ağ kodu.
+# Her istemci kendi yılanının girdisini hemen uygular, rakibin girdisini tahmin eder
+# (tahmin: rakip dönmez) ve beklemeden ilerler. Rakibin girdisi geç geldiğinde ve tahmin
+# yanlışsa o tikin kayıtlı durumuna dönülür ve kaçırılan tikler gerçek girdilerle yeniden
+# oynanır. Her iki istemci aynı seed ve aynı girdilerle birebir aynı maçı üretir.
+#
+# Durumlar tik başına sıkıştırılmış bayt dizisi olarak sabit boyutlu bir halka tamponda
+# tutulur (ızgara kaydedilmez, gövdelerden yeniden kurulur). Kayıt sabit boyutlu değildir:
+# STATE_BASE_SIZE bayta gövde hücresi başına 4 bayt eklenir, yılanlar uzadıkça büyür.
+# Rakip MAX_ROLLBACK tikten fazla geride kalırsa istemci ilerlemez, bekler.
+#
+# DuelCore, snake_core.GameCore kurallarının iki yılanlı ayrı bir çatalıdır; GameCore'u
+# kullanmaz. Ters yöne dönüşün yok sayılması, önce kuyruğun boşalması, duvar ve gövde
+# çarpışması ile meyvede +1 boy ve +10 skor GameCore'dan kopyalanmıştır. Seviyeler,
+# engeller, güçlendirmeler ve seviyeye göre hız yoktur; tik süresi sabittir. GameCore'daki
+# bu ortak kurallar değişirse DuelCore elle güncellenmelidir.
+#
+# Yerel deneme, yapay gecikmeli bir geri döngü (loopback) bağlantısı üzerinden:
+#   python rollback.py [tek yön gecikme ms] [sapma ms] [maç sayısı]
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+
+from snake_core import GameRandom, CELL_NUMBER, MIN_CELL_NUMBER, DIRECTIONS, RIGHT, LEFT, EMPTY, BODY, FRUIT
+
+DUEL_TICK_MS = 50  # Kafa kafaya maçlar hızlıdır: saniyede 20 tik
+MAX_TICKS = 3000  # Bir maç en fazla bu kadar sürer, sonra daha yüksek skor kazanır
+MAX_ROLLBACK = 8  # En fazla bu kadar tik geri sarılır; rakip daha gerideyse beklenir
+RING_SIZE = 2 * (MAX_ROLLBACK + 1)  # Rakip de en fazla MAX_ROLLBACK tik önde olabilir
+FRUIT_SCORE = 10
+START_LENGTH = 3
+
+DRAW = 2  # winner alanında berabere; -1 maç sürüyor
+
+# Anlık görüntü: tik, meyve üreteci, meyve hücresi, oyun bitti, kazanan; her yılan için
+# yön, canlı, büyüme, skor, boy ve ardından gövde hücreleri (I...)
+DUEL_HEADER = struct.Struct("<IQiBb")
+SNAKE_HEADER = struct.Struct("<BBHIH")
+STATE_BASE_SIZE = DUEL_HEADER.size + 2 * SNAKE_HEADER.size
+INPUT = struct.Struct("<Ib")  # Tik, yön (-1 = dönüş yok)
+
+
+class DuelCore:
+    # GameCore'un iki yılanlı çatalı (bkz. modül açıklaması): iki yılan, tek meyve, aynı tahta. İki yılan aynı anda hareket eder: önce kuyruklar
+    # boşalır, sonra başlar ilerler. Duvara veya bir gövdeye çarpan ya da rakibiyle aynı
+    # hücreye giren yılan ölür; bir yılan ölünce maç biter.
+    def __init__(self, cell_number=CELL_NUMBER, seed=None):
+        if cell_number < MIN_CELL_NUMBER:
+            raise ValueError(f"Tahta en az {MIN_CELL_NUMBER}x{MIN_CELL_NUMBER} olmalı")
+        self.cell_number = cell_number
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        rng = GameRandom(seed)
+        self.seed = rng.seed
+        self.fruit_rng = rng.split("fruit")
+        n = self.cell_number
+        self.grid = bytearray(n * n)
+        # Yılanlar karşılıklı kenarlardan, farklı satırlarda birbirine doğru başlar
+        row_0, row_1 = n // 3, n - 1 - n // 3
+        self.bodies = [deque(row_0 * n + START_LENGTH - 1 - i for i in range(START_LENGTH)),
+                       deque(row_1 * n + n - START_LENGTH + i for i in range(START_LENGTH))]
+        self.directions = [RIGHT, LEFT]
+        self.pending_growth = [0, 0]
+        self.scores = [0, 0]
+        self.alive = [True, True]
+        for body in self.bodies:
+            for index in body:
+                self.grid[index] = BODY
+        self.ticks = 0
+        self.game_over = False
+        self.winner = -1
+        self.fruit = -1
+        self.place_fruit()
+
+    def place_fruit(self):
+        # Tahta çoğunlukla boştur; birkaç rastgele deneme yeter, olmazsa sırayla aranır
+        grid = self.grid
+        for _ in range(32):
+            index = self.fruit_rng.randrange(len(grid))
+            if grid[index] == EMPTY:
+                break
+        else:
+            index = grid.find(EMPTY)
+        self.fruit = index
+        if index >= 0:
+            grid[index] = FRUIT
+
+    def step(self, actions):
+        # actions: iki oyuncunun yön kodları (None = dönüş yok)
+        if self.game_over:
+            return False
+        self.ticks += 1
+        n = self.cell_number
+        grid = self.grid
+
+        heads = []
+        for player in (0, 1):
+            action = actions[player]
+            if action is not None and action != (self.directions[player] + 2) % 4:
+                self.directions[player] = action
+            dx, dy = DIRECTIONS[self.directions[player]]
+            head_y, head_x = divmod(self.bodies[player][0], n)
+            x, y = head_x + dx, head_y + dy
+            heads.append(y * n + x if 0 <= x < n and 0 <= y < n else -1)
+
+        # Kuyruklar önce boşalır, böylece baş bir kuyruğun az önce bıraktığı hücreye girebilir
+        for player in (0, 1):
+            if self.pending_growth[player]:
+                self.pending_growth[player] -= 1
+            else:
+                grid[self.bodies[player].pop()] = EMPTY
+
+        for player in (0, 1):
+            head = heads[player]
+            if head < 0 or grid[head] == BODY or head == heads[1 - player]:
+                self.alive[player] = False
+
+        ate = False
+        for player in (0, 1):
+            if not self.alive[player]:
+                continue
+            head = heads[player]
+            if grid[head] == FRUIT:
+                self.pending_growth[player] += 1
+                self.scores[player] += FRUIT_SCORE
+                ate = True
+            grid[head] = BODY
+            self.bodies[player].appendleft(head)
+        if ate:
+            self.place_fruit()
+
+        if not (self.alive[0] and self.alive[1]):
+            self.game_over = True
+            self.winner = 0 if self.alive[0] else 1 if self.alive[1] else DRAW
+        elif self.ticks >= MAX_TICKS:
+            self.game_over = True
+            self.winner = DRAW if self.scores[0] == self.scores[1] else int(self.scores[1] > self.scores[0])
+        return not self.game_over
+
+    def snapshot(self):
+        parts = [DUEL_HEADER.pack(self.ticks, self.fruit_rng.state, self.fruit, self.game_over,
+                                  self.winner)]
+        for player in (0, 1):
+            body = self.bodies[player]
+            parts.append(SNAKE_HEADER.pack(self.directions[player], self.alive[player],
+                                           self.pending_growth[player], self.scores[player], len(body)))
+            parts.append(array('I', body).tobytes())
+        return b"".join(parts)
+
+    def restore(self, data):
+        (self.ticks, self.fruit_rng.state, self.fruit, game_over,
+         self.winner) = DUEL_HEADER.unpack_from(data)
+        self.game_over = bool(game_over)
+        offset = DUEL_HEADER.size
+        grid = self.grid = bytearray(self.cell_number * self.cell_number)
+        for player in (0, 1):
+            (self.directions[player], alive, self.pending_growth[player], self.scores[player],
+             length) = SNAKE_HEADER.unpack_from(data, offset)
+            self.alive[player] = bool(alive)
+            offset += SNAKE_HEADER.size
+            body = array('I')
+            body.frombytes(data[offset:offset + 4 * length])
+            offset += 4 * length
+            self.bodies[player] = deque(body)
+            for index in body:
+                grid[index] = BODY
+        if self.fruit >= 0:
+            grid[self.fruit] = FRUIT
+
+
+class LoopbackTransport:
+    # Aynı süreçteki iki uç arasında yapay gecikmeli bağlantı. Saat dışarıdan verilir (ms);
+    # sapma iletilerin sırasını bozmaz, TCP gibi sıralı teslim edilir.
+    def __init__(self, clock, latency_ms, jitter_ms=0, seed=None):
+        self.clock = clock
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rng = GameRandom(seed).split("jitter")
+        self.inbox = deque()
+        self.peer = None
+        self.last_delivery = 0
+
+    @classmethod
+    def pair(cls, clock, latency_ms, jitter_ms=0, seed=None):
+        a = cls(clock, latency_ms, jitter_ms, seed)
+        b = cls(clock, latency_ms, jitter_ms, None if seed is None else seed + 1)
+        a.peer, b.peer = b, a
+        return a, b
+
+    def send(self, data):
+        delivery = self.clock() + self.latency_ms + self.rng.random() * self.jitter_ms
+        self.last_delivery = max(self.last_delivery, delivery)
+        self.peer.inbox.append((self.last_delivery, data))
+
+    def receive(self):
+        now = self.clock()
+        inbox = self.inbox
+        while inbox and inbox[0][0] <= now:
+            yield inbox.popleft()[1]
+
+
+class RollbackSession:
+    # Bir oyuncunun görüşü: yerel girdi hemen uygulanır, rakibinki tahmin edilir
+    def __init__(self, duel, player, transport):
+        self.duel = duel
+        self.player = player
+        self.transport = transport
+        self.tick = 0  # Sıradaki simüle edilecek tik
+        self.confirmed = -1  # Rakip girdisinin bilindiği son tik
+        self.states = [None] * RING_SIZE  # Tik t simüle edilmeden önceki durum
+        self.local_inputs = [None] * RING_SIZE
+        self.remote_inputs = [None] * RING_SIZE  # Tahmin veya gerçek rakip girdisi
+        self.pending = []  # Rakibin önden gönderdiği (henüz simüle edilmemiş tikler için) girdiler
+
+        # İstatistikler
+        self.rollbacks = 0
+        self.resimulated = 0
+        self.stalls = 0
+        self.rollback_seconds = 0.0
+        self.worst_rollback = 0.0
+
+    def inputs(self, tick):
+        index = tick % RING_SIZE
+        if self.player == 0:
+            return self.local_inputs[index], self.remote_inputs[index]
+        return self.remote_inputs[index], self.local_inputs[index]
+
+    def poll(self):
+        # Gelen rakip girdilerini işle; yanlış tahmin edilen en eski tikten geri sar
+        rollback_from = None
+        for message in self.transport.receive():
+            tick, direction = INPUT.unpack(message)
+            direction = None if direction < 0 else direction
+            self.confirmed = tick
+            if tick >= self.tick:
+                self.pending.append((tick, direction))
+                continue
+            index = tick % RING_SIZE
+            if self.remote_inputs[index] != direction:
+                self.remote_inputs[index] = direction
+                if rollback_from is None:
+                    rollback_from = tick
+        if rollback_from is not None:
+            self.rollback(rollback_from)
+
+    def rollback(self, tick):
+        start = time.perf_counter()
+        duel = self.duel
+        duel.restore(self.states[tick % RING_SIZE])
+        duel.step(self.inputs(tick))
+        for resimulated in range(tick + 1, self.tick):
+            self.states[resimulated % RING_SIZE] = duel.snapshot()
+            duel.step(self.inputs(resimulated))
+        elapsed = time.perf_counter() - start
+        self.rollbacks += 1
+        self.resimulated += self.tick - tick
+        self.rollback_seconds += elapsed
+        self.worst_rollback = max(self.worst_rollback, elapsed)
+
+    def advance(self, local_input):
+        # Bir tik ilerle; rakip çok gerideyse bekle ve False döndür
+        self.poll()
+        tick = self.tick
+        if tick - self.confirmed > MAX_ROLLBACK:
+            self.stalls += 1
+            return False
+        index = tick % RING_SIZE
+        self.local_inputs[index] = local_input
+        self.remote_inputs[index] = None  # Tahmin: rakip dönmez
+        for pending_tick, direction in self.pending:
+            if pending_tick == tick:
+                self.remote_inputs[index] = direction
+        self.pending = [item for item in self.pending if item[0] > tick]
+        self.transport.send(INPUT.pack(tick, -1 if local_input is None else local_input))
+        self.states[index] = self.duel.snapshot()
+        self.duel.step(self.inputs(tick))
+        self.tick = tick + 1
+        return True
+
+
+def greedy(duel, player, rng):
+    # Deneme oyuncusu: meyveye yaklaşan, bir sonraki tikte ölmeyen yönü seçer; ara sıra sapar
+    n = duel.cell_number
+    grid = duel.grid
+    direction = duel.directions[player]
+    head_y, head_x = divmod(duel.bodies[player][0], n)
+    fruit_y, fruit_x = divmod(duel.fruit, n) if duel.fruit >= 0 else (head_y, head_x)
+    options = []
+    for candidate, (dx, dy) in enumerate(DIRECTIONS):
+        x, y = head_x + dx, head_y + dy
+        if candidate == (direction + 2) % 4 or not (0 <= x < n and 0 <= y < n) or grid[y * n + x] == BODY:
+            continue
+        options.append((abs(fruit_x - x) + abs(fruit_y - y), candidate))
+    if not options:
+        return None
+    choice = options[rng.randrange(len(options))] if rng.random() < 0.1 else min(options)
+    return None if choice[1] == direction else choice[1]
+
+
+def play_match(seed, latency_ms, jitter_ms):
+    # İki oturum sanal saatle yan yana ilerler; maç bitince iki taraf ve gecikmesiz tekrar
+    # oynatma aynı son durumu vermelidir
+    now = [0.0]
+    clock = lambda: now[0]
+    transports = LoopbackTransport.pair(clock, latency_ms, jitter_ms, seed)
+    sessions = [RollbackSession(DuelCore(seed=seed), player, transports[player]) for player in (0, 1)]
+    rngs = [GameRandom(seed).split(f"player-{player}") for player in (0, 1)]
+    played = ([], [])
+
+    # Maç, bitiren tikin rakip girdisi de doğrulanınca kesinleşir (tahminle biten maç geri sarılabilir)
+    while not all(session.duel.game_over and session.confirmed >= session.duel.ticks - 1
+                  for session in sessions):
+        for player, session in enumerate(sessions):
+            if session.duel.game_over:
+                session.poll()
+                continue
+            action = greedy(session.duel, player, rngs[player])
+            if session.advance(action):
+                played[player].append(action)
+        now[0] += DUEL_TICK_MS
+
+    reference = DuelCore(seed=seed)
+    for tick in range(min(len(played[0]), len(played[1]))):
+        if not reference.step((played[0][tick], played[1][tick])):
+            break
+    final = reference.snapshot()
+    return sessions, all(session.duel.snapshot() == final for session in sessions)
+
+
+def benchmark(frames=MAX_ROLLBACK, repeats=2000):
+    # Bir geri sarmanın maliyeti: durumu geri yükle ve frames tik yeniden oyna
+    # (maçın bitmeden önceki son frames tiki, kaydedilen girdilerle)
+    duel = DuelCore(seed=0)
+    rng = GameRandom(0).split("bench")
+    history = []
+    while not duel.game_over:
+        actions = (greedy(duel, 0, rng), greedy(duel, 1, rng))
+        history.append((duel.snapshot(), actions))
+        duel.step(actions)
+    state = history[-frames - 1][0]
+    inputs = [actions for _, actions in history[-frames - 1:-1]]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        duel.restore(state)
+        for actions in inputs:
+            duel.snapshot()
+            duel.step(actions)
+    return (time.perf_counter() - start) / repeats, len(state), (len(state) - STATE_BASE_SIZE) // 4
+
+
+if __name__ == "__main__":
+    latency_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+    jitter_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 30.0
+    num_matches = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    per_rollback, state_size, body_cells = benchmark()
+    print(f"{MAX_ROLLBACK} tik geri sarma: {per_rollback * 1e6:.0f} µs "
+          f"(16 ms karenin %{per_rollback / 0.016 * 100:.1f}'i), durum {state_size} B "
+          f"({STATE_BASE_SIZE} B + {body_cells} gövde hücresi x 4 B)")
+
+    desyncs = rollbacks = resimulated = stalls = ticks = 0
+    worst = 0.0
+    for seed in range(num_matches):
+        sessions, synced = play_match(seed, latency_ms, jitter_ms)
+        desyncs += not synced
+        for session in sessions:
+            rollbacks += session.rollbacks
+            resimulated += session.resimulated
+            stalls += session.stalls
+            ticks += session.tick
+            worst = max(worst, session.worst_rollback)
+    print(f"{num_matches} maç, tek yön gecikme {latency_ms:.0f}±{jitter_ms:.0f} ms: "
+          f"{ticks} tik, {rollbacks} geri sarma (ortalama {resimulated / max(rollbacks, 1):.1f} tik), "
+          f"{stalls} bekleme, en kötü geri sarma {worst * 1e3:.2f} ms, {desyncs} uyuşmazlık")
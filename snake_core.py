@@ -0,0 +1,551 @@
+# Yılan oyununun pygame'den bağımsız simülasyon çekirdeği.
+# Pencere, SDL veya zamanlayıcı gerektirmez: reset(seed) ve step(action) ile
+# tik tik ilerler. yılanOyunu.py içindeki Game sınıfı bunun üzerine ince bir
+# çizim ve giriş katmanıdır.
+import hashlib
+import random
+import struct
+from array import array
+from collections import deque
+
+CELL_NUMBER = 30
+MIN_CELL_NUMBER = 20  # Seviye engelleri ve başlangıç yılanı için gereken en küçük tahta
+
+# Yön kodları - 2 bitlik değerler (ters yön = (yön + 2) % 4)
+UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
+DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+POWER_UP_TYPES = ("speed", "invincibility", "slow", "eat_obstacles")
+
+# Doluluk ızgarasındaki hücre tipleri (hücre indeksi = y * cell_number + x)
+EMPTY, BODY, OBSTACLE, FRUIT, POWER_UP = 0, 1, 2, 3, 4
+
+# Oyun kuralları
+SNAKE_SPEEDS = (10, 10, 10, 12, 14, 16, 18, 20, 22, 25)  # Seviye başına hızlar (tik/saniye)
+LEVEL_UP_THRESHOLD = 10  # Seviye atlamak için gereken meyve sayısı
+POWER_UP_EFFECT_DURATION = 10000  # 10 saniye (simülasyon zamanı, ms)
+POWER_UP_SPAWN_INTERVAL = 8000  # Her 8 saniyede bir güçlendirme zarı atılır
+POWER_UP_SPAWN_CHANCE = 0.3  # %30 şans
+POWER_UP_FRUIT_INTERVAL = 4  # Her 4 meyvede bir güçlendirme çıkar
+
+
+MASK64 = (1 << 64) - 1
+
+
+class SplitMix64(random.Random):
+    # Durumu tek bir 64 bitlik tamsayı olan küçük üreteç. randrange, choice, randint gibi
+    # yardımcılar random.Random'dan gelir; oyun anlık görüntüsünde üreteç başına 8 bayt tutar.
+    def seed(self, a=None):
+        if not isinstance(a, int):
+            a = int.from_bytes(hashlib.sha256(str(a).encode()).digest()[:8], "little")
+        self.state = a & MASK64
+
+    def next64(self):
+        self.state = z = (self.state + 0x9E3779B97F4A7C15) & MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def random(self):
+        return (self.next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k):
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self.next64() << shift
+        return bits >> ((-k) % 64)
+
+    def getstate(self):
+        return self.state
+
+    def setstate(self, state):
+        self.state = state
+
+
+class GameRandom:
+    # Oyun başına seed'lenebilir rastgele sayı kaynağı (64 bitlik tamsayı seed). Her alt sistem
+    # (meyve, engeller, güçlendirmeler, menü) split() ile kendi bağımsız akışını alır; böylece
+    # bir sistemin fazladan zar atması diğerlerinin sonuçlarını kaydırmaz.
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed & MASK64
+
+    def split(self, name):
+        # Aynı seed ve isim her zaman aynı akışı verir
+        return SplitMix64(f"{self.seed}/{name}")
+
+
+class GameState:
+    # Oyunun değişmez anlık görüntüsü: GameCore.snapshot() ile alınır, GameCore.restore() ile
+    # geri yüklenir. Hücreler indeks olarak tutulur (y * cell_number + x). Boş hücre listesinin
+    # sırası da durumun parçasıdır, çünkü meyve ve güçlendirme bu listeden rastgele seçilir.
+    # grid, body_counts ve free_slots türetilmiş tablolardır; geri yüklemeyi bellek
+    # kopyasına indirmek için saklanır, to_bytes() bunları yazmaz.
+    __slots__ = (
+        "cell_number", "seed", "rng_states", "direction", "pending_growth",
+        "level", "score", "fruits_eaten", "power_up_spawn_counter",
+        "power_up_type", "active_power_up", "power_up_effect_start",
+        "ticks", "time_ms", "next_power_up_roll", "game_over", "won", "death_cause",
+        "fruit_cell", "power_up_cell", "body", "obstacles", "free_cells",
+        "grid", "body_counts", "free_slots",
+    )
+
+    # İkili biçim (little-endian): sabit alanlar, ardından gövde, engel ve boş hücreler (I)
+    HEADER = struct.Struct("<IQQQQBIIIIIBbQQQQBBbiiIII")
+    DEATH_CAUSES = (None, "wall", "self", "obstacle")
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GameState değiştirilemez")
+
+    def __eq__(self, other):
+        return (isinstance(other, GameState) and
+                all(getattr(self, name) == getattr(other, name) for name in self.__slots__))
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def to_bytes(self):
+        def power_code(power):
+            return POWER_UP_TYPES.index(power) if power is not None else -1
+
+        header = self.HEADER.pack(
+            self.cell_number, self.seed, *self.rng_states, self.direction, self.pending_growth,
+            self.level, self.score, self.fruits_eaten, self.power_up_spawn_counter,
+            POWER_UP_TYPES.index(self.power_up_type), power_code(self.active_power_up),
+            self.power_up_effect_start, self.ticks, self.time_ms, self.next_power_up_roll,
+            self.game_over, self.won, self.DEATH_CAUSES.index(self.death_cause),
+            self.fruit_cell, self.power_up_cell,
+            len(self.body), len(self.obstacles), len(self.free_cells))
+        cells = array('I', self.body)
+        cells.extend(self.obstacles)
+        cells.extend(self.free_cells)
+        return header + cells.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        (cell_number, seed, fruit_state, obstacle_state, power_up_state, direction,
+         pending_growth, level, score, fruits_eaten, power_up_spawn_counter, power_up_type,
+         active_power_up, power_up_effect_start, ticks, time_ms, next_power_up_roll,
+         game_over, won, death_cause, fruit_cell, power_up_cell,
+         body_length, obstacle_count, free_count) = cls.HEADER.unpack_from(data)
+        cells = array('I')
+        start = cls.HEADER.size
+        cells.frombytes(data[start:start + 4 * (body_length + obstacle_count + free_count)])
+        obstacles_end = body_length + obstacle_count
+        body = cells[:body_length]
+        obstacles = cells[body_length:obstacles_end]
+        free_cells = cells[obstacles_end:]
+
+        # Türetilmiş tabloları hücre listelerinden kur
+        size = cell_number * cell_number
+        grid = bytearray(size)
+        body_counts = array('H', bytes(2 * size))
+        for index in body:
+            body_counts[index] += 1
+            grid[index] = BODY
+        for index in obstacles:
+            grid[index] = OBSTACLE
+        if fruit_cell >= 0:
+            grid[fruit_cell] = FRUIT
+        if power_up_cell >= 0:
+            grid[power_up_cell] = POWER_UP
+        free_slots = array('i', [-1]) * size
+        for slot, index in enumerate(free_cells):
+            free_slots[index] = slot
+
+        return cls(
+            cell_number=cell_number, seed=seed,
+            rng_states=(fruit_state, obstacle_state, power_up_state),
+            direction=direction, pending_growth=pending_growth, level=level, score=score,
+            fruits_eaten=fruits_eaten, power_up_spawn_counter=power_up_spawn_counter,
+            power_up_type=POWER_UP_TYPES[power_up_type],
+            active_power_up=POWER_UP_TYPES[active_power_up] if active_power_up >= 0 else None,
+            power_up_effect_start=power_up_effect_start, ticks=ticks, time_ms=time_ms,
+            next_power_up_roll=next_power_up_roll, game_over=bool(game_over), won=bool(won),
+            death_cause=cls.DEATH_CAUSES[death_cause],
+            fruit_cell=fruit_cell, power_up_cell=power_up_cell,
+            body=tuple(body), obstacles=tuple(obstacles), free_cells=tuple(free_cells),
+            grid=bytes(grid), body_counts=body_counts.tobytes(), free_slots=free_slots.tobytes())
+
+
+class GameCore:
+    def __init__(self, cell_number=CELL_NUMBER, seed=None,
+                 snake_speeds=SNAKE_SPEEDS, level_up_threshold=LEVEL_UP_THRESHOLD):
+        if cell_number < MIN_CELL_NUMBER:
+            raise ValueError(f"Tahta en az {MIN_CELL_NUMBER}x{MIN_CELL_NUMBER} olmalı")
+        self.cell_number = cell_number
+        self.snake_speeds = tuple(snake_speeds)
+        self.level_up_threshold = level_up_threshold
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        # Aynı seed ve aynı girdi dizisi birebir aynı oyunu üretir
+        rng = GameRandom(seed)
+        self.seed = rng.seed
+        self.fruit_rng = rng.split("fruit")
+        self.obstacle_rng = rng.split("obstacles")
+        self.power_up_rng = rng.split("power_up")
+
+        # Her hücrenin tipi tek bir bytearray'de tutulur; baş neye çarptı sorusu tek okumadır.
+        # Dokunulmazlıkta yılan kendi üzerinden veya engelden geçebildiği için
+        # gövde parçalarının sayısı ayrıca tutulur (engel, gövdenin önünde görünür).
+        cells = self.cell_number * self.cell_number
+        self.grid = bytearray(cells)
+        self.body_count = array('H', bytes(2 * cells))
+
+        # Boş hücre kümesi: swap-remove dizisi + her hücrenin dizideki yeri (boş değilse -1).
+        # Meyve ve güçlendirme buradan O(1)'de rastgele seçilir.
+        self.free_cells = list(range(cells))
+        self.free_slot = array('i', range(cells))
+
+        # Yılan - hücre indekslerinden oluşan deque, baş soldaki ilk eleman.
+        # Baş ekleme ve kuyruk çıkarma yerinde ve O(1); büyüme bekleyen blok sayacıyla yapılır.
+        self.snake_body = deque(self.cell_index(pos) for pos in ((5, 10), (4, 10), (3, 10)))
+        for index in self.snake_body:
+            self.occupy_body(index)
+        self.direction = RIGHT
+        self.pending_growth = 0
+
+        self.level = 0
+        self.score = 0
+        self.fruits_eaten = 0
+        self.power_up_spawn_counter = 0
+
+        # Sahadaki güçlendirme (yoksa None) ve yılan üzerindeki aktif etki
+        self.power_up_pos = None
+        self.power_up_type = POWER_UP_TYPES[0]
+        self.active_power_up = None
+        self.power_up_effect_start = 0
+
+        # Simülasyon saati - duvar saatinden bağımsız, her tikte tick_ms kadar ilerler
+        self.ticks = 0
+        self.time_ms = 0
+        self.next_power_up_roll = POWER_UP_SPAWN_INTERVAL
+
+        self.game_over = False
+        self.death_cause = None  # "wall", "self" veya "obstacle"
+        self.won = False  # Tahtada meyve koyacak boş hücre kalmadı
+
+        self.obstacles = {}  # Sıralı küme olarak kullanılır (pos -> None)
+        self.create_obstacles(self.level)
+        self.fruit_pos = None
+        self.place_fruit()
+
+    @property
+    def tick_ms(self):
+        # Bir tikin süresi - seviyeye ve aktif hız güçlendirmesine bağlı
+        speed = self.snake_speeds[min(self.level, len(self.snake_speeds) - 1)]
+        if self.active_power_up == "speed":
+            speed *= 1.5
+        elif self.active_power_up == "slow":
+            speed *= 0.7
+        return int(1000 / speed)
+
+    @property
+    def power_up_remaining_ms(self):
+        if self.active_power_up is None:
+            return 0
+        return max(0, POWER_UP_EFFECT_DURATION - (self.time_ms - self.power_up_effect_start))
+
+    def snapshot(self):
+        # Oyunu ileri götürmek için gereken her şey (üreteç durumları dahil)
+        cell_index = self.cell_index
+        return GameState(
+            cell_number=self.cell_number, seed=self.seed,
+            rng_states=(self.fruit_rng.state, self.obstacle_rng.state, self.power_up_rng.state),
+            direction=self.direction, pending_growth=self.pending_growth,
+            level=self.level, score=self.score, fruits_eaten=self.fruits_eaten,
+            power_up_spawn_counter=self.power_up_spawn_counter,
+            power_up_type=self.power_up_type, active_power_up=self.active_power_up,
+            power_up_effect_start=self.power_up_effect_start,
+            ticks=self.ticks, time_ms=self.time_ms, next_power_up_roll=self.next_power_up_roll,
+            game_over=self.game_over, won=self.won, death_cause=self.death_cause,
+            fruit_cell=cell_index(self.fruit_pos) if self.fruit_pos is not None else -1,
+            power_up_cell=cell_index(self.power_up_pos) if self.power_up_pos is not None else -1,
+            body=tuple(self.snake_body),
+            obstacles=tuple(cell_index(pos) for pos in self.obstacles),
+            free_cells=tuple(self.free_cells),
+            grid=bytes(self.grid), body_counts=self.body_count.tobytes(),
+            free_slots=self.free_slot.tobytes())
+
+    def restore(self, state):
+        if state.cell_number != self.cell_number:
+            raise ValueError("Durum farklı boyutta bir tahtaya ait")
+        self.seed = state.seed
+        self.fruit_rng.state, self.obstacle_rng.state, self.power_up_rng.state = state.rng_states
+        self.direction = state.direction
+        self.pending_growth = state.pending_growth
+        self.level = state.level
+        self.score = state.score
+        self.fruits_eaten = state.fruits_eaten
+        self.power_up_spawn_counter = state.power_up_spawn_counter
+        self.power_up_type = state.power_up_type
+        self.active_power_up = state.active_power_up
+        self.power_up_effect_start = state.power_up_effect_start
+        self.ticks = state.ticks
+        self.time_ms = state.time_ms
+        self.next_power_up_roll = state.next_power_up_roll
+        self.game_over = state.game_over
+        self.won = state.won
+        self.death_cause = state.death_cause
+
+        # Tablolar bellek kopyasıyla geri gelir
+        self.grid = bytearray(state.grid)
+        self.body_count = array('H')
+        self.body_count.frombytes(state.body_counts)
+        self.free_slot = array('i')
+        self.free_slot.frombytes(state.free_slots)
+        self.free_cells = list(state.free_cells)
+        self.snake_body = deque(state.body)
+        cell_pos = self.cell_pos
+        self.obstacles = dict.fromkeys(cell_pos(index) for index in state.obstacles)
+        self.fruit_pos = cell_pos(state.fruit_cell) if state.fruit_cell >= 0 else None
+        self.power_up_pos = cell_pos(state.power_up_cell) if state.power_up_cell >= 0 else None
+
+    def cell_index(self, pos):
+        return pos[1] * self.cell_number + pos[0]
+
+    def cell_pos(self, index):
+        y, x = divmod(index, self.cell_number)
+        return x, y
+
+    @property
+    def head_pos(self):
+        return self.cell_pos(self.snake_body[0])
+
+    def set_cell(self, index, cell):
+        # Izgaraya yapılan tüm yazmalar buradan geçer, böylece boş hücre kümesi güncel kalır
+        old = self.grid[index]
+        self.grid[index] = cell
+        if old == EMPTY and cell != EMPTY:
+            # Son elemanı boşalan yere taşı (swap-remove)
+            slot = self.free_slot[index]
+            last = self.free_cells.pop()
+            if last != index:
+                self.free_cells[slot] = last
+                self.free_slot[last] = slot
+            self.free_slot[index] = -1
+        elif old != EMPTY and cell == EMPTY:
+            self.free_slot[index] = len(self.free_cells)
+            self.free_cells.append(index)
+
+    def occupy_body(self, index):
+        self.body_count[index] += 1
+        if self.grid[index] != OBSTACLE:
+            self.set_cell(index, BODY)
+
+    def release_body(self, index):
+        self.body_count[index] -= 1
+        if self.body_count[index] == 0 and self.grid[index] == BODY:
+            self.set_cell(index, EMPTY)
+
+    def step(self, action=None):
+        # Bir oyun tiki: yön değişikliği, hareket ve tüm çarpışma kontrolleri.
+        # Oyun devam ediyorsa True döner.
+        if self.game_over:
+            return False
+
+        # Ters yöne dönüş yok sayılır (handle_events ile aynı kural)
+        if action is not None and action != (self.direction + 2) % 4:
+            self.direction = action
+
+        self.time_ms += self.tick_ms
+        self.ticks += 1
+
+        hit = self.move()
+        if self.game_over:
+            return False
+
+        # Başın girdiği hücrenin tipine göre tek seferde karar ver
+        if hit == BODY:
+            if self.active_power_up != "invincibility":
+                self.end_game("self")
+                return False
+        elif hit == OBSTACLE:
+            self.hit_obstacle()
+            if self.game_over:
+                return False
+        elif hit == FRUIT:
+            self.eat_fruit()
+        elif hit == POWER_UP:
+            self.collect_power_up()
+
+        self.update_power_up_timers()
+        return True
+
+    def move(self):
+        # Yılanı bir hücre ilerletir ve başın girdiği hücrenin eski tipini döndürür
+        dx, dy = DIRECTIONS[self.direction]
+        head_y, head_x = divmod(self.snake_body[0], self.cell_number)
+        head_x += dx
+        head_y += dy
+
+        # Duvar kontrolü - dokunulmazlıkta diğer taraftan çık
+        if not (0 <= head_x < self.cell_number and 0 <= head_y < self.cell_number):
+            if self.active_power_up != "invincibility":
+                self.end_game("wall")
+                return EMPTY
+            head_x %= self.cell_number
+            head_y %= self.cell_number
+
+        # Kuyruk önce boşalır, böylece baş kuyruğun az önce bıraktığı hücreye girebilir
+        if self.pending_growth:
+            self.pending_growth -= 1
+        else:
+            self.release_body(self.snake_body.pop())
+
+        index = head_y * self.cell_number + head_x
+        hit = self.grid[index]
+        self.snake_body.appendleft(index)
+        self.occupy_body(index)
+        return hit
+
+    def hit_obstacle(self):
+        if self.active_power_up == "eat_obstacles":
+            # Engeli ye - yılan uzar ve skor artar
+            self.remove_obstacle(self.head_pos)
+            self.pending_growth += 1
+            self.score += 20
+        elif self.active_power_up != "invincibility":
+            self.end_game("obstacle")
+
+    def eat_fruit(self):
+        self.place_fruit()
+        self.pending_growth += 1
+        self.score += 10
+        self.fruits_eaten += 1
+
+        # Her 4 meyvede bir güçlendirme ortaya çıkar
+        self.power_up_spawn_counter += 1
+        if self.power_up_spawn_counter >= POWER_UP_FRUIT_INTERVAL:
+            self.spawn_power_up()
+            self.power_up_spawn_counter = 0
+
+        if self.fruits_eaten >= self.level_up_threshold:
+            self.level_up()
+
+    def collect_power_up(self):
+        self.power_up_pos = None
+        # Yeni güç öncekinin yerini alır ve süre baştan başlar
+        self.active_power_up = self.power_up_type
+        self.power_up_effect_start = self.time_ms
+
+    def update_power_up_timers(self):
+        # Etki süresi doldu mu
+        if (self.active_power_up is not None and
+                self.time_ms - self.power_up_effect_start > POWER_UP_EFFECT_DURATION):
+            self.active_power_up = None
+
+        # Periyodik güçlendirme zarı (eski POWER_UP_SPAWN zamanlayıcısı)
+        while self.time_ms >= self.next_power_up_roll:
+            self.next_power_up_roll += POWER_UP_SPAWN_INTERVAL
+            if self.power_up_rng.random() < POWER_UP_SPAWN_CHANCE:
+                self.spawn_power_up()
+
+    def spawn_power_up(self):
+        # Sahada zaten bir güçlendirme varsa yenisi çıkmaz
+        if self.power_up_pos is not None:
+            return
+        # Boş hücre yoksa güçlendirme çıkmaz
+        if not self.free_cells:
+            return
+        self.power_up_type = self.power_up_rng.choice(POWER_UP_TYPES)
+        index = self.random_free_cell(self.power_up_rng)
+        self.power_up_pos = self.cell_pos(index)
+        self.set_cell(index, POWER_UP)
+
+    def place_fruit(self):
+        # Eski meyve hâlâ ızgaradaysa (yenmeden taşınıyorsa) hücresini boşalt
+        if self.fruit_pos is not None and self.grid[self.cell_index(self.fruit_pos)] == FRUIT:
+            self.set_cell(self.cell_index(self.fruit_pos), EMPTY)
+        self.fruit_pos = None
+
+        # Tahta doldu - meyve koyacak yer yok, oyun kazanıldı
+        if not self.free_cells:
+            self.won = True
+            self.game_over = True
+            return
+
+        # Boş hücre kümesinden seçildiği için yılanın, engellerin veya güçlendirmenin üzerine düşmez
+        index = self.random_free_cell(self.fruit_rng)
+        self.fruit_pos = self.cell_pos(index)
+        self.set_cell(index, FRUIT)
+
+    def random_free_cell(self, rng):
+        return self.free_cells[rng.randrange(len(self.free_cells))]
+
+    def level_up(self):
+        self.level += 1
+        # Yeni seviye için engelleri ekle (eski engelleri koruyarak)
+        self.create_obstacles(self.level)
+        self.fruits_eaten = 0
+        self.place_fruit()
+
+    def end_game(self, cause):
+        self.game_over = True
+        self.death_cause = cause
+
+    def add_obstacle(self, pos):
+        index = self.cell_index(pos)
+        cell = self.grid[index]
+        if cell == OBSTACLE:
+            return
+        # Engel meyvenin veya güçlendirmenin üzerine düştüyse onlar sahadan kalkar
+        # (seviye atlarken meyve engellerden sonra yeniden yerleştirilir)
+        if cell == FRUIT:
+            self.fruit_pos = None
+        elif cell == POWER_UP:
+            self.power_up_pos = None
+        self.set_cell(index, OBSTACLE)
+        self.obstacles[pos] = None
+
+    def remove_obstacle(self, pos):
+        del self.obstacles[pos]
+        index = self.cell_index(pos)
+        self.set_cell(index, BODY if self.body_count[index] else EMPTY)
+
+    def create_obstacles(self, level):
+        n = self.cell_number
+        safe_zone = 5  # Yılanın başlangıç pozisyonu etrafında güvenli bölge
+
+        # Seviye 0: rastgele tekil engeller
+        if level == 0:
+            base_obstacles = 3
+            placed = 0
+            while placed < base_obstacles and self.free_cells:
+                x, y = self.cell_pos(self.random_free_cell(self.obstacle_rng))
+                if x < safe_zone and y < safe_zone:
+                    continue
+                self.add_obstacle((x, y))
+                placed += 1
+
+        # Seviye 1: rastgele bir kenarda duvar
+        elif level == 1:
+            wall_length = 6
+            wall_position = self.obstacle_rng.choice(['top', 'right', 'bottom', 'left'])
+            wall_start = self.obstacle_rng.randint(5, n - wall_length - 5)
+            for i in range(wall_length):
+                if wall_position == 'top':
+                    self.add_obstacle((wall_start + i, 5))
+                elif wall_position == 'right':
+                    self.add_obstacle((n - 6, wall_start + i))
+                elif wall_position == 'bottom':
+                    self.add_obstacle((wall_start + i, n - 6))
+                else:
+                    self.add_obstacle((5, wall_start + i))
+
+        # Seviye 2: L şeklinde engel
+        elif level == 2:
+            l_start_x = self.obstacle_rng.randint(10, n - 10)
+            l_start_y = self.obstacle_rng.randint(10, n - 10)
+            l_length = 5
+            cells = [(l_start_x, l_start_y + i) for i in range(l_length)]
+            cells += [(l_start_x + i, l_start_y) for i in range(1, l_length)]
+            for x, y in cells:
+                if 0 <= x < n and 0 <= y < n:
+                    self.add_obstacle((x, y))
@@ -0,0 +1,201 @@
+# Pekiştirmeli öğrenme için Gym tarzı ortamlar: reset() / step(action).
+# Gözlem (5, n, n) uint8 dizisidir: gövde, baş, meyve, engel, güçlendirme kanalları.
+# Gözlem dizisi ortam başına bir kez ayrılır ve her adımda yerinde güncellenir; step()
+# hep aynı diziyi döndürür, saklanacaksa kopyalanmalıdır. SnakeEnv kanalları reset() ve
+# seviye atlamasında tümüyle doldurur; diğer adımlarda yalnızca adımın dokunabileceği
+# hücreler (eski/yeni baş, eski kuyruk, meyve ve güçlendirmenin eski/yeni yeri) yeniden
+# yazılır. VectorSnakeEnv biten tahtalar aynı adımda sıfırlandığı için kanalları her
+# adımda NumPy ile tümüyle yeniden doldurur (tahta başına O(n²), yeni dizi ayrılmadan).
+#
+# SnakeEnv tek bir GameCore'u sarar. VectorSnakeEnv aynı arayüzü BatchSimulator üzerinde
+# num_envs oyun için sunar; biten oyunlar aynı adımda kendiliğinden yeniden başlar.
+# NumPy gerektirir.
+import numpy as np
+
+from snake_core import GameCore, GameRandom, CELL_NUMBER, UP, RIGHT, DOWN, LEFT, OBSTACLE, FRUIT, POWER_UP
+from batch_sim import BatchSimulator, WON
+
+# Eylemler handle_events'teki ok/WASD tuşlarıyla aynı dört yön
+ACTIONS = (UP, RIGHT, DOWN, LEFT)
+BODY_CHANNEL, HEAD_CHANNEL, FRUIT_CHANNEL, OBSTACLE_CHANNEL, POWER_UP_CHANNEL = range(5)
+NUM_CHANNELS = 5
+
+# Ödül: skor / 10 (meyve 1, yenen engel 2), ölüm -1
+REWARD_SCALE = 0.1
+DEATH_PENALTY = 1.0
+
+
+class SnakeEnv:
+    def __init__(self, cell_number=CELL_NUMBER, seed=None, max_steps=None):
+        self.cell_number = cell_number
+        self.action_space = ACTIONS
+        self.observation_shape = (NUM_CHANNELS, cell_number, cell_number)
+        self.max_steps = max_steps
+        # İlk bölüm bu seed'le oynanır, sonraki bölümlerin seed'leri ondan türetilir
+        self.seed = seed
+        self.episode_seeds = None
+        self.core = GameCore(cell_number, seed=seed)
+        self.grid = None  # reset() ile bağlanır
+        self.observation = np.zeros(self.observation_shape, dtype=np.uint8)
+        self.channels = self.observation.reshape(NUM_CHANNELS, -1)
+        self.head_channel = self.channels[HEAD_CHANNEL]
+        self.info = {}
+
+    def bind(self):
+        # GameCore.reset ızgarayı yeniden ayırır; görünümler her sıfırlamada yeniden bağlanır
+        n = self.cell_number
+        self.grid = np.frombuffer(self.core.grid, dtype=np.uint8).reshape(n, n)
+        self.body_count = np.frombuffer(self.core.body_count, dtype=np.uint16).reshape(n, n)
+
+    def reset(self, seed=None):
+        # seed verilirse bölüm dizisi o seed'den yeniden başlar; verilmezse dizideki sıradaki
+        # bölüme geçilir. Aynı seed'le kurulan ortamlar aynı bölümleri aynı sırayla oynar.
+        if seed is not None or self.episode_seeds is None:
+            if seed is not None:
+                self.seed = seed
+            rng = GameRandom(self.seed)
+            self.seed = rng.seed  # seed None ise seçilen rastgele seed saklanır
+            self.episode_seeds = rng.split("episodes")
+            episode_seed = self.seed
+        else:
+            episode_seed = self.episode_seeds.getrandbits(64)
+        self.core.reset(episode_seed)
+        self.bind()
+        self.head_channel[:] = 0
+        self.head = self.core.snake_body[0]
+        self.score = 0
+        self.fill_observation()
+        self.info["seed"] = self.core.seed
+        return self.observation, self.info
+
+    def fill_observation(self):
+        observation = self.observation
+        grid = self.grid
+        # Gövde gövde sayısından okunur: dokunulmazlıkta engelin altında kalan gövde de görünür
+        np.greater(self.body_count, 0, out=observation[BODY_CHANNEL])
+        np.equal(grid, FRUIT, out=observation[FRUIT_CHANNEL])
+        np.equal(grid, OBSTACLE, out=observation[OBSTACLE_CHANNEL])
+        np.equal(grid, POWER_UP, out=observation[POWER_UP_CHANNEL])
+        self.update_head()
+
+    def update_observation(self):
+        core = self.core
+        if core.level != self.level:
+            # Seviye atlaması tahtaya yeni engeller ekler; kanallar tümüyle yenilenir
+            self.fill_observation()
+            return
+        grid, body_count, channels = core.grid, core.body_count, self.channels
+        cells = {self.head, core.snake_body[0], self.tail, self.fruit, self.power_up}
+        if core.fruit_pos is not None:
+            cells.add(core.cell_index(core.fruit_pos))
+        if core.power_up_pos is not None:
+            cells.add(core.cell_index(core.power_up_pos))
+        cells.discard(-1)
+        for cell in cells:
+            cell_type = grid[cell]
+            channels[BODY_CHANNEL, cell] = body_count[cell] > 0
+            channels[FRUIT_CHANNEL, cell] = cell_type == FRUIT
+            channels[OBSTACLE_CHANNEL, cell] = cell_type == OBSTACLE
+            channels[POWER_UP_CHANNEL, cell] = cell_type == POWER_UP
+        self.update_head()
+
+    def update_head(self):
+        # Baş kanalında yalnızca eski ve yeni baş hücresi değişir; bir sonraki adımda
+        # yeniden yazılacak hücreler burada not edilir
+        core = self.core
+        self.head_channel[self.head] = 0
+        self.head = core.snake_body[0]
+        self.head_channel[self.head] = 1
+        self.tail = core.snake_body[-1]
+        self.level = core.level
+        self.fruit = core.cell_index(core.fruit_pos) if core.fruit_pos is not None else -1
+        self.power_up = core.cell_index(core.power_up_pos) if core.power_up_pos is not None else -1
+
+    def step(self, action):
+        if self.grid is None:
+            raise RuntimeError("step() öncesinde reset() çağrılmalı")
+        core = self.core
+        core.step(action)
+        reward = (core.score - self.score) * REWARD_SCALE
+        self.score = core.score
+        terminated = core.game_over
+        if terminated and not core.won:
+            reward -= DEATH_PENALTY
+        truncated = self.max_steps is not None and core.ticks >= self.max_steps and not terminated
+        self.update_observation()
+        return self.observation, reward, terminated, truncated, self.info
+
+
+class VectorSnakeEnv:
+    def __init__(self, num_envs, cell_number=CELL_NUMBER, seed=None):
+        self.num_envs = num_envs
+        self.cell_number = cell_number
+        self.action_space = ACTIONS
+        self.observation_shape = (num_envs, NUM_CHANNELS, cell_number, cell_number)
+        self.seed = seed
+        self.sim = None
+
+        # Adımlar arasında yeniden kullanılan tamponlar
+        cells = cell_number * cell_number
+        self.observation = np.zeros(self.observation_shape, dtype=np.uint8)
+        self.channels = self.observation.reshape(num_envs, NUM_CHANNELS, cells)
+        self.flat_observation = self.observation.reshape(-1)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.score_delta = np.zeros(num_envs, dtype=np.int64)
+        self.previous_score = np.zeros(num_envs, dtype=np.int64)
+        self.died = np.zeros(num_envs, dtype=bool)
+        # Vektör ortamda adım sınırı yok; SnakeEnv ile aynı dönüş biçimi için hep False
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        # Baş hücresinin düz gözlem dizisindeki yeri: ortam * 5n² + n² + hücre
+        self.head_base = np.arange(num_envs, dtype=np.int64) * (NUM_CHANNELS * cells) + HEAD_CHANNEL * cells
+        self.head_index = np.zeros(num_envs, dtype=np.int64)
+        self.head_offset = np.zeros(num_envs, dtype=np.int64)
+        self.info = {}
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        self.sim = sim = BatchSimulator(self.num_envs, self.cell_number, seed=self.seed)
+        self.body_base = np.arange(self.num_envs, dtype=np.int64) * sim.capacity
+        self.body = sim.body.reshape(-1)
+        self.observation[:, HEAD_CHANNEL] = 0
+        self.head_index[:] = self.head_base
+        self.previous_score[:] = 0
+        self.info["episodes"] = sim.episodes
+        self.info["final_score"] = sim.final_score
+        self.info["final_cause"] = sim.final_cause
+        self.update_observation()
+        return self.observation, self.info
+
+    def update_observation(self):
+        sim = self.sim
+        channels = self.channels
+        np.greater(sim.body_count, 0, out=channels[:, BODY_CHANNEL])
+        np.equal(sim.grid, FRUIT, out=channels[:, FRUIT_CHANNEL])
+        np.equal(sim.grid, OBSTACLE, out=channels[:, OBSTACLE_CHANNEL])
+        np.equal(sim.grid, POWER_UP, out=channels[:, POWER_UP_CHANNEL])
+        # Eski başları sil, yenilerini yaz: body[ortam, head_ptr] düz dizilerle okunur
+        np.put(self.flat_observation, self.head_index, 0)
+        np.add(self.body_base, sim.head_ptr, out=self.head_offset)
+        np.take(self.body, self.head_offset, out=self.head_index)
+        np.add(self.head_index, self.head_base, out=self.head_index)
+        np.put(self.flat_observation, self.head_index, 1)
+
+    def step(self, actions):
+        # actions: ortam başına yön kodu (-1 = değişiklik yok)
+        sim = self.sim
+        if sim is None:
+            raise RuntimeError("step() öncesinde reset() çağrılmalı")
+        terminated = sim.step(actions)
+
+        # Biten ortamların ödülü sıfırlanmadan önceki son skordan hesaplanır
+        np.subtract(sim.score, self.previous_score, out=self.score_delta)
+        np.subtract(sim.final_score, self.previous_score, out=self.score_delta, where=terminated)
+        np.multiply(self.score_delta, REWARD_SCALE, out=self.rewards)
+        np.not_equal(sim.final_cause, WON, out=self.died)
+        np.logical_and(self.died, terminated, out=self.died)
+        np.subtract(self.rewards, DEATH_PENALTY, out=self.rewards, where=self.died)
+        np.copyto(self.previous_score, sim.score)
+
+        self.update_observation()
+        return self.observation, self.rewards, terminated, self.truncated, self.info
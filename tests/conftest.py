@@ -0,0 +1,26 @@
+# Testler depo kökündeki modülleri doğrudan içe aktarır: python -m pytest
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopilot import Autopilot
+from snake_core import GameRandom
+
+
+@pytest.fixture
+def player():
+    # seed'li oyuncu: çoğunlukla otopilot, ara sıra rastgele yön. Seviye atlama,
+    # güçlendirmeler ve ölüm de oynanır; aynı seed hep aynı girdileri üretir.
+    def make(seed):
+        autopilot = Autopilot()
+        rng = GameRandom(seed).split("test-input")
+
+        def choose(core):
+            if rng.random() < 0.01:
+                return rng.randrange(4)
+            return autopilot(core)
+        return choose
+    return make
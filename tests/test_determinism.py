@@ -0,0 +1,44 @@
+# Aynı seed ve aynı girdiler birebir aynı oyunu üretmeli
+from snake_core import GameCore, GameRandom, MIN_CELL_NUMBER
+
+BOARD = MIN_CELL_NUMBER
+
+
+def play(seed, player, ticks=1500):
+    core = GameCore(BOARD, seed=seed)
+    choose = player(seed)
+    states = [core.snapshot()]
+    while not core.game_over and core.ticks < ticks:
+        core.step(choose(core))
+        states.append(core.snapshot())
+    return states
+
+
+def test_same_seed_same_game(player):
+    for seed in range(5):
+        assert play(seed, player) == play(seed, player)
+
+
+def test_different_seeds_differ(player):
+    assert GameCore(BOARD, seed=1).snapshot() != GameCore(BOARD, seed=2).snapshot()
+    assert play(1, player)[-1] != play(2, player)[-1]
+
+
+def test_reset_matches_new_core(player):
+    core = GameCore(BOARD, seed=3)
+    choose = player(3)
+    for _ in range(200):
+        core.step(choose(core))
+    core.reset(7)
+    assert core.snapshot() == GameCore(BOARD, seed=7).snapshot()
+
+
+def test_split_streams():
+    # Alt akışlar yalnızca seed ve isme bağlıdır; bir akışı tüketmek diğerini kaydırmaz
+    a, b = GameRandom(11), GameRandom(11)
+    fruit = a.split("fruit")
+    for _ in range(100):
+        fruit.random()
+    obstacles_a, obstacles_b = a.split("obstacles"), b.split("obstacles")
+    assert [obstacles_a.getrandbits(64) for _ in range(10)] == [obstacles_b.getrandbits(64) for _ in range(10)]
+    assert b.split("fruit").getrandbits(64) != b.split("obstacles").getrandbits(64)
@@ -0,0 +1,95 @@
+# Anlık görüntü: bayt biçimi kayıpsız olmalı, geri yüklenen oyun aynı biçimde sürmeli
+import pytest
+
+from snake_core import CELL_NUMBER, GameCore, GameRandom, GameState, MIN_CELL_NUMBER
+
+BOARD = MIN_CELL_NUMBER
+
+
+def test_bytes_round_trip(player):
+    core = GameCore(BOARD, seed=6)
+    choose = player(6)
+    while not core.game_over and core.ticks < 1500:
+        state = core.snapshot()
+        assert GameState.from_bytes(state.to_bytes()) == state
+        core.step(choose(core))
+    state = core.snapshot()
+    assert GameState.from_bytes(state.to_bytes()) == state
+
+
+def test_restore_continues_identically(player):
+    # Oyunun ortasında alınan durum başka bir çekirdeğe yüklenir; iki çekirdek aynı
+    # girdilerle ilerleyince her tikte aynı durumda kalmalı
+    core = GameCore(BOARD, seed=8)
+    choose = player(8)
+    for _ in range(300):
+        core.step(choose(core))
+    copy = GameCore(BOARD, seed=0)
+    copy.restore(GameState.from_bytes(core.snapshot().to_bytes()))
+    assert copy.snapshot() == core.snapshot()
+
+    rng = GameRandom(8).split("test-turns")
+    while not core.game_over and core.ticks < 1500:
+        action = choose(core)
+        if rng.random() < 0.05:
+            action = rng.randrange(4)
+        core.step(action)
+        copy.step(action)
+        assert copy.snapshot() == core.snapshot()
+
+
+def test_restore_rewinds(player):
+    core = GameCore(BOARD, seed=9)
+    choose = player(9)
+    for _ in range(100):
+        core.step(choose(core))
+    state = core.snapshot()
+    inputs = []
+    for _ in range(200):
+        inputs.append(choose(core))
+        core.step(inputs[-1])
+    later = core.snapshot()
+    core.restore(state)
+    assert core.snapshot() == state
+    for action in inputs:
+        core.step(action)
+    assert core.snapshot() == later
+
+
+def test_restore_rejects_other_board_size():
+    core = GameCore(BOARD, seed=1)
+    with pytest.raises(ValueError):
+        core.restore(GameCore(BOARD + 1, seed=1).snapshot())
+
+
+def test_size_on_default_board():
+    # 30x30 tahtanın durumu birkaç KB'ı geçmemeli
+    assert len(GameCore(CELL_NUMBER, seed=1).snapshot().to_bytes()) < 4096
+
+
+def test_game_restore_resets_view(monkeypatch, tmp_path):
+    # Game.restore çekirdek dışındaki ara konumları ve oyun kaydını da sıfırlamalı
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.chdir(tmp_path)
+    import importlib
+    game_module = importlib.import_module("yılanOyunu")
+    game = game_module.Game()
+    try:
+        game.reset_game(autopilot=True)
+        for _ in range(50):
+            game.update()
+        state = game.snapshot()
+        for _ in range(50):
+            game.update()
+        game.restore(state)
+        assert game.snapshot() == state
+        assert game.previous_head is None and game.previous_tail is None
+        assert game.recorder is None
+        game.update()
+        game.draw()
+        game.save_high_score()
+        assert not (tmp_path / "high_score.replay").exists()
+    finally:
+        pygame.quit()
@@ -0,0 +1,81 @@
+# Sunucu deltaları: Room.tick'in yayınladığı çerçeveleri uygulayan istemci sunucuyla aynı kalmalı
+import asyncio
+import struct
+
+import pytest
+
+from multiplayer import (INPUT, JOIN, LENGTH, MAX_FRAME, RemoteGame, Room, Server, frame,
+                         read_frame, receive)
+
+
+def assert_mirrors(game, core):
+    assert game.ticks == core.ticks and game.time_ms == core.time_ms
+    assert tuple(game.snake_body) == tuple(core.snake_body)
+    assert bytes(game.grid) == bytes(core.grid)
+    assert game.body_count == core.body_count
+    assert game.direction == core.direction
+    assert game.fruit_pos == core.fruit_pos
+    assert (game.power_up_pos, game.power_up_type) == (core.power_up_pos, core.power_up_type)
+    assert (game.score, game.level, game.fruits_eaten) == (core.score, core.level, core.fruits_eaten)
+    assert (game.active_power_up, game.power_up_effect_start) == (core.active_power_up,
+                                                                  core.power_up_effect_start)
+    assert set(game.obstacles) == set(core.obstacles)
+    assert (game.game_over, game.won, game.death_cause) == (core.game_over, core.won, core.death_cause)
+
+
+def join(room):
+    # Katılan istemci odanın anlık görüntüsüyle başlar
+    game = RemoteGame()
+    receive(game, room.snapshot_frame()[LENGTH.size:])
+    return game
+
+
+def test_deltas_mirror_room(monkeypatch, player):
+    # Bağlantısız oda: yayınlanan çerçeveler listeye düşer, oyun döngüsü elle tiklenir
+    room = Room(Server(seed=12), 0)
+    frames = []
+    monkeypatch.setattr(room, "broadcast", frames.append)
+    core = room.core
+    choose = player(12)
+    clients = [join(room)]
+    games = 0
+    while games < 3:
+        if core.game_over:
+            # Room.run'daki yeni oyun adımı: herkes yeni oyunun anlık görüntüsünü alır
+            core.reset(room.seeds.getrandbits(64))
+            room.remember()
+            room.broadcast(room.snapshot_frame())
+            games += 1
+        else:
+            room.next_direction = choose(core)
+            room.tick()
+        message = frames.pop()[LENGTH.size:]
+        for game in clients:
+            receive(game, message)
+            assert_mirrors(game, core)
+        if core.ticks == 100:
+            # Oyunun ortasında katılan (veya geride kalıp anahtar kare alan) istemci
+            clients.append(join(room))
+
+
+def read(data, limit):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_frame(reader, limit)
+    return asyncio.run(run())
+
+
+def test_read_frame_accepts_client_frames():
+    for message in (JOIN.pack(b"J", 3, 1), INPUT.pack(b"D", 2)):
+        assert read(frame(message), MAX_FRAME) == message
+
+
+def test_read_frame_rejects_oversized_length():
+    # Uzunluk öneki sınırı aşan çerçeve gövdesi okunmadan reddedilir; handle_client bu
+    # hatayı bozuk çerçeve gibi ele alıp yalnızca o bağlantıyı kapatır
+    with pytest.raises(struct.error):
+        read(LENGTH.pack(1 << 30), MAX_FRAME)
+    with pytest.raises(struct.error):
+        read(frame(JOIN.pack(b"J", 3, 1) + b"x"), MAX_FRAME)
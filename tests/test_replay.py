@@ -0,0 +1,38 @@
+# Kayıt/oynatma: kaydedilen oyun yeniden simüle edilince aynı son durumu vermeli
+from replay import Replay, ReplayRecorder, play, verify
+from snake_core import GameCore, MIN_CELL_NUMBER
+
+BOARD = MIN_CELL_NUMBER
+
+
+def record(seed, player, ticks=1500):
+    core = GameCore(BOARD, seed=seed)
+    recorder = ReplayRecorder(core)
+    choose = player(seed)
+    while not core.game_over and core.ticks < ticks:
+        core.step(choose(core))
+        recorder.record(core.direction)
+    return core, recorder.to_replay(core.score)
+
+
+def test_play_reproduces_game(player):
+    for seed in range(5):
+        core, replay = record(seed, player)
+        assert replay.ticks == core.ticks
+        assert play(replay).snapshot() == core.snapshot()
+
+
+def test_bytes_round_trip(player, tmp_path):
+    core, replay = record(1, player)
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert play(loaded).snapshot() == core.snapshot()
+    path = tmp_path / "game.replay"
+    replay.save(path)
+    assert play(Replay.load(path)).snapshot() == core.snapshot()
+
+
+def test_verify_rejects_wrong_score(player):
+    core, replay = record(2, player)
+    assert verify(replay)
+    replay.score += 10
+    assert not verify(replay)
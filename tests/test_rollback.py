@@ -0,0 +1,60 @@
+# Geri sarma: gecikmeli bağlantıda iki taraf gecikmesiz tekrarla aynı maçı üretmeli
+from rollback import (DUEL_TICK_MS, INPUT, MAX_ROLLBACK, STATE_BASE_SIZE, DuelCore,
+                      LoopbackTransport, RollbackSession, greedy, play_match)
+from snake_core import GameRandom, MIN_CELL_NUMBER
+
+
+def test_matches_resync_under_latency():
+    rollbacks = 0
+    for seed in range(10):
+        sessions, synced = play_match(seed, 100, 30)
+        assert synced
+        rollbacks += sum(session.rollbacks for session in sessions)
+    assert rollbacks > 0
+
+
+def test_matches_resync_when_stalling():
+    # Tek yön gecikme MAX_ROLLBACK tikten uzun: oturumlar bekler ama yine de uyuşur
+    latency = (MAX_ROLLBACK + 2) * DUEL_TICK_MS
+    sessions, synced = play_match(3, latency, 0)
+    assert synced
+    assert sum(session.stalls for session in sessions) > 0
+
+
+def test_rollback_replaces_prediction():
+    # Rakip girdisi geç gelir: tahminle ilerleyen oturum geri sarınca gecikmesiz maçla aynı olur
+    now = [0.0]
+    local, remote = LoopbackTransport.pair(lambda: now[0], 3 * DUEL_TICK_MS)
+    session = RollbackSession(DuelCore(MIN_CELL_NUMBER, seed=5), 0, local)
+    reference = DuelCore(MIN_CELL_NUMBER, seed=5)
+    rng = GameRandom(5).split("test-input")
+    remote_inputs = []
+    for _ in range(MAX_ROLLBACK):
+        remote_input = greedy(reference, 1, rng)
+        local_input = greedy(reference, 0, rng)
+        remote_inputs.append(remote_input)
+        assert session.advance(local_input)
+        reference.step((local_input, remote_input))
+        now[0] += DUEL_TICK_MS
+    assert any(direction is not None for direction in remote_inputs)
+    assert session.duel.snapshot() != reference.snapshot()
+
+    # Rakibin tüm girdileri şimdi gelir; en eski yanlış tahminden bir kez geri sarılır
+    for tick, direction in enumerate(remote_inputs):
+        remote.send(INPUT.pack(tick, -1 if direction is None else direction))
+    now[0] += 3 * DUEL_TICK_MS
+    session.poll()
+    assert session.rollbacks == 1
+    assert session.duel.snapshot() == reference.snapshot()
+
+
+def test_snapshot_round_trip():
+    duel = DuelCore(MIN_CELL_NUMBER, seed=7)
+    rng = GameRandom(7).split("test-input")
+    while duel.step((greedy(duel, 0, rng), greedy(duel, 1, rng))):
+        state = duel.snapshot()
+        lengths = len(duel.bodies[0]) + len(duel.bodies[1])
+        assert len(state) == STATE_BASE_SIZE + 4 * lengths
+        copy = DuelCore(MIN_CELL_NUMBER, seed=0)
+        copy.restore(state)
+        assert copy.snapshot() == state and copy.grid == duel.grid
@@ -0,0 +1,53 @@
+# Aranabilir kayıt: state_at(t) ile atlamak baştan sıralı oynatmayla aynı durumu vermeli
+from replay import SeekableReplay, SeekableReplayWriter
+from snake_core import GameCore, MIN_CELL_NUMBER
+
+BOARD = MIN_CELL_NUMBER
+KEYFRAME_INTERVAL = 16
+
+
+def record(path, seed, player, ticks=1500):
+    # Her tikten sonraki durum sırayla saklanır: states[t] = t tik sonrası
+    core = GameCore(BOARD, seed=seed)
+    writer = SeekableReplayWriter(path, core, keyframe_interval=KEYFRAME_INTERVAL)
+    choose = player(seed)
+    states = [core.snapshot()]
+    while not core.game_over and core.ticks < ticks:
+        core.step(choose(core))
+        writer.record(core.direction)
+        states.append(core.snapshot())
+    writer.close()
+    return states
+
+
+def test_state_at_matches_sequential_playback(player, tmp_path):
+    path = tmp_path / "game.seekable"
+    states = record(path, 4, player)
+    replay = SeekableReplay(path)
+    try:
+        assert replay.ticks == len(states) - 1
+        ticks = set(range(0, len(states), 7))
+        ticks.update(range(0, len(states), KEYFRAME_INTERVAL))  # anahtar karelerin tam üstü
+        ticks.update(tick - 1 for tick in range(KEYFRAME_INTERVAL, len(states), KEYFRAME_INTERVAL))
+        ticks.add(len(states) - 1)
+        # Sırasız atlamalar da aynı sonucu verir
+        for tick in sorted(ticks, reverse=True):
+            assert replay.state_at(tick).snapshot() == states[tick]
+        # Aralık dışı tikler kaydın başına veya sonuna kırpılır
+        assert replay.state_at(-5).snapshot() == states[0]
+        assert replay.state_at(len(states) + 100).snapshot() == states[-1]
+    finally:
+        replay.close()
+
+
+def test_last_chunk_on_keyframe_boundary(player, tmp_path):
+    # Kayıt tam bir anahtar karede biterse son parça yön içermez
+    path = tmp_path / "boundary.seekable"
+    states = record(path, 5, player, ticks=4 * KEYFRAME_INTERVAL)
+    assert len(states) - 1 == 4 * KEYFRAME_INTERVAL
+    replay = SeekableReplay(path)
+    try:
+        assert replay.chunks == 5
+        assert replay.state_at(len(states) - 1).snapshot() == states[-1]
+    finally:
+        replay.close()
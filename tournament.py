@@ -0,0 +1,173 @@
+# Otopilot ajanları için turnuva: her ajan verilen her seed ile bir oyun oynar.
+# Oyunlar GameCore üzerinde pencere ve zamanlayıcı olmadan oynanır ve parçalar halinde
+# ProcessPoolExecutor işçilerine dağıtılır. Bir oyunun sonucu yalnızca ajana ve seed'e
+# bağlıdır; işçi sayısı ve parça boyutu sonuçları değiştirmez, yalnızca bitiş sırasını.
+#
+# Ajan, GameCore alıp yön kodu (UP/RIGHT/DOWN/LEFT) ya da değişiklik yoksa None
+# döndüren bir fonksiyondur. Komut satırında "modül:fonksiyon" olarak verilir:
+#   python -m tournament --agents tournament:greedy tournament:straight --seeds 0:1000
+# Her oyunun sonucu bittiği anda stdout'a bir JSON satırı olarak yazılır; özet
+# --summary dosyasına yazılır.
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from snake_core import GameCore, DIRECTIONS, BODY, OBSTACLE
+
+MAX_TICKS = 100000  # Sonsuza kadar dönen ajanlar için üst sınır
+
+
+def straight(core):
+    # Hiç dönmeyen ajan - karşılaştırma için taban çizgisi
+    return None
+
+
+def greedy(core):
+    # Meyveye en çok yaklaştıran ve bir sonraki tikte ölmeyen yönü seç
+    n = core.cell_number
+    grid = core.grid
+    head_x, head_y = core.head_pos
+    fruit_x, fruit_y = core.fruit_pos
+    reverse = (core.direction + 2) % 4
+    best = None
+    for direction, (dx, dy) in enumerate(DIRECTIONS):
+        if direction == reverse:
+            continue
+        x, y = head_x + dx, head_y + dy
+        if not (0 <= x < n and 0 <= y < n) or grid[y * n + x] in (BODY, OBSTACLE):
+            continue
+        distance = abs(fruit_x - x) + abs(fruit_y - y)
+        if best is None or distance < best[0]:
+            best = (distance, direction)
+    return best[1] if best else None
+
+
+def agent_name(agent):
+    if isinstance(agent, str):
+        return agent
+    return f"{agent.__module__}:{agent.__qualname__}"
+
+
+_agents = {}
+
+
+def load_agent(name):
+    # İşçi süreçte "modül:fonksiyon" adını bir kez çözüp sakla
+    agent = _agents.get(name)
+    if agent is None:
+        module, _, attribute = name.partition(":")
+        agent = importlib.import_module(module)
+        for part in attribute.split("."):
+            agent = getattr(agent, part)
+        _agents[name] = agent
+    return agent
+
+
+def play_game(agent, seed, max_ticks=MAX_TICKS):
+    core = GameCore(seed=seed)
+    step = core.step
+    while not core.game_over and core.ticks < max_ticks:
+        step(agent(core))
+
+    if core.won:
+        cause = "won"
+    elif core.game_over:
+        cause = core.death_cause
+    else:
+        cause = "timeout"
+    return {"seed": seed, "score": core.score, "level": core.level + 1,
+            "ticks": core.ticks, "cause": cause}
+
+
+def play_chunk(name, seeds, max_ticks):
+    agent = load_agent(name)
+    results = []
+    for seed in seeds:
+        result = play_game(agent, seed, max_ticks)
+        result["agent"] = name
+        results.append(result)
+    return results
+
+
+def run_tournament(agents, seeds, workers=None, chunksize=16, max_ticks=MAX_TICKS):
+    # Sonuçları oyunlar bittikçe üretir; sıra işçi zamanlamasına bağlıdır
+    names = [agent_name(agent) for agent in agents]
+    seeds = list(seeds)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_chunk, name, seeds[start:start + chunksize], max_ticks)
+                   for name in names
+                   for start in range(0, len(seeds), chunksize)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results):
+    # Bitiş sırasından bağımsız olsun diye sonuçlar önce (ajan, seed) sırasına dizilir
+    summary = {}
+    for result in sorted(results, key=lambda result: (result["agent"], result["seed"])):
+        stats = summary.get(result["agent"])
+        if stats is None:
+            stats = summary[result["agent"]] = {
+                "games": 0, "total_score": 0, "max_score": 0, "total_ticks": 0,
+                "max_level": 0, "causes": {}}
+        stats["games"] += 1
+        stats["total_score"] += result["score"]
+        stats["max_score"] = max(stats["max_score"], result["score"])
+        stats["total_ticks"] += result["ticks"]
+        stats["max_level"] = max(stats["max_level"], result["level"])
+        stats["causes"][result["cause"]] = stats["causes"].get(result["cause"], 0) + 1
+
+    for stats in summary.values():
+        stats["mean_score"] = stats["total_score"] / stats["games"]
+        stats["mean_ticks"] = stats["total_ticks"] / stats["games"]
+        stats["causes"] = dict(sorted(stats["causes"].items()))
+    return summary
+
+
+def parse_seeds(text):
+    # "0:1000" aralık, "1,5,9" liste
+    if ":" in text:
+        start, _, stop = text.partition(":")
+        return range(int(start), int(stop))
+    return [int(seed) for seed in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tournament",
+                                     description="Ajanları seed'li oyunlarda yarıştırır.")
+    parser.add_argument("--agents", nargs="+", default=["tournament:greedy"],
+                        help="modül:fonksiyon biçiminde ajanlar")
+    parser.add_argument("--seeds", default="0:100", type=parse_seeds,
+                        help="başlangıç:bitiş aralığı veya virgülle ayrılmış liste")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--chunksize", type=int, default=16,
+                        help="bir işçiye tek seferde gönderilen oyun sayısı")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    parser.add_argument("--summary", default="tournament_summary.json")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = []
+    for result in run_tournament(args.agents, args.seeds, args.workers,
+                                 args.chunksize, args.max_ticks):
+        results.append(result)
+        print(json.dumps(result), flush=True)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    with open(args.summary, "w") as file:
+        json.dump(summary, file, indent=2)
+    for name, stats in summary.items():
+        print(f"{name}: {stats['games']} oyun, ortalama skor {stats['mean_score']:.2f}, "
+              f"en yüksek {stats['max_score']}, ortalama {stats['mean_ticks']:.0f} tik",
+              file=sys.stderr)
+    print(f"{len(results)} oyun {elapsed:.1f} sn ({args.workers} işçi)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
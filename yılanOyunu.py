@@ -1,20 +1,31 @@
 import pygame
-import random
 import sys
 from pygame.math import Vector2
 import math
+import time
+from collections import OrderedDict, deque
+from snake_core import (GameCore, GameRandom, UP, RIGHT, DOWN, LEFT, BODY, OBSTACLE, FRUIT, POWER_UP,
+                        POWER_UP_EFFECT_DURATION)
+from replay import ReplayRecorder
+from autopilot import Autopilot
 
 # Initialize pygame
 pygame.init()
 
 # Game constants
 CELL_SIZE = 20
-CELL_NUMBER = 30
+CELL_NUMBER = 30  # Varsayılan tahta boyu; Game(board_size=...) ile değiştirilebilir
+VIEW_CELLS = 30  # Ekranda görünen hücre sayısı (kamera penceresi)
 PANEL_HEIGHT = 80
-SCREEN_WIDTH = CELL_SIZE * CELL_NUMBER
-SCREEN_HEIGHT = CELL_SIZE * CELL_NUMBER + PANEL_HEIGHT
+SCREEN_WIDTH = CELL_SIZE * VIEW_CELLS
+SCREEN_HEIGHT = CELL_SIZE * VIEW_CELLS + PANEL_HEIGHT
 FPS = 60
 
+# Sabit adımlı döngü: simülasyon tam tik süreleriyle ilerler, çizim ekran hızında yapılır
+MENU_TICK_MS = 150  # Menü arkaplan yılanlarının adım süresi
+MAX_FRAME_MS = 250  # Pencere sürüklenince vb. birikebilecek en uzun kare (fazlası atılır)
+JITTER_WINDOW = 120  # Tik aralığı sapmasının hesaplandığı son tik sayısı
+
 # Colors
 GREEN = (175, 215, 70)
 DARK_GREEN = (56, 74, 12)
@@ -27,172 +38,371 @@ ORANGE = (255, 165, 0)
 YELLOW = (255, 255, 0)
 PINK = (255, 105, 180)
 
+# Güçlendirme renkleri (hem elma hem de etkin güçteki yılan rengi)
+POWER_UP_COLORS = {
+    "speed": DARK_GREEN,
+    "slow": BLUE,
+    "invincibility": ORANGE,
+    "eat_obstacles": PURPLE,
+}
+
+# Yazı tipi ve metin önbelleği
+FONT_FACE = 'Arial'
+TEXT_CACHE_SIZE = 256  # Saklanan en fazla metin yüzeyi (en eski kullanılan atılır)
+
+# Satranç tahtası deseninin açık ve biraz daha koyu yeşil hücreleri
+LIGHT_SQUARE = (175, 215, 70)
+DARK_SQUARE = (167, 209, 61)
+
+# Görsel atlası: satır başına hücre (bir yılan rengi = 4 baş + gövde) ve başlangıç satır sayısı
+ATLAS_COLUMNS = 5
+ATLAS_ROWS = 16
+
+# Çizim ölçümünde (python yılanOyunu.py --olcum) denenen yılan boyları
+BENCHMARK_LENGTHS = (10, 100, 300, 600, 900)
 
 # Game levels
 LEVEL_EASY = 0
 LEVEL_MEDIUM = 1
 LEVEL_HARD = 2
 
-class Snake:
-    def __init__(self, color=BLACK):
-        self.body = [Vector2(5, 10), Vector2(4, 10), Vector2(3, 10)]
-        self.direction = Vector2(1, 0)
-        self.new_block = False
-        self.color = color
-        self.original_color = color  # Güçlendirme bittikten sonra geri dönmek için orijinal rengi sakla
-        
-        # Basit grafikleri oluştur
-        self.create_snake_graphics()
-        
-    def create_snake_graphics(self):
-        # Farklı yönlere bakan 4 farklı baş oluşturalım
-        self.head_right = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-        self.head_left = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-        self.head_up = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-        self.head_down = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+class TextCache:
+    # Süreç boyunca tek yazı tipi kaydı ve çizilmiş metin önbelleği. SysFont sistem yazı
+    # tiplerini taradığı için her (yüz, boy, kalın) bir kez çözülür. Değişmeyen metinler
+    # (menü, panel, oyun sonu) her karede yeniden çizilmez; LRU sırasıyla en fazla
+    # max_size yüzey tutulur.
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, bold=False, face=FONT_FACE):
+        key = (face, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.SysFont(face, size, bold=bold)
+        return font
+
+    def render(self, font, text, antialias, color):
+        # Font.render ile aynı sıra; dönen yüzey paylaşılır, üzerine çizilmemelidir
+        key = (font, text, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self.surfaces[key] = font.render(text, antialias, color)
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+text_cache = TextCache()
+
+
+class ScreenCache:
+    # Menü, duraklatma, oyun sonu ve seviye ekranlarının sabit kısımları. Yarı saydam
+    # örtüler (boyut, RGBA) başına bir kez doldurulur; her ekranın başlık, gölge ve sabit
+    # yazıları örtüyle birlikte tek bir katmanda birleştirilir ve yalnızca anahtarı
+    # değişince (boyut, kontrol tipi, skor...) yeniden kurulur. Fareyle değişen butonlar
+    # her karede katmanın üzerine çizilir.
+    def __init__(self):
+        self.overlays = {}
+        self.layers = {}
+
+    def overlay(self, size, rgba):
+        key = (size, rgba)
+        surface = self.overlays.get(key)
+        if surface is None:
+            surface = self.overlays[key] = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(rgba)
+        return surface
+
+    def layer(self, name, key, build):
+        # Ekran başına tek katman tutulur; anahtar değişince build() ile yeniden kurulur
+        cached = self.layers.get(name)
+        if cached is None or cached[0] != key:
+            cached = self.layers[name] = (key, build())
+        return cached[1]
+
+
+screen_cache = ScreenCache()
+
+
+class SpriteAtlas:
+    # Yılan (4 yönde baş + gövde, renk başına), elma ve güçlendirme görselleri tek bir dokuda
+    # tutulur; her görsel dokudaki bir hücrenin alt yüzeyidir. Görseller ilk istendiklerinde
+    # bir kez çizilir, renk değişimi yalnızca hazır alt yüzeylere geçiştir. Doku dolarsa iki
+    # kat büyüğü açılır; önceki görseller eski dokuda geçerli kalır.
+    def __init__(self, rows=ATLAS_ROWS):
+        self.rows = rows
+        self.texture = pygame.Surface((ATLAS_COLUMNS * CELL_SIZE, rows * CELL_SIZE), pygame.SRCALPHA)
+        self.used = 0
+        self.snakes = {}
+        self.menu_snakes = {}
+        self.power_ups = {}
+        self.apple = None
+
+    def allocate(self):
+        if self.used == ATLAS_COLUMNS * self.rows:
+            self.rows *= 2
+            self.texture = pygame.Surface((ATLAS_COLUMNS * CELL_SIZE, self.rows * CELL_SIZE), pygame.SRCALPHA)
+            self.used = 0
+        row, column = divmod(self.used, ATLAS_COLUMNS)
+        self.used += 1
+        return self.texture.subsurface((column * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+
+    def snake(self, color):
+        # (yön koduna göre baş görselleri, gövde görseli)
+        sprites = self.snakes.get(color)
+        if sprites is not None:
+            return sprites
+
+        # Farklı yönlere bakan 4 farklı baş, atlasta yan yana
+        head_right = self.allocate()
+        head_left = self.allocate()
+        head_up = self.allocate()
+        head_down = self.allocate()
         
         # Sağa bakan baş
-        pygame.draw.circle(self.head_right, self.color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
+        pygame.draw.circle(head_right, color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
         # Göz beyazları - sağa bakıyor
         eye_size = CELL_SIZE // 6
         eye_pos_x = 3 * CELL_SIZE // 4
         eye_pos_y_top = CELL_SIZE // 3
         eye_pos_y_bottom = 2 * CELL_SIZE // 3
-        pygame.draw.circle(self.head_right, WHITE, (eye_pos_x, eye_pos_y_top), eye_size)
-        pygame.draw.circle(self.head_right, WHITE, (eye_pos_x, eye_pos_y_bottom), eye_size)
+        pygame.draw.circle(head_right, WHITE, (eye_pos_x, eye_pos_y_top), eye_size)
+        pygame.draw.circle(head_right, WHITE, (eye_pos_x, eye_pos_y_bottom), eye_size)
         # Göz bebekleri
         pupil_size = eye_size // 2
         pupil_offset = 1
-        pygame.draw.circle(self.head_right, BLACK, (eye_pos_x + pupil_offset, eye_pos_y_top), pupil_size)
-        pygame.draw.circle(self.head_right, BLACK, (eye_pos_x + pupil_offset, eye_pos_y_bottom), pupil_size)
+        pygame.draw.circle(head_right, BLACK, (eye_pos_x + pupil_offset, eye_pos_y_top), pupil_size)
+        pygame.draw.circle(head_right, BLACK, (eye_pos_x + pupil_offset, eye_pos_y_bottom), pupil_size)
         
         # Sola bakan baş
-        pygame.draw.circle(self.head_left, self.color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
+        pygame.draw.circle(head_left, color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
         # Göz beyazları - sola bakıyor
         eye_pos_x = CELL_SIZE // 4
-        pygame.draw.circle(self.head_left, WHITE, (eye_pos_x, eye_pos_y_top), eye_size)
-        pygame.draw.circle(self.head_left, WHITE, (eye_pos_x, eye_pos_y_bottom), eye_size)
+        pygame.draw.circle(head_left, WHITE, (eye_pos_x, eye_pos_y_top), eye_size)
+        pygame.draw.circle(head_left, WHITE, (eye_pos_x, eye_pos_y_bottom), eye_size)
         # Göz bebekleri
-        pygame.draw.circle(self.head_left, BLACK, (eye_pos_x - pupil_offset, eye_pos_y_top), pupil_size)
-        pygame.draw.circle(self.head_left, BLACK, (eye_pos_x - pupil_offset, eye_pos_y_bottom), pupil_size)
+        pygame.draw.circle(head_left, BLACK, (eye_pos_x - pupil_offset, eye_pos_y_top), pupil_size)
+        pygame.draw.circle(head_left, BLACK, (eye_pos_x - pupil_offset, eye_pos_y_bottom), pupil_size)
         
         # Yukarı bakan baş
-        pygame.draw.circle(self.head_up, self.color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
+        pygame.draw.circle(head_up, color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
         # Göz beyazları - yukarı bakıyor
         eye_pos_y = CELL_SIZE // 4
         eye_pos_x_left = CELL_SIZE // 3
         eye_pos_x_right = 2 * CELL_SIZE // 3
-        pygame.draw.circle(self.head_up, WHITE, (eye_pos_x_left, eye_pos_y), eye_size)
-        pygame.draw.circle(self.head_up, WHITE, (eye_pos_x_right, eye_pos_y), eye_size)
+        pygame.draw.circle(head_up, WHITE, (eye_pos_x_left, eye_pos_y), eye_size)
+        pygame.draw.circle(head_up, WHITE, (eye_pos_x_right, eye_pos_y), eye_size)
         # Göz bebekleri
-        pygame.draw.circle(self.head_up, BLACK, (eye_pos_x_left, eye_pos_y - pupil_offset), pupil_size)
-        pygame.draw.circle(self.head_up, BLACK, (eye_pos_x_right, eye_pos_y - pupil_offset), pupil_size)
+        pygame.draw.circle(head_up, BLACK, (eye_pos_x_left, eye_pos_y - pupil_offset), pupil_size)
+        pygame.draw.circle(head_up, BLACK, (eye_pos_x_right, eye_pos_y - pupil_offset), pupil_size)
         
         # Aşağı bakan baş
-        pygame.draw.circle(self.head_down, self.color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
+        pygame.draw.circle(head_down, color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
         # Göz beyazları - aşağı bakıyor
         eye_pos_y = 3 * CELL_SIZE // 4
-        pygame.draw.circle(self.head_down, WHITE, (eye_pos_x_left, eye_pos_y), eye_size)
-        pygame.draw.circle(self.head_down, WHITE, (eye_pos_x_right, eye_pos_y), eye_size)
+        pygame.draw.circle(head_down, WHITE, (eye_pos_x_left, eye_pos_y), eye_size)
+        pygame.draw.circle(head_down, WHITE, (eye_pos_x_right, eye_pos_y), eye_size)
         # Göz bebekleri
-        pygame.draw.circle(self.head_down, BLACK, (eye_pos_x_left, eye_pos_y + pupil_offset), pupil_size)
-        pygame.draw.circle(self.head_down, BLACK, (eye_pos_x_right, eye_pos_y + pupil_offset), pupil_size)
+        pygame.draw.circle(head_down, BLACK, (eye_pos_x_left, eye_pos_y + pupil_offset), pupil_size)
+        pygame.draw.circle(head_down, BLACK, (eye_pos_x_right, eye_pos_y + pupil_offset), pupil_size)
         
-        # Mevcut baş görseli olarak sağa bakan başı atayalım (varsayılan)
-        self.head = self.head_right
+        # Yön koduna göre baş görselleri (UP, RIGHT, DOWN, LEFT sırasıyla)
+        heads = (head_up, head_right, head_down, head_left)
         
         # Vücut parçası - normal daire
-        self.body_part = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-        pygame.draw.circle(self.body_part, self.color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2 - 1)
+        body_part = self.allocate()
+        pygame.draw.circle(body_part, color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2 - 1)
+
+        sprites = self.snakes[color] = (heads, body_part)
+        return sprites
+
+    def menu_snake(self, color):
+        # Menü arkaplanındaki yılanlar: göz bebeksiz, küçük gözlü baş ve oyundaki gövde
+        sprites = self.menu_snakes.get(color)
+        if sprites is not None:
+            return sprites
+
+        eye_radius = CELL_SIZE // 8
+        # Yön koduna göre (UP, RIGHT, DOWN, LEFT) iki gözün konumu
+        eyes = (
+            ((CELL_SIZE//3, CELL_SIZE//4), (2*CELL_SIZE//3, CELL_SIZE//4)),
+            ((3*CELL_SIZE//4, CELL_SIZE//3), (3*CELL_SIZE//4, 2*CELL_SIZE//3)),
+            ((CELL_SIZE//3, 3*CELL_SIZE//4), (2*CELL_SIZE//3, 3*CELL_SIZE//4)),
+            ((CELL_SIZE//4, CELL_SIZE//3), (CELL_SIZE//4, 2*CELL_SIZE//3)),
+        )
+        heads = []
+        for eye_positions in eyes:
+            head = self.allocate()
+            pygame.draw.circle(head, color, (CELL_SIZE//2, CELL_SIZE//2), CELL_SIZE//2)
+            for position in eye_positions:
+                pygame.draw.circle(head, WHITE, position, eye_radius)
+            heads.append(head)
+
+        sprites = self.menu_snakes[color] = (tuple(heads), self.snake(color)[1])
+        return sprites
+
+    def fruit(self):
+        if self.apple is not None:
+            return self.apple
+
+        # Elma için atlasta bir hücre ayır
+        self.apple = apple = self.allocate()
+        
+        # Elmanın ana kısmı (kırmızı daire)
+        apple_radius = CELL_SIZE // 2 - 2
+        pygame.draw.circle(apple, RED, (CELL_SIZE // 2, CELL_SIZE // 2), apple_radius)
+        
+        # Elmanın sap kısmı
+        stem_color = (139, 69, 19)  # Kahverengi
+        stem_width = CELL_SIZE // 8
+        stem_height = CELL_SIZE // 4
+        pygame.draw.rect(apple, stem_color, 
+                       (CELL_SIZE // 2 - stem_width // 2, 
+                        CELL_SIZE // 2 - apple_radius - stem_height // 2,
+                        stem_width, stem_height))
+        
+        # Elmanın yaprak kısmı
+        leaf_color = (34, 139, 34)  # Yeşil
+        leaf_points = [
+            (CELL_SIZE // 2 + stem_width // 2, CELL_SIZE // 2 - apple_radius),  # Yaprağın başlangıç noktası
+            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 5, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 6),  # Yaprağın uç noktası
+            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 10, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 12),  # Yaprağın iç noktası
+        ]
+        pygame.draw.polygon(apple, leaf_color, leaf_points)
+        
+        # Elmanın parlak kısmı (yansıma efekti)
+        highlight_radius = apple_radius // 3
+        pygame.draw.circle(apple, (255, 200, 200), 
+                         (CELL_SIZE // 2 - highlight_radius, CELL_SIZE // 2 - highlight_radius), 
+                         highlight_radius)
+        return apple
+
+    def power_up(self, type):
+        surface = self.power_ups.get(type)
+        if surface is not None:
+            return surface
+
+        surface = self.power_ups[type] = self.allocate()
+        # Tüm güçlendirmeler için temel elma şekli oluştur
+        apple_radius = CELL_SIZE // 2 - 2
+        
+        # Güç tipine göre elma rengi belirle
+        apple_color = POWER_UP_COLORS.get(type, PINK)
+            
+        # Elmanın ana kısmı (renk güç tipine göre değişir)
+        pygame.draw.circle(surface, apple_color, (CELL_SIZE // 2, CELL_SIZE // 2), apple_radius)
+        
+        # Elmanın sap kısmı
+        stem_color = (139, 69, 19)  # Kahverengi
+        stem_width = CELL_SIZE // 8
+        stem_height = CELL_SIZE // 4
+        pygame.draw.rect(surface, stem_color, 
+                       (CELL_SIZE // 2 - stem_width // 2, 
+                        CELL_SIZE // 2 - apple_radius - stem_height // 2,
+                        stem_width, stem_height))
+        
+        # Elmanın yaprak kısmı
+        leaf_color = (34, 139, 34)  # Yeşil
+        leaf_points = [
+            (CELL_SIZE // 2 + stem_width // 2, CELL_SIZE // 2 - apple_radius),  # Yaprağın başlangıç noktası
+            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 5, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 6),  # Yaprağın uç noktası
+            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 10, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 12),  # Yaprağın iç noktası
+        ]
+        pygame.draw.polygon(surface, leaf_color, leaf_points)
+        
+        # Elmanın parlaklık efekti (yansıma)
+        highlight_radius = apple_radius // 3
+        highlight_color = (255, 255, 255, 120)  # Yarı saydam beyaz
+        pygame.draw.circle(surface, highlight_color, 
+                         (CELL_SIZE // 2 - highlight_radius, CELL_SIZE // 2 - highlight_radius), 
+                         highlight_radius)
+        return surface
+
+
+sprite_atlas = SpriteAtlas()
+
+
+class Snake:
+    def __init__(self, color=BLACK):
+        self.original_color = color  # Güçlendirme bittikten sonra geri dönmek için orijinal rengi sakla
+        self.change_color(color)
 
     def change_color(self, color):
+        # Görseller atlasta renk başına bir kez çizilir; burada yalnızca hazır olanlara geçilir
         self.color = color
-        self.create_snake_graphics()
+        self.heads, self.body_part = sprite_atlas.snake(color)
         
     def restore_original_color(self):
-        self.color = self.original_color
-        self.create_snake_graphics()
-
-    def reset(self):
-        self.body = [Vector2(5, 10), Vector2(4, 10), Vector2(3, 10)]
-        self.direction = Vector2(1, 0)
-        self.new_block = False
-
-    def draw(self, screen):
-        # Skor paneli için kaydırma
-        for index, block in enumerate(self.body):
-            x_pos = int(block.x * CELL_SIZE)
-            y_pos = int(block.y * CELL_SIZE + PANEL_HEIGHT)
-            block_rect = pygame.Rect(x_pos, y_pos, CELL_SIZE, CELL_SIZE)
-
-            if index == 0:  # Head
-                # Yılanın başını çiz
-                screen.blit(self.head, block_rect)
-            else:  # Body parts
-                # Vücut parçalarını çiz
-                screen.blit(self.body_part, block_rect)
-
-    def move(self):
-        if self.new_block:
-            body_copy = self.body[:]
-            body_copy.insert(0, body_copy[0] + self.direction)
-            self.body = body_copy[:]
-            self.new_block = False
-        else:
-            body_copy = self.body[:-1]
-            body_copy.insert(0, body_copy[0] + self.direction)
-            self.body = body_copy[:]
-            
-        # Hareket yönüne göre başın görünümünü güncelle
-        if self.direction.x > 0:  # Sağa
-            self.head = self.head_right
-        elif self.direction.x < 0:  # Sola
-            self.head = self.head_left
-        elif self.direction.y < 0:  # Yukarı
-            self.head = self.head_up
-        elif self.direction.y > 0:  # Aşağı
-            self.head = self.head_down
+        self.change_color(self.original_color)
+
+    def set_base_color(self, color):
+        # Menüden seçilen renk - güçlendirme bitince bu renge dönülür
+        self.original_color = color
+        self.change_color(color)
 
-    def add_block(self):
-        self.new_block = True
+    def draw(self, screen, camera, grid, head, direction, motion=None):
+        # Yalnızca kameradaki gövde hücreleri çizilir (ızgaranın görünür satırları taranır);
+        # tüm gövde ve baş tek bir blits çağrısıyla gönderilir. motion (Game.snake_motion)
+        # verilirse baş ve kuyruk iki tik arasındaki ara konumlarında çizilir.
+        if motion is None:
+            head_position = camera.to_screen(head) if camera.visible(head) else None
+            tail_position = hidden = None
+        else:
+            head_position, tail_position, hidden, cells = motion
+        body_part = self.body_part
+        blits = [(body_part, position) for position in camera.screen_cells(grid, BODY) if position != hidden]
+        if tail_position is not None:
+            blits.append((body_part, tail_position))
+        # Yılanın başını hareket yönüne göre çiz
+        if head_position is not None:
+            blits.append((self.heads[direction], head_position))
+        screen.blits(blits, False)
 
 
 class ScorePanel:
     @staticmethod
-    def draw(screen, score, level, fruits_eaten, power_up_active=False, power_type="", power_duration=0, power_timer=0, high_score=0):
+    def draw(screen, score, level, fruits_eaten, power_up_active=False, power_type="", power_duration=0, power_remaining=0, high_score=0):
         # Üst panel
         panel_rect = pygame.Rect(0, 0, SCREEN_WIDTH, PANEL_HEIGHT)
         pygame.draw.rect(screen, (50, 50, 50), panel_rect)
 
-        # Skor - Kalın yazı tipi
-        font = pygame.font.SysFont('Arial', 22, bold=True)
-        small_font = pygame.font.SysFont('Arial', 16, bold=True)
+        # Skor - Kalın yazı tipi (yazı tipleri ve metinler önbellekten)
+        font = text_cache.font(22, bold=True)
+        small_font = text_cache.font(16, bold=True)
         
         # Skor metni
-        score_text = font.render(f'SKOR: {score}', True, WHITE)
+        score_text = text_cache.render(font, f'SKOR: {score}', True, WHITE)
         screen.blit(score_text, (20, 15))
         
         # Yüksek skor (sağ üst köşe)
         if high_score > 0:
-            high_score_text = small_font.render(f'EN YÜKSEK SKOR: {high_score}', True, YELLOW)
+            high_score_text = text_cache.render(small_font, f'EN YÜKSEK SKOR: {high_score}', True, YELLOW)
             high_score_rect = high_score_text.get_rect()
             screen.blit(high_score_text, (SCREEN_WIDTH - high_score_rect.width - 20, 45))
 
         # Seviye metni - seviye adı dinamik olarak oluşturulacak
         seviye_no = level + 1  # Seviyeler 0'dan başladığı için +1 ekliyoruz
-        level_text = font.render(f'SEVİYE: {seviye_no}', True, WHITE)
+        level_text = text_cache.render(font, f'SEVİYE: {seviye_no}', True, WHITE)
         level_rect = level_text.get_rect()
         screen.blit(level_text, (SCREEN_WIDTH // 2 - level_rect.width // 2, 15))
 
         # Yem metni
-        fruit_text = font.render(f'YEM: {fruits_eaten}/10', True, WHITE)
+        fruit_text = text_cache.render(font, f'YEM: {fruits_eaten}/10', True, WHITE)
         fruit_rect = fruit_text.get_rect()
         screen.blit(fruit_text, (SCREEN_WIDTH - fruit_rect.width - 20, 15))
         
         # Alt satır: Güç-up bilgisi (aktifse)
         if power_up_active and power_duration > 0:
             # Kalan süreyi hesapla
-            remaining_time = max(0, (power_duration - (pygame.time.get_ticks() - power_timer)) // 1000)
+            remaining_time = power_remaining // 1000
             
             # Güç tipine göre renk ve isim belirle
             if power_type == "speed":
@@ -212,7 +422,7 @@ class ScorePanel:
                 power_name = "GÜÇ"
             
             # Güç bilgisini göster
-            power_text = small_font.render(f"AKTİF GÜÇ: {power_name} - {remaining_time}s", True, power_color)
+            power_text = text_cache.render(small_font, f"AKTİF GÜÇ: {power_name} - {remaining_time}s", True, power_color)
             power_rect = power_text.get_rect()
             screen.blit(power_text, (SCREEN_WIDTH // 2 - power_rect.width // 2, 50))
             
@@ -222,7 +432,7 @@ class ScorePanel:
             
             # İlerleme çubuğu - kalan süre
             if power_duration > 0:
-                progress_width = int((power_duration - (pygame.time.get_ticks() - power_timer)) / power_duration * (SCREEN_WIDTH // 2))
+                progress_width = int(power_remaining / power_duration * (SCREEN_WIDTH // 2))
                 progress_rect = pygame.Rect(SCREEN_WIDTH // 4, 45, max(0, progress_width), 10)
                 pygame.draw.rect(screen, power_color, progress_rect)
 
@@ -231,235 +441,216 @@ class ScorePanel:
 
 class Fruit:
     def __init__(self):
-        self.randomize()
-        self.create_apple_surface()
-        
-    def create_apple_surface(self):
-        # Elma için yüzey oluştur
-        self.apple = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-        
-        # Elmanın ana kısmı (kırmızı daire)
-        apple_radius = CELL_SIZE // 2 - 2
-        pygame.draw.circle(self.apple, RED, (CELL_SIZE // 2, CELL_SIZE // 2), apple_radius)
-        
-        # Elmanın sap kısmı
-        stem_color = (139, 69, 19)  # Kahverengi
-        stem_width = CELL_SIZE // 8
-        stem_height = CELL_SIZE // 4
-        pygame.draw.rect(self.apple, stem_color, 
-                       (CELL_SIZE // 2 - stem_width // 2, 
-                        CELL_SIZE // 2 - apple_radius - stem_height // 2,
-                        stem_width, stem_height))
-        
-        # Elmanın yaprak kısmı
-        leaf_color = (34, 139, 34)  # Yeşil
-        leaf_points = [
-            (CELL_SIZE // 2 + stem_width // 2, CELL_SIZE // 2 - apple_radius),  # Yaprağın başlangıç noktası
-            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 5, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 6),  # Yaprağın uç noktası
-            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 10, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 12),  # Yaprağın iç noktası
-        ]
-        pygame.draw.polygon(self.apple, leaf_color, leaf_points)
-        
-        # Elmanın parlak kısmı (yansıma efekti)
-        highlight_radius = apple_radius // 3
-        pygame.draw.circle(self.apple, (255, 200, 200), 
-                         (CELL_SIZE // 2 - highlight_radius, CELL_SIZE // 2 - highlight_radius), 
-                         highlight_radius)
-
-    def draw(self, screen):
-        # Skor paneli için kaydırma
-        fruit_rect = pygame.Rect(self.pos.x * CELL_SIZE, self.pos.y * CELL_SIZE + PANEL_HEIGHT, CELL_SIZE, CELL_SIZE)
-        screen.blit(self.apple, fruit_rect)
+        self.apple = sprite_atlas.fruit()
 
-    def randomize(self):
-        self.x = random.randint(0, CELL_NUMBER - 1)
-        self.y = random.randint(0, CELL_NUMBER - 1)
-        self.pos = Vector2(self.x, self.y)
-        # Ekranın dışına çıkmamasını sağla
-        if self.y < 0 or self.y >= CELL_NUMBER:
-            self.y = CELL_NUMBER // 2
+    def draw(self, screen, camera, pos):
+        # Çizilen alanı döndürür
+        if camera.visible(pos):
+            return screen.blit(self.apple, camera.to_screen(pos))
+        # Meyve kameranın dışındaysa yönünü pencere kenarında küçük bir işaretle göster
+        x, y = camera.to_screen(pos)
+        x = max(0, min(x, SCREEN_WIDTH - CELL_SIZE)) + CELL_SIZE // 2
+        y = max(PANEL_HEIGHT, min(y, SCREEN_HEIGHT - CELL_SIZE)) + CELL_SIZE // 2
+        return pygame.draw.circle(screen, RED, (x, y), CELL_SIZE // 4)
 
 class Obstacle:
-    def __init__(self, level):
-        self.positions = []
-        self.create_obstacles(level)
+    def __init__(self):
+        # Engel yerleşimleri artık snake_core.GameCore.create_obstacles içinde
         self.obstacle_surface = pygame.Surface((CELL_SIZE, CELL_SIZE))
         self.obstacle_surface.fill(DARK_GREEN)
 
-    def create_obstacles(self, level):
-        # self.positions listesi daha önce oluşturulmuş engelleri tutar
-        # Level 0'da temiz başla, diğer seviyelerde eski engelleri koru
-        if level == 0:
-            self.positions = []
-            
-        # Her seviye için yeni engeller oluştur
-        safe_zone = 5  # Yılanın başlangıç pozisyonu etrafında güvenli bölge
-        
-        # Seviye 0 (ilk seviye) engelleri
-        if level == 0:
-            # Temel engel sayısı - ilk seviye için daha az engel
-            base_obstacles = 3
-            
-            # Rastgele engeller
-            for _ in range(base_obstacles):
-                # Rastgele pozisyonlar seç
-                while True:
-                    x = random.randint(0, CELL_NUMBER - 1)
-                    y = random.randint(0, CELL_NUMBER - 1)
-                    pos = Vector2(x, y)
-                    
-                    # Güvenli bölge kontrolü - yılanın başlangıç bölgesine engel koyma
-                    if x < safe_zone and y < safe_zone:
-                        continue
-                        
-                    # Pozisyon daha önce eklenmemişse ekle
-                    if pos not in self.positions:
-                        self.positions.append(pos)
-                        break
-        
-        # Seviye 1 engelleri
-        if level == 1:
-            # Kenar duvarları eklemeye başla
-            wall_length = 6  # Orta uzunlukta duvar
-            
-            # Rastgele bir kenarda duvar oluştur
-            wall_position = random.choice(['top', 'right', 'bottom', 'left'])
-            wall_start = random.randint(5, CELL_NUMBER - wall_length - 5)
-            
-            if wall_position == 'top':
-                for i in range(wall_length):
-                    pos = Vector2(wall_start + i, 5)
-                    if pos not in self.positions:
-                        self.positions.append(pos)
-            elif wall_position == 'right':
-                for i in range(wall_length):
-                    pos = Vector2(CELL_NUMBER - 6, wall_start + i)
-                    if pos not in self.positions:
-                        self.positions.append(pos)
-            elif wall_position == 'bottom':
-                for i in range(wall_length):
-                    pos = Vector2(wall_start + i, CELL_NUMBER - 6)
-                    if pos not in self.positions:
-                        self.positions.append(pos)
-            elif wall_position == 'left':
-                for i in range(wall_length):
-                    pos = Vector2(5, wall_start + i)
-                    if pos not in self.positions:
-                        self.positions.append(pos)
-                        
-        # Seviye 2 engelleri
-        if level == 2:
-            # L şeklinde engeller ekle
-            l_start_x = random.randint(10, CELL_NUMBER - 10)
-            l_start_y = random.randint(10, CELL_NUMBER - 10)
-            l_length = 5  # Orta büyüklükte L
-            
-            # L'nin dikey kısmı
-            for i in range(l_length):
-                pos = Vector2(l_start_x, l_start_y + i)
-                if pos not in self.positions and 0 <= pos.x < CELL_NUMBER and 0 <= pos.y < CELL_NUMBER:
-                    self.positions.append(pos)
-            
-            # L'nin yatay kısmı
-            for i in range(1, l_length):
-                pos = Vector2(l_start_x + i, l_start_y)
-                if pos not in self.positions and 0 <= pos.x < CELL_NUMBER and 0 <= pos.y < CELL_NUMBER:
-                    self.positions.append(pos)
-
-    def draw(self, screen):
-        # Skor paneli için kaydırma
-        for pos in self.positions:
-            obstacle_rect = pygame.Rect(pos.x * CELL_SIZE, pos.y * CELL_SIZE + PANEL_HEIGHT, CELL_SIZE, CELL_SIZE)
-            screen.blit(self.obstacle_surface, obstacle_rect)
-
-    def is_collision(self, pos):
-        for obstacle_pos in self.positions:
-            if obstacle_pos == pos:
-                return True
-        return False
+    def paint(self, layer, position):
+        # Engeller her karede çizilmez; kameranın arka plan katmanına bir kez işlenir
+        layer.blit(self.obstacle_surface, position)
+
+    def paint_all(self, layer, positions):
+        # Katman baştan kurulurken penceredeki tüm engeller tek blits çağrısıyla
+        surface = self.obstacle_surface
+        layer.blits([(surface, position) for position in positions], False)
 
 class PowerUp:
     def __init__(self, type="speed"):
         self.type = type  # speed, invincibility, slow, eat_obstacles
-        self.active = False
-        self.timer = 0
-        self.duration = 8000  # 8 seconds in milliseconds
-        self.pos = Vector2(-1, -1)  # Off-screen initially
-        self.create_surface()
+        self.surface = sprite_atlas.power_up(type)
 
-    def create_surface(self):
-        self.surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-        
-        # Tüm güçlendirmeler için temel elma şekli oluştur
-        apple_radius = CELL_SIZE // 2 - 2
-        
-        # Güç tipine göre elma rengi belirle
-        if self.type == "speed":
-            apple_color = DARK_GREEN  # Hızlandırma için koyu yeşil elma
-        elif self.type == "slow":
-            apple_color = BLUE   # Yavaşlatma için mavi elma
-        elif self.type == "invincibility":
-            apple_color = ORANGE # Dokunulmazlık için turuncu elma
-        elif self.type == "eat_obstacles":
-            apple_color = PURPLE # Engel yeme için mor elma
-        else:
-            apple_color = PINK   # Varsayılan renk
-            
-        # Elmanın ana kısmı (renk güç tipine göre değişir)
-        pygame.draw.circle(self.surface, apple_color, (CELL_SIZE // 2, CELL_SIZE // 2), apple_radius)
-        
-        # Elmanın sap kısmı
-        stem_color = (139, 69, 19)  # Kahverengi
-        stem_width = CELL_SIZE // 8
-        stem_height = CELL_SIZE // 4
-        pygame.draw.rect(self.surface, stem_color, 
-                       (CELL_SIZE // 2 - stem_width // 2, 
-                        CELL_SIZE // 2 - apple_radius - stem_height // 2,
-                        stem_width, stem_height))
-        
-        # Elmanın yaprak kısmı
-        leaf_color = (34, 139, 34)  # Yeşil
-        leaf_points = [
-            (CELL_SIZE // 2 + stem_width // 2, CELL_SIZE // 2 - apple_radius),  # Yaprağın başlangıç noktası
-            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 5, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 6),  # Yaprağın uç noktası
-            (CELL_SIZE // 2 + stem_width // 2 + CELL_SIZE // 10, CELL_SIZE // 2 - apple_radius - CELL_SIZE // 12),  # Yaprağın iç noktası
-        ]
-        pygame.draw.polygon(self.surface, leaf_color, leaf_points)
-        
-        # Elmanın parlaklık efekti (yansıma)
-        highlight_radius = apple_radius // 3
-        highlight_color = (255, 255, 255, 120)  # Yarı saydam beyaz
-        pygame.draw.circle(self.surface, highlight_color, 
-                         (CELL_SIZE // 2 - highlight_radius, CELL_SIZE // 2 - highlight_radius), 
-                         highlight_radius)
+    def draw(self, screen, camera, pos, type):
+        if not camera.visible(pos):
+            return
+        # Sahadaki güç tipi değiştiyse atlastaki görseline geç
+        if type != self.type:
+            self.type = type
+            self.surface = sprite_atlas.power_up(type)
+        screen.blit(self.surface, camera.to_screen(pos))
+
+class Camera:
+    # Tahtanın ekranda görünen VIEW_CELLS x VIEW_CELLS hücrelik penceresi. Çizim yalnızca bu
+    # penceredeki hücreleri dolaşır, böylece kare süresi tahta boyuna değil pencereye bağlıdır.
+    def __init__(self, board_size):
+        self.board_size = board_size
+        self.follow((board_size // 2, board_size // 2))
+
+        # Satranç tahtası deseni bir kez çizilir; bir hücre geniş tutulur ki kamera tek
+        # hücre kaydığında desen sol kenardan bir hücre kaydırılarak kullanılabilsin
+        self.checkerboard = pygame.Surface(((VIEW_CELLS + 1) * CELL_SIZE, VIEW_CELLS * CELL_SIZE))
+        for row in range(VIEW_CELLS):
+            for col in range(VIEW_CELLS + 1):
+                # Daha açık ve biraz daha koyu yeşil hücreler
+                color = LIGHT_SQUARE if (row + col) % 2 == 0 else DARK_SQUARE
+                self.checkerboard.fill(color, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+
+        # Oyun sırasında zemin ve engeller pencere boyunda tek bir katmanda tutulur ve her
+        # karede tek blit ile çizilir. Katman yalnızca kamera kaydığında (açılan şerit) ve bir
+        # engel eklendiğinde veya yendiğinde (tek hücre) yeniden boyanır.
+        self.layer = pygame.Surface((VIEW_CELLS * CELL_SIZE, VIEW_CELLS * CELL_SIZE))
+        self.layer_grid = None
+        self.layer_origin = None
+        self.layer_obstacles = set()
+        self.layer_level = None
+
+        # Pencere hücrelerinin ekrandaki ve katmandaki konumları bir kez hesaplanır; çizim
+        # her karede yeni konum demetleri üretmez, bu listelerdeki demetleri kullanır
+        self.screen_positions = [[(col * CELL_SIZE, row * CELL_SIZE + PANEL_HEIGHT) for col in range(VIEW_CELLS)]
+                                 for row in range(VIEW_CELLS)]
+        self.layer_positions = [[(col * CELL_SIZE, row * CELL_SIZE) for col in range(VIEW_CELLS)]
+                                for row in range(VIEW_CELLS)]
+
+    def follow(self, pos):
+        # Başı ortala; tahta kenarında dur, tahta pencereden küçükse ortada kalsın
+        self.left = self.clamp(pos[0] - VIEW_CELLS // 2)
+        self.top = self.clamp(pos[1] - VIEW_CELLS // 2)
+
+    def clamp(self, start):
+        if self.board_size <= VIEW_CELLS:
+            return (self.board_size - VIEW_CELLS) // 2
+        return max(0, min(start, self.board_size - VIEW_CELLS))
+
+    def visible(self, pos):
+        return (self.left <= pos[0] < self.left + VIEW_CELLS and
+                self.top <= pos[1] < self.top + VIEW_CELLS)
+
+    def to_screen(self, pos):
+        return ((pos[0] - self.left) * CELL_SIZE, (pos[1] - self.top) * CELL_SIZE + PANEL_HEIGHT)
 
-    def spawn(self):
-        if not self.active:
-            self.x = random.randint(0, CELL_NUMBER - 1)
-            self.y = random.randint(0, CELL_NUMBER - 1)
-            self.pos = Vector2(self.x, self.y)
-            self.active = True
-            self.timer = 0
-
-    def collect(self):
-        self.active = False
-        self.pos = Vector2(-1, -1)  # Move off-screen
-        return self.type
-
-    def update(self, dt):
-        if self.active:
-            self.timer += dt
-            if self.timer >= self.duration:
-                self.active = False
-                self.pos = Vector2(-1, -1)  # Move off-screen
-
-    def draw(self, screen):
-        if self.active:
-            power_rect = pygame.Rect(self.pos.x * CELL_SIZE, self.pos.y * CELL_SIZE + PANEL_HEIGHT, CELL_SIZE, CELL_SIZE)
-            screen.blit(self.surface, power_rect)
+    def screen_cells(self, grid, kind, positions=None):
+        # Penceredeki kind tipindeki hücrelerin ekran (veya verilen tablodaki katman) konumları;
+        # yalnızca görünür satırların ızgara dilimleri taranır, tahtanın geri kalanına hiç bakılmaz
+        if positions is None:
+            positions = self.screen_positions
+        n = self.board_size
+        left = max(self.left, 0)
+        right = min(self.left + VIEW_CELLS, n)
+        offset = left - self.left
+        for y in range(max(self.top, 0), min(self.top + VIEW_CELLS, n)):
+            row = grid[y * n + left:y * n + right]
+            cells = positions[y - self.top]
+            x = row.find(kind)
+            while x >= 0:
+                yield cells[offset + x]
+                x = row.find(kind, x + 1)
+
+    def window_rows(self, grid):
+        # Penceredeki ızgara satırlarının kopyası; bir sonraki karede değişen hücreler bununla bulunur
+        n = self.board_size
+        left = max(self.left, 0)
+        right = min(self.left + VIEW_CELLS, n)
+        return [bytes(grid[y * n + left:y * n + right])
+                for y in range(max(self.top, 0), min(self.top + VIEW_CELLS, n))]
+
+    def changed_cells(self, grid, rows):
+        # Kopyadan bu yana değişen pencere hücreleri (kopya yerinde güncellenir); aynı kalan
+        # satırlar tek bayt karşılaştırmasıyla atlanır
+        n = self.board_size
+        left = max(self.left, 0)
+        right = min(self.left + VIEW_CELLS, n)
+        top = max(self.top, 0)
+        for i, old in enumerate(rows):
+            y = top + i
+            row = grid[y * n + left:y * n + right]
+            if row == old:
+                continue
+            rows[i] = bytes(row)
+            for x in range(len(row)):
+                if row[x] != old[x]:
+                    yield left + x, y
+
+    def draw_background(self, screen, core=None, obstacles=None):
+        # Oyun yoksa (menüler) yalnızca zemin; oyun varsa engellerle birlikte önbellekteki katman
+        if core is None:
+            self.draw_checkerboard(screen, PANEL_HEIGHT)
+            return
+        self.sync_layer(core, obstacles)
+        screen.blit(self.layer, (0, PANEL_HEIGHT))
+
+    def draw_checkerboard(self, surface, top):
+        # Tahtanın görünen kısmı; küçük tahtalarda dışarıda kalan alan koyu kalır
+        board = pygame.Rect((-self.left * CELL_SIZE, -self.top * CELL_SIZE + top),
+                            (self.board_size * CELL_SIZE, self.board_size * CELL_SIZE))
+        view = pygame.Rect(0, top, VIEW_CELLS * CELL_SIZE, VIEW_CELLS * CELL_SIZE)
+        if not board.contains(view):
+            surface.fill(DARK_GREEN, view)
+        surface.set_clip(board.clip(view))
+        parity = (self.left + self.top) % 2
+        surface.blit(self.checkerboard, (0, top),
+                     (parity * CELL_SIZE, 0, VIEW_CELLS * CELL_SIZE, VIEW_CELLS * CELL_SIZE))
+        surface.set_clip(None)
+
+    def sync_layer(self, core, obstacles):
+        left, top = self.left, self.top
+        if self.layer_origin is None or core.grid is not self.layer_grid:
+            self.rebuild_layer(core, obstacles)
+            return
+        dx = left - self.layer_origin[0]
+        dy = top - self.layer_origin[1]
+        if abs(dx) >= VIEW_CELLS or abs(dy) >= VIEW_CELLS:
+            self.rebuild_layer(core, obstacles)
+            return
+
+        if dx or dy:
+            # Katman kaydırılır, yalnızca pencereye yeni giren sütun ve satırlar boyanır
+            self.layer_origin = (left, top)
+            self.layer.scroll(-dx * CELL_SIZE, -dy * CELL_SIZE)
+            columns = range(left + VIEW_CELLS - dx, left + VIEW_CELLS) if dx > 0 else range(left, left - dx)
+            for x in columns:
+                for y in range(top, top + VIEW_CELLS):
+                    self.paint_cell((x, y), obstacles)
+            rows = range(top + VIEW_CELLS - dy, top + VIEW_CELLS) if dy > 0 else range(top, top - dy)
+            for y in rows:
+                for x in range(left, left + VIEW_CELLS):
+                    self.paint_cell((x, y), obstacles)
+
+        # Engeller yalnızca seviye atlayınca eklenir ve engel yeme gücüyle tek tek kalkar
+        if core.level != self.layer_level or len(core.obstacles) != len(self.layer_obstacles):
+            current = set(core.obstacles)
+            for pos in current ^ self.layer_obstacles:
+                self.paint_cell(pos, obstacles)
+            self.layer_obstacles = current
+            self.layer_level = core.level
+
+    def rebuild_layer(self, core, obstacles):
+        self.layer_grid = core.grid
+        self.layer_origin = (self.left, self.top)
+        self.layer_obstacles = set(core.obstacles)
+        self.layer_level = core.level
+        self.draw_checkerboard(self.layer, 0)
+        obstacles.paint_all(self.layer, self.screen_cells(core.grid, OBSTACLE, self.layer_positions))
+
+    def paint_cell(self, pos, obstacles):
+        # Katmandaki tek bir hücreyi ızgaradaki güncel tipine göre yeniden boya
+        x, y = pos
+        if not self.visible(pos):
+            return
+        position = ((x - self.left) * CELL_SIZE, (y - self.top) * CELL_SIZE)
+        n = self.board_size
+        if not (0 <= x < n and 0 <= y < n):
+            self.layer.fill(DARK_GREEN, (position, (CELL_SIZE, CELL_SIZE)))
+        elif self.layer_grid[y * n + x] == OBSTACLE:
+            obstacles.paint(self.layer, position)
+        else:
+            color = LIGHT_SQUARE if (x + y) % 2 == 0 else DARK_SQUARE
+            self.layer.fill(color, (position, (CELL_SIZE, CELL_SIZE)))
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None, board_size=CELL_NUMBER):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption('Yılan Oyunu')
         self.clock = pygame.time.Clock()
@@ -473,18 +664,27 @@ class Game:
         self.settings_active = False
         self.settings_selection = 0
         self.paused = False
-        self.level = LEVEL_EASY
-        self.score = 0
         self.high_score = self.load_high_score()  # Yüksek skoru yükle
-        self.fruits_eaten = 0
-        self.level_up_threshold = 10  # Seviye atlamak için gereken meyve sayısı
-        self.snake_speed = 10  # Başlangıç hızı
-        self.snake_speeds = [10, 10, 10, 12, 14, 16, 18, 20, 22, 25]  # Seviye başına hızlar - Daha fazla seviye için
+
+        # Oyun kuralları ve durumu (yılan, meyve, engeller, güçlendirmeler, seviye, skor)
+        # pygame'den bağımsız çekirdekte tutulur; bu sınıf yalnızca çizer ve girişleri iletir
+        # Tüm rastgelelik tek bir seed'den türetilir: her yeni oyunun seed'i ve menü animasyonu
+        self.random = GameRandom(seed)
+        self.game_seeds = self.random.split("games")
+        self.menu_rng = self.random.split("menu")
+        self.core = GameCore(board_size, seed=self.game_seeds.getrandbits(64))
+        # Büyük tahtalarda ekran başı izleyen bir kamera penceresidir
+        self.camera = Camera(board_size)
+        # Oyun kaydı (seed + tik başına yön) - yüksek skor denetimi için
+        self.recorder = ReplayRecorder(self.core)
+        # Otopilot modunda yönü oyuncu yerine Autopilot seçer
+        self.autopilot = Autopilot()
+        self.autopilot_active = False
         
         # Menü değişkenleri
         self.in_menu = True
-        self.menu_selection = 0  # 0: Başla, 1: Renk Seç, 2: Ayarlar, 3: Çıkış
-        self.menu_options = ["BAŞLA", "RENK SEÇ", "AYARLAR", "ÇIKIŞ"]
+        self.menu_selection = 0  # 0: Başla, 1: Otopilot, 2: Renk Seç, 3: Ayarlar, 4: Çıkış
+        self.menu_options = ["BAŞLA", "OTOPİLOT", "RENK SEÇ", "AYARLAR", "ÇIKIŞ"]
         
         # Kontrol ayarları
         self.control_type = "arrow_keys"  # "arrow_keys" veya "wasd"
@@ -503,64 +703,80 @@ class Game:
         self.selected_color_index = 0
         self.color_selection_active = False
 
-        # Ana oyun nesneleri
+        # Ana oyun nesnelerinin çizicileri
         self.snake = Snake(self.available_colors[self.selected_color_index][1])
         self.fruit = Fruit()
-        self.obstacles = Obstacle(self.level)
-        self.power_up = PowerUp(random.choice(["speed", "invincibility", "slow", "eat_obstacles"]))
-        self.power_up_active = False
-        self.power_up_effect_timer = 0
-        self.power_up_effect_duration = 10000  # 10 saniye
+        self.obstacles = Obstacle()
+        self.power_up = PowerUp(self.core.power_up_type)
         
         # Seviye atlama mesajı
         self.show_level_up_message = False
         self.level_up_message_timer = 0
         self.level_up_message_duration = 2000  # 2 saniye
         
-        # Son basılan yön tuşu ve bir sonraki hareket için yön
-        self.last_direction_key = None
-        self.next_direction = Vector2(1, 0)
-        self.direction_changed = False
+        # Bir sonraki hareket için yön kodu (değişiklik yoksa None)
+        self.next_direction = None
+
+        # Kirli dikdörtgen çizimi: son tam karenin bağlamı, penceredeki ızgara satırları,
+        # çizilen baş ve panel değerleri (drawn_frame None ise sıradaki kare tam çizilir)
+        self.drawn_frame = None
+        self.drawn_grid = None
+        self.drawn_rows = []
+        self.drawn_head = None
+        self.drawn_hud = None
+        self.drawn_motion = ()
 
         # Game over metni için font
-        self.font = pygame.font.SysFont('Arial', 36, bold=True)
-        self.small_font = pygame.font.SysFont('Arial', 24)
-        self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
+        self.font = text_cache.font(36, bold=True)
+        self.small_font = text_cache.font(24)
+        self.title_font = text_cache.font(48, bold=True)
 
-        # Hareket güncelleme olayı
-        self.SCREEN_UPDATE = pygame.USEREVENT
-        pygame.time.set_timer(self.SCREEN_UPDATE, int(1000 / self.snake_speed))
+        # Sabit adımlı döngü: geçen süre biriktirilir, birikim bir tik süresini (çekirdeğin
+        # tick_ms'i; seviye ve hız güçlendirmesiyle değişir) aştıkça bir tik ilerletilir
+        self.accumulator = 0.0
+        self.menu_accumulator = 0.0
+        # İki tik arasında gerçekte geçen sürenin tik süresinden sapmaları (ms)
+        self.last_tick_time = None
+        self.tick_deviations = deque(maxlen=JITTER_WINDOW)
+        # Son tikten önceki baş ve kuyruk; çizim bunlarla birikimin tik süresine oranı arasında
+        # ara konum hesaplar (None: yeni oyun, ara konum yok)
+        self.previous_head = None
+        self.previous_tail = None
 
-        # Power-up variables
-        self.power_up_spawn_counter = 0  # Her 4 meyve yendiğinde güçlendirme çıkması için sayaç
-        self.POWER_UP_SPAWN = pygame.USEREVENT + 1
-        pygame.time.set_timer(self.POWER_UP_SPAWN, 8000)  # Bu timer sadece standart 8 saniye için
-        
         # Menü arkaplan yılanları
         self.menu_snakes = []
         self.create_menu_background_snakes()
         
-        # Menü animasyonu için zamanlayıcı
-        self.MENU_ANIMATION = pygame.USEREVENT + 2
-        pygame.time.set_timer(self.MENU_ANIMATION, 150)  # 150ms'de bir hareket et
-        
+    # Çekirdekteki oyun durumuna kısayollar
+    @property
+    def score(self):
+        return self.core.score
+
+    @property
+    def level(self):
+        return self.core.level
+
+    @property
+    def fruits_eaten(self):
+        return self.core.fruits_eaten
+
     def create_menu_background_snakes(self):
         # Menüdeki arkaplan yılanları
         snake_colors = [BLUE, RED, PURPLE, ORANGE, GREEN, YELLOW, PINK]
         for _ in range(5):  # 5 adet yılan oluştur
             # Rastgele konum ve yön
-            start_x = random.randint(2, CELL_NUMBER - 3)
-            start_y = random.randint(2, CELL_NUMBER - 3)
+            start_x = self.menu_rng.randint(2, VIEW_CELLS - 3)
+            start_y = self.menu_rng.randint(2, VIEW_CELLS - 3)
             
             # Rastgele yön
             directions = [Vector2(1, 0), Vector2(-1, 0), Vector2(0, 1), Vector2(0, -1)]
-            direction = random.choice(directions)
+            direction = self.menu_rng.choice(directions)
             
             # Rastgele uzunluk (3-7 arası)
-            length = random.randint(3, 7)
+            length = self.menu_rng.randint(3, 7)
             
             # Rastgele renk
-            color = random.choice(snake_colors)
+            color = self.menu_rng.choice(snake_colors)
             
             # Vücut parçalarını oluştur
             body = []
@@ -570,16 +786,19 @@ class Game:
                 else:  # Dikey hareket
                     body.append(Vector2(start_x, start_y - i * direction.y))
             
-            # Yılanı listeye ekle (vücut, yön, renk, hareket sayacı)
+            # Yılanı listeye ekle (vücut, ekran konumları, yön, renk, hareket sayacı)
             self.menu_snakes.append({
                 "body": body,
+                "positions": [self.menu_snake_position(segment) for segment in body],
                 "direction": direction,
                 "color": color,
                 "move_counter": 0,
-                "move_delay": random.randint(1, 3)  # Farklı hızlar için
+                "move_delay": self.menu_rng.randint(1, 3)  # Farklı hızlar için
             })
+        self.build_menu_blits()
             
     def update_menu_snakes(self):
+        moved = False
         for snake in self.menu_snakes:
             # Hareket sayacını artır ve hız kontrolü yap
             snake["move_counter"] += 1
@@ -587,24 +806,25 @@ class Game:
                 continue
                 
             snake["move_counter"] = 0
+            moved = True
             
             # Yılanın başının mevcut konumunu al
             head_pos = snake["body"][0]
             
             # Rastgele yön değişimi (düşük olasılıkla)
-            if random.random() < 0.1:  # %10 olasılıkla
+            if self.menu_rng.random() < 0.1:  # %10 olasılıkla
                 # Mevcut yöne dik yönlerden birini seç
                 if snake["direction"].x != 0:  # Şu an yatay hareket ediyorsa
-                    snake["direction"] = Vector2(0, random.choice([-1, 1]))
+                    snake["direction"] = Vector2(0, self.menu_rng.choice([-1, 1]))
                 else:  # Şu an dikey hareket ediyorsa
-                    snake["direction"] = Vector2(random.choice([-1, 1]), 0)
+                    snake["direction"] = Vector2(self.menu_rng.choice([-1, 1]), 0)
             
             # Yeni baş konumu
             new_head = head_pos + snake["direction"]
             
             # Sınırları kontrol et ve gerekirse yönü değiştir
-            if (new_head.x < 0 or new_head.x >= CELL_NUMBER or 
-                new_head.y < 0 or new_head.y >= CELL_NUMBER):
+            if (new_head.x < 0 or new_head.x >= VIEW_CELLS or 
+                new_head.y < 0 or new_head.y >= VIEW_CELLS):
                 # Duvara çarptığında yönü tersine çevir
                 snake["direction"] = Vector2(-snake["direction"].x, -snake["direction"].y)
                 new_head = head_pos + snake["direction"]
@@ -612,60 +832,46 @@ class Game:
             # Yılanın vücudunu güncelle
             snake["body"].insert(0, new_head)
             snake["body"].pop()
+            snake["positions"].insert(0, self.menu_snake_position(new_head))
+            snake["positions"].pop()
+        if moved:
+            self.build_menu_blits()
             
+    def menu_snake_position(self, segment):
+        return (int(segment.x * CELL_SIZE), int(segment.y * CELL_SIZE + PANEL_HEIGHT))
+
+    def build_menu_blits(self):
+        # Menü yılanlarının (görsel, konum) dizisi; yalnızca bir yılan hareket edince yeniden
+        # kurulur, her karede tek blits çağrısıyla çizilir
+        blits = []
+        for snake in self.menu_snakes:
+            heads, body_part = sprite_atlas.menu_snake(snake["color"])
+            direction = snake["direction"]
+            if direction.x > 0:
+                head = heads[1]
+            elif direction.x < 0:
+                head = heads[3]
+            elif direction.y > 0:
+                head = heads[2]
+            else:
+                head = heads[0]
+            positions = snake["positions"]
+            blits.append((head, positions[0]))
+            blits.extend([(body_part, position) for position in positions[1:]])
+        self.menu_blits = blits
+
     def draw_menu_background_snakes(self):
         # Menüdeki yılanları çiz
-        for snake in self.menu_snakes:
-            for i, segment in enumerate(snake["body"]):
-                x_pos = int(segment.x * CELL_SIZE)
-                y_pos = int(segment.y * CELL_SIZE + PANEL_HEIGHT)
-                
-                # Yılan parçasını çiz
-                if i == 0:  # Baş
-                    # Daha büyük bir daire olarak baş
-                    pygame.draw.circle(self.screen, snake["color"], 
-                                     (x_pos + CELL_SIZE//2, y_pos + CELL_SIZE//2), 
-                                     CELL_SIZE//2)
-                    # Gözler
-                    eye_radius = CELL_SIZE // 8
-                    # Yöne göre göz pozisyonları
-                    if snake["direction"].x > 0:  # Sağa bakıyor
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + 3*CELL_SIZE//4, y_pos + CELL_SIZE//3), 
-                                         eye_radius)
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + 3*CELL_SIZE//4, y_pos + 2*CELL_SIZE//3), 
-                                         eye_radius)
-                    elif snake["direction"].x < 0:  # Sola bakıyor
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + CELL_SIZE//4, y_pos + CELL_SIZE//3), 
-                                         eye_radius)
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + CELL_SIZE//4, y_pos + 2*CELL_SIZE//3), 
-                                         eye_radius)
-                    elif snake["direction"].y > 0:  # Aşağı bakıyor
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + CELL_SIZE//3, y_pos + 3*CELL_SIZE//4), 
-                                         eye_radius)
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + 2*CELL_SIZE//3, y_pos + 3*CELL_SIZE//4), 
-                                         eye_radius)
-                    else:  # Yukarı bakıyor
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + CELL_SIZE//3, y_pos + CELL_SIZE//4), 
-                                         eye_radius)
-                        pygame.draw.circle(self.screen, WHITE, 
-                                         (x_pos + 2*CELL_SIZE//3, y_pos + CELL_SIZE//4), 
-                                         eye_radius)
-                else:  # Vücut
-                    pygame.draw.circle(self.screen, snake["color"], 
-                                     (x_pos + CELL_SIZE//2, y_pos + CELL_SIZE//2), 
-                                     CELL_SIZE//2 - 1)
+        self.screen.blits(self.menu_blits, False)
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+
+            # Pencere yeniden görünür olduysa ekranın tamamı yeniden çizilmeli
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.drawn_frame = None
             
             # Fare tıklaması kontrolü
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -715,7 +921,8 @@ class Game:
                             self.in_menu = True
                     else:
                         if event.key == pygame.K_SPACE:
-                            self.reset_game()
+                            # Son oyun hangi moddaysa o modda yeniden başla
+                            self.reset_game(self.autopilot_active)
                             self.game_active = True
                 # Oyun içi kontroller
                 else:
@@ -728,57 +935,25 @@ class Game:
                         self.game_active = False
                         self.in_menu = True
                     
-                    if not self.paused:
+                    if not self.paused and not self.autopilot_active:
                         # Yön tuşlarını kontrol et (Ok tuşları veya WASD), bir sonraki güncelleme için yeni yönü kaydet
                         if self.control_type == "arrow_keys":
                             # Ok tuşları kontrolü
-                            if event.key == pygame.K_UP and self.snake.direction.y != 1:
-                                self.next_direction = Vector2(0, -1)
-                                self.direction_changed = True
-                            if event.key == pygame.K_DOWN and self.snake.direction.y != -1:
-                                self.next_direction = Vector2(0, 1)
-                                self.direction_changed = True
-                            if event.key == pygame.K_LEFT and self.snake.direction.x != 1:
-                                self.next_direction = Vector2(-1, 0)
-                                self.direction_changed = True
-                            if event.key == pygame.K_RIGHT and self.snake.direction.x != -1:
-                                self.next_direction = Vector2(1, 0)
-                                self.direction_changed = True
+                            key_directions = {pygame.K_UP: UP, pygame.K_DOWN: DOWN,
+                                              pygame.K_LEFT: LEFT, pygame.K_RIGHT: RIGHT}
                         else:  # control_type == "wasd"
                             # WASD kontrolü
-                            if event.key == pygame.K_w and self.snake.direction.y != 1:
-                                self.next_direction = Vector2(0, -1)
-                                self.direction_changed = True
-                            if event.key == pygame.K_s and self.snake.direction.y != -1:
-                                self.next_direction = Vector2(0, 1)
-                                self.direction_changed = True
-                            if event.key == pygame.K_a and self.snake.direction.x != 1:
-                                self.next_direction = Vector2(-1, 0)
-                                self.direction_changed = True
-                            if event.key == pygame.K_d and self.snake.direction.x != -1:
-                                self.next_direction = Vector2(1, 0)
-                                self.direction_changed = True
-            
-            if event.type == self.SCREEN_UPDATE and self.game_active and not self.paused:
-                # Hareket öncesi yön değişikliği yapıldıysa yeni yönü ayarla
-                if self.direction_changed:
-                    self.snake.direction = self.next_direction
-                    self.direction_changed = False
-                self.update()
+                            key_directions = {pygame.K_w: UP, pygame.K_s: DOWN,
+                                              pygame.K_a: LEFT, pygame.K_d: RIGHT}
+                        direction = key_directions.get(event.key)
+                        # Ters yöne dönüşe izin verme
+                        if direction is not None and direction != (self.core.direction + 2) % 4:
+                            self.next_direction = direction
             
-            if event.type == self.POWER_UP_SPAWN and self.game_active and not self.paused:
-                if random.random() < 0.3:  # %30 şansla
-                    self.power_up.type = random.choice(["speed", "invincibility", "slow", "eat_obstacles"])
-                    self.power_up.create_surface()
-                    self.power_up.spawn()
-                    
-            # Menü animasyonu (yılanların hareketlendirilmesi)
-            if event.type == self.MENU_ANIMATION and (self.in_menu or self.color_selection_active or self.settings_active):
-                self.update_menu_snakes()
                     
     def handle_menu_mouse_click(self, pos):
-        menu_y_start = SCREEN_HEIGHT//2 - 30
-        menu_y_spacing = 70
+        menu_y_start = SCREEN_HEIGHT//2 - 50
+        menu_y_spacing = 60
         button_width, button_height = 240, 50
         
         for i, option in enumerate(self.menu_options):
@@ -794,19 +969,23 @@ class Game:
                     self.in_menu = False
                     self.game_active = True
                     self.reset_game()
-                elif i == 1:  # RENK SEÇ
+                elif i == 1:  # OTOPİLOT
+                    self.in_menu = False
+                    self.game_active = True
+                    self.reset_game(autopilot=True)
+                elif i == 2:  # RENK SEÇ
                     self.in_menu = False
                     self.color_selection_active = True
-                elif i == 2:  # AYARLAR
+                elif i == 3:  # AYARLAR
                     self.in_menu = False
                     self.settings_active = True
-                elif i == 3:  # ÇIKIŞ
+                elif i == 4:  # ÇIKIŞ
                     self.running = False
                 break
     
     def handle_menu_mouse_hover(self, pos):
-        menu_y_start = SCREEN_HEIGHT//2 - 30
-        menu_y_spacing = 70
+        menu_y_start = SCREEN_HEIGHT//2 - 50
+        menu_y_spacing = 60
         button_width, button_height = 240, 50
         
         for i, option in enumerate(self.menu_options):
@@ -846,7 +1025,7 @@ class Game:
                 # Rengi seç ve ana menüye dön
                 self.selected_color_index = i
                 selected_color = self.available_colors[self.selected_color_index][1]
-                self.snake.change_color(selected_color)
+                self.snake.set_base_color(selected_color)
                 self.color_selection_active = False
                 self.in_menu = True
                 break
@@ -904,13 +1083,17 @@ class Game:
                 self.in_menu = False
                 self.game_active = True
                 self.reset_game()
-            elif self.menu_selection == 1:  # RENK SEÇ
+            elif self.menu_selection == 1:  # OTOPİLOT
+                self.in_menu = False
+                self.game_active = True
+                self.reset_game(autopilot=True)
+            elif self.menu_selection == 2:  # RENK SEÇ
                 self.in_menu = False
                 self.color_selection_active = True
-            elif self.menu_selection == 2:  # AYARLAR
+            elif self.menu_selection == 3:  # AYARLAR
                 self.in_menu = False
                 self.settings_active = True
-            elif self.menu_selection == 3:  # ÇIKIŞ
+            elif self.menu_selection == 4:  # ÇIKIŞ
                 self.running = False
                 
     def handle_settings_mouse_click(self, pos):
@@ -972,7 +1155,7 @@ class Game:
         elif key == pygame.K_RETURN:
             # Rengi kaydet ve ana menüye dön
             selected_color = self.available_colors[self.selected_color_index][1]
-            self.snake.change_color(selected_color)
+            self.snake.set_base_color(selected_color)
             self.color_selection_active = False
             self.in_menu = True
         elif key == pygame.K_ESCAPE:
@@ -981,198 +1164,110 @@ class Game:
             self.in_menu = True
         
     def update(self):
-        # Yılanı hareket ettir
-        self.snake.move()
-        
-        # Yılanın kendine çarpması kontrolü
-        self.check_self_collision()
-        
-        # Yılanın duvara çarpması kontrolü
-        self.check_wall_collision()
-        
-        # Yılanın engele çarpması kontrolü
-        self.check_obstacle_collision()
-        
-        # Yılanın meyveyi yemesi kontrolü
-        self.check_fruit_collection()
-        
-        # Yılanın güç-up'ı alması kontrolü
-        self.check_power_up_collection()
-        
-        # Güç-up süresini güncelle
-        current_time = pygame.time.get_ticks()
-        if self.power_up_active and current_time - self.power_up_effect_timer > self.power_up_effect_duration:
-            self.power_up_active = False
-            # Hızı normal seviyeye geri getir
-            pygame.time.set_timer(self.SCREEN_UPDATE, int(1000 / self.snake_speeds[self.level]))
-            # Yılanın rengini geri getir
-            self.snake.restore_original_color()
+        # Bir oyun tiki çekirdekte ilerler (hareket, çarpışmalar, meyve ve güçlendirmeler)
+        previous_power_up = self.core.active_power_up
+        previous_level = self.core.level
+        self.previous_head = self.core.head_pos
+        self.previous_tail = self.core.cell_pos(self.core.snake_body[-1])
+        if self.autopilot_active:
+            self.next_direction = self.autopilot(self.core)
+        self.core.step(self.next_direction)
+        if self.recorder is not None:
+            self.recorder.record(self.core.direction)
+        self.next_direction = None
 
-    def check_self_collision(self):
-        # Yılanın başı, vücudunun herhangi bir parçasına çarparsa oyun biter
-        if self.snake.body[0] in self.snake.body[1:]:
-            if not self.power_up_active or self.power_up.type != "invincibility":
-                self.game_active = False
-                self.in_menu = True  # Menüye dön
-
-    def check_wall_collision(self):
-        # Eğer yılan duvardan geçiyorsa (invincibility modu varsa), diğer taraftan çıkmasını sağla
-        head = self.snake.body[0]
-        
-        if self.power_up_active and self.power_up.type == "invincibility":
-            # Ekranın diğer tarafından çıksın
-            if head.x < 0:
-                # Sol kenardan çıktı, sağ kenardan giriş yap
-                self.snake.body[0] = Vector2(CELL_NUMBER - 1, head.y)
-            elif head.x >= CELL_NUMBER:
-                # Sağ kenardan çıktı, sol kenardan giriş yap
-                self.snake.body[0] = Vector2(0, head.y)
-            elif head.y < 0:
-                # Üst kenardan çıktı, alt kenardan giriş yap
-                self.snake.body[0] = Vector2(head.x, CELL_NUMBER - 1)
-            elif head.y >= CELL_NUMBER:
-                # Alt kenardan çıktı, üst kenardan giriş yap
-                self.snake.body[0] = Vector2(head.x, 0)
-        # Duvara çarparsa ve invincibility yoksa, oyun biter
-        elif (head.x < 0 or head.x >= CELL_NUMBER or head.y < 0 or head.y >= CELL_NUMBER):
+        if self.core.game_over:
             self.game_active = False
             self.in_menu = True  # Menüye dön
+            return
 
-    def check_obstacle_collision(self):
-        # Yılanın başı engele çarparsa oyun biter veya engeli ye (eat_obstacles power-up)
-        if self.obstacles.is_collision(self.snake.body[0]):
-            if self.power_up_active and self.power_up.type == "eat_obstacles":
-                # Engeli ye - engeli listeden çıkar
-                for i, pos in enumerate(self.obstacles.positions):
-                    if pos == self.snake.body[0]:
-                        del self.obstacles.positions[i]
-                        # Yılanın boyunu artır ve skoru artır
-                        self.snake.add_block()
-                        self.score += 20
-                        break
-                
-                # Ekran sınırlarını kontrol et (yılanın ekranın dışına çıkmamasını sağla)
-                head = self.snake.body[0]
-                if head.x < 0:
-                    self.snake.body[0] = Vector2(0, head.y)
-                elif head.x >= CELL_NUMBER:
-                    self.snake.body[0] = Vector2(CELL_NUMBER - 1, head.y)
-                elif head.y < 0:
-                    self.snake.body[0] = Vector2(head.x, 0)
-                elif head.y >= CELL_NUMBER:
-                    self.snake.body[0] = Vector2(head.x, CELL_NUMBER - 1)
-                    
-            elif not self.power_up_active or self.power_up.type != "invincibility":
-                self.game_active = False
-                self.in_menu = True  # Menüye dön
-
-    def check_fruit_collection(self):
-        # Yılanın başı meyve ile aynı konumdaysa, meyveyi yemiş demektir
-        if self.snake.body[0] == self.fruit.pos:
-            # Meyveyi yeni bir konuma taşı
-            self.place_fruit()
-            # Yılanın boyunu artır
-            self.snake.add_block()
-            # Skoru ve yenilen meyve sayısını artır
-            self.score += 10
-            self.fruits_eaten += 1
-            
-            # Her 4 meyvede bir güçlendirme ortaya çıkar
-            self.power_up_spawn_counter += 1
-            if self.power_up_spawn_counter >= 4:
-                self.power_up.type = random.choice(["speed", "invincibility", "slow", "eat_obstacles"])
-                self.power_up.create_surface()
-                self.power_up.spawn()
-                self.power_up_spawn_counter = 0
-            
-            # Seviye atlama kontrolü
-            if self.fruits_eaten >= self.level_up_threshold:
-                self.level_up()
-
-    def check_power_up_collection(self):
-        # Yılanın başı power-up ile aynı konumdaysa, power-up'ı almış demektir
-        if self.power_up.active and self.snake.body[0] == self.power_up.pos:
-            power_type = self.power_up.collect()
-            self.apply_power_up(power_type)
-
-    def apply_power_up(self, power_type):
-        # Bir önceki güç aktifse, önce rengimizi geri alalım
-        if self.power_up_active:
+        # Güç alındıysa veya süresi dolduysa yılanın rengini güncelle
+        if self.core.active_power_up != previous_power_up:
+            if self.core.active_power_up is None:
+                self.snake.restore_original_color()
+            else:
+                self.snake.change_color(POWER_UP_COLORS[self.core.active_power_up])
+
+        if self.core.level != previous_level:
+            self.level_up()
+
+    def advance(self, elapsed_ms):
+        # Kareler arasında geçen süreyi simülasyona aktar. Tik süresi her tikten önce
+        # çekirdekten okunur; hız güçlendirmesi ve seviye yalnızca sıradaki tikin süresini değiştirir.
+        elapsed_ms = min(elapsed_ms, MAX_FRAME_MS)
+        if self.in_menu or self.color_selection_active or self.settings_active:
+            self.menu_accumulator += elapsed_ms
+            while self.menu_accumulator >= MENU_TICK_MS:
+                self.menu_accumulator -= MENU_TICK_MS
+                self.update_menu_snakes()
+
+        if not self.game_active or self.paused:
+            # Duraklatmadan dönünce ilk aralık ölçülmez
+            self.last_tick_time = None
+            return
+        self.accumulator += elapsed_ms
+        while self.game_active and not self.paused and self.accumulator >= self.core.tick_ms:
+            self.accumulator -= self.core.tick_ms
+            self.measure_tick()
+            self.update()
+
+    def measure_tick(self):
+        # Bir önceki tikten bu yana gerçekte geçen süre ile tik süresi arasındaki fark
+        now = time.perf_counter()
+        if self.last_tick_time is not None:
+            self.tick_deviations.append((now - self.last_tick_time) * 1000 - self.core.tick_ms)
+        self.last_tick_time = now
+
+    def tick_jitter(self):
+        # Son JITTER_WINDOW tikte tik aralığının tik süresinden ortalama ve en büyük mutlak sapması (ms)
+        if not self.tick_deviations:
+            return 0.0, 0.0
+        deviations = [abs(deviation) for deviation in self.tick_deviations]
+        return sum(deviations) / len(deviations), max(deviations)
+
+    def snapshot(self):
+        # Oyunun tüm durumu çekirdekte; döngünün tik süresi bu durumdan türetilir
+        return self.core.snapshot()
+
+    def restore(self, state):
+        self.core.restore(state)
+        self.next_direction = None
+        if self.core.active_power_up is None:
             self.snake.restore_original_color()
-            
-        self.power_up_active = True
-        self.power_up_effect_timer = pygame.time.get_ticks()
-        
-        if power_type == "speed":
-            # Hızı artır
-            pygame.time.set_timer(self.SCREEN_UPDATE, int(1000 / (self.snake_speeds[self.level] * 1.5)))
-            self.snake.change_color(DARK_GREEN)  # Hızlandırma için yılanı koyu yeşil yap
-        elif power_type == "slow":
-            # Hızı azalt
-            pygame.time.set_timer(self.SCREEN_UPDATE, int(1000 / (self.snake_speeds[self.level] * 0.7)))
-            self.snake.change_color(BLUE)  # Yavaşlatma için yılanı mavi yap
-        elif power_type == "eat_obstacles":
-            # Engelleri yiyebilme güçlendirmesi
-            self.snake.change_color(PURPLE)  # Engel yeme modu rengi
-        elif power_type == "invincibility":
-            # Geçici dokunulmazlık (hiçbir şey yapma, kontrollerde kullanılacak)
-            self.snake.change_color(ORANGE)  # Dokunulmazlık rengi
-
-    def place_fruit(self):
-        while True:
-            self.fruit.randomize()
-            # Meyvenin yılanın üzerine veya engellerin üzerine düşmemesini sağla
-            if (self.fruit.pos not in self.snake.body and 
-                not self.obstacles.is_collision(self.fruit.pos) and
-                (not self.power_up.active or self.fruit.pos != self.power_up.pos)):
-                break
+        else:
+            self.snake.change_color(POWER_UP_COLORS[self.core.active_power_up])
+        self.accumulator = 0.0
+        self.last_tick_time = None
+        self.previous_head = None
+        self.previous_tail = None
+        # Geri yüklenen oyun seed'den baştan oynatılarak doğrulanamaz; kayıt bırakılır ve
+        # bu oyunun yüksek skoru için tekrar dosyası yazılmaz (yeni oyun kaydı yeniden başlatır)
+        self.recorder = None
 
     def level_up(self):
-        # Bu fonksiyon level atlama işlemlerini gerçekleştirir
-        
-        # Seviyeyi artır, maksimum seviyeyi kontrol etme - her zaman yeni seviye ekle
-        self.level += 1
-        
         # Seviye değişimini göster
         print(f"Seviye atlandı! Yeni seviye: {self.level + 1}")
         
-        # Yeni seviye için engelleri ekle (eski engelleri koruyarak)
-        self.obstacles.create_obstacles(self.level)
-        
-        # Yenilen meyve sayacını sıfırla
-        self.fruits_eaten = 0
-        
-        # Yeni meyveyi yerleştir (yılanın veya engelin üstüne düşmemesi için)
-        self.place_fruit()
-        
         # Seviye atlandığını göstermek için ekranda bir mesaj göster
         self.show_level_up_message = True
         self.level_up_message_timer = pygame.time.get_ticks()
         self.level_up_message_duration = 2000  # 2 saniye
             
-    def reset_game(self):
-        self.level = LEVEL_EASY
-        self.score = 0
-        self.fruits_eaten = 0
-        self.power_up_spawn_counter = 0  # Güçlendirme sayacını sıfırla
-        self.snake_speed = self.snake_speeds[self.level]
-        pygame.time.set_timer(self.SCREEN_UPDATE, int(1000 / self.snake_speed))
-        
-        # Yılanı sıfırla ama mevcut rengi koru
-        current_color = self.snake.color
-        self.snake.reset()
-        if current_color != BLACK:  # Eğer daha önce renk seçildiyse o rengi kullan
-            self.snake.change_color(current_color)
-        
-        self.obstacles = Obstacle(self.level)
-        self.place_fruit()
-        self.power_up_active = False
-        self.power_up.active = False
-        self.power_up.pos = Vector2(-1, -1)  # Off-screen
+    def reset_game(self, autopilot=False):
+        self.autopilot_active = autopilot
+        self.core.reset(self.game_seeds.getrandbits(64))
+        self.recorder = ReplayRecorder(self.core)
+        # İlk tik tam bir tik süresi sonra gelir; sapma ölçümü yeni oyunla baştan başlar
+        self.accumulator = 0.0
+        self.last_tick_time = None
+        self.tick_deviations.clear()
+        self.previous_head = None
+        
+        # Güçlendirme rengi kalmışsa seçilen renge geri dön
+        self.snake.restore_original_color()
         
         # Hareket sistemi değişkenlerini sıfırla
-        self.next_direction = Vector2(1, 0)
-        self.direction_changed = False
+        self.next_direction = None
         
         # Oyun aktif duruma getir
         self.game_active = True
@@ -1183,45 +1278,198 @@ class Game:
         self.color_selection_active = False
         self.settings_active = False
 
+    def level_up_message_visible(self):
+        if self.show_level_up_message:
+            if pygame.time.get_ticks() - self.level_up_message_timer < self.level_up_message_duration:
+                return True
+            self.show_level_up_message = False
+        return False
+
+    def hud_state(self):
+        # Panelde görünen her şey; değişmedikçe panel yeniden çizilmez
+        core = self.core
+        remaining = core.power_up_remaining_ms
+        return (self.score, self.level, self.fruits_eaten, core.active_power_up, remaining // 1000,
+                remaining * (SCREEN_WIDTH // 2) // POWER_UP_EFFECT_DURATION, self.high_score,
+                self.autopilot_active)
+
+    def snake_motion(self):
+        # Tikler arasında kayan parçalar: (baş konumu, kuyruk konumu veya None, gövdesi çizilmeyecek
+        # hücre veya None, kayan parçaların kapladığı hücreler). Oran, birikimin sıradaki tikin
+        # süresine oranıdır; baş bir önceki hücresinden yeni hücresine doğru ilerler.
+        core = self.core
+        camera = self.camera
+        head = core.head_pos
+        if self.previous_head is None:
+            return (camera.to_screen(head) if camera.visible(head) else None), None, None, ()
+        fraction = min(self.accumulator / core.tick_ms, 1.0)
+        cells = ()
+        hidden = None
+        head_position = self.slide(self.previous_head, head, fraction)
+        if head_position is None:
+            head_position = camera.to_screen(head) if camera.visible(head) else None
+        else:
+            cells = (self.previous_head, head)
+            # Baş yeni hücresine henüz varmadı; dokunulmazlıkta gövdenin başka bir parçası
+            # da oradaysa gövde çizilir
+            if core.body_count[core.snake_body[0]] == 1:
+                hidden = camera.to_screen(head)
+        tail = core.cell_pos(core.snake_body[-1])
+        tail_position = None
+        if len(core.snake_body) > 1 and tail != self.previous_tail:
+            tail_position = self.slide(self.previous_tail, tail, fraction)
+            if tail_position is not None:
+                cells += (self.previous_tail, tail)
+        return head_position, tail_position, hidden, cells
+
+    def slide(self, start, end, fraction):
+        # Komşu iki hücre arasındaki ekran konumu. Komşu değillerse (dokunulmazlıkta duvardan
+        # öbür tarafa geçiş) veya biri pencere dışındaysa None: parça tahta boyunca sürüklenmez,
+        # yeni hücresinde çizilir.
+        camera = self.camera
+        if (abs(start[0] - end[0]) + abs(start[1] - end[1]) != 1
+                or not camera.visible(start) or not camera.visible(end)):
+            return None
+        x, y = camera.to_screen(start)
+        end_x, end_y = camera.to_screen(end)
+        return x + round((end_x - x) * fraction), y + round((end_y - y) * fraction)
+
+    def draw_board(self, motion=None):
+        core = self.core
+        camera = self.camera
+        self.camera.draw_background(self.screen, core, self.obstacles)
+        if core.fruit_pos is not None:
+            self.fruit.draw(self.screen, camera, core.fruit_pos)
+        if motion is None:
+            motion = self.snake_motion()
+        self.snake.draw(self.screen, camera, core.grid, core.head_pos, core.direction, motion)
+        if core.power_up_pos is not None:
+            self.power_up.draw(self.screen, camera, core.power_up_pos, core.power_up_type)
+
+    def draw_hud(self):
+        # Skor panelini çiz (güç-up bilgisiyle birlikte)
+        core = self.core
+        ScorePanel.draw(
+            self.screen, 
+            self.score, 
+            self.level, 
+            self.fruits_eaten, 
+            core.active_power_up is not None, 
+            core.active_power_up or "", 
+            POWER_UP_EFFECT_DURATION, 
+            core.power_up_remaining_ms,
+            self.high_score
+        )
+        if self.autopilot_active:
+            autopilot_text = text_cache.render(self.small_font, "OTOPİLOT", True, YELLOW)
+            self.screen.blit(autopilot_text, (20, 45))
+
+    def draw_cell(self, pos, hidden=None):
+        # Tek bir hücreyi katmandan ve üzerindeki nesneden yeniden çiz; baş ve kayan kuyruk
+        # hücrelerden sonra ara konumlarında çizilir
+        core = self.core
+        camera = self.camera
+        position = camera.to_screen(pos)
+        x, y = position
+        rect = self.screen.blit(camera.layer, position, (x, y - PANEL_HEIGHT, CELL_SIZE, CELL_SIZE))
+        kind = core.grid[core.cell_index(pos)]
+        if kind == BODY:
+            if position != hidden:
+                self.screen.blit(self.snake.body_part, position)
+        elif kind == FRUIT:
+            self.fruit.draw(self.screen, camera, pos)
+        elif kind == POWER_UP:
+            self.power_up.draw(self.screen, camera, pos, core.power_up_type)
+        return rect
+
+    def draw_play(self):
+        # Oyun sırasında yalnızca son kareden bu yana değişen hücreler ve panel yeniden çizilir;
+        # yılan tikte bir hücre ilerlediği için çoğu karede ekrana hiç dokunulmaz
+        core = self.core
+        camera = self.camera
+        camera.follow(core.head_pos)
+        fruit_visible = core.fruit_pos is None or camera.visible(core.fruit_pos)
+        frame = (camera.left, camera.top, self.snake.color, core.power_up_type,
+                 None if fruit_visible else core.fruit_pos)
+        head = (core.head_pos, core.direction)
+        motion = self.snake_motion()
+        head_position, tail_position, hidden, cells = motion
+
+        if frame != self.drawn_frame or core.grid is not self.drawn_grid:
+            # Kamera kaydı, renk değişimi veya yeni oyun: tam kare
+            self.screen.fill(GREEN)
+            self.draw_board(motion)
+            self.draw_hud()
+            self.drawn_frame = frame
+            self.drawn_grid = core.grid
+            self.drawn_rows = camera.window_rows(core.grid)
+            self.drawn_head = head
+            self.drawn_motion = cells
+            self.drawn_hud = self.hud_state()
+            pygame.display.update()
+            return
+
+        # Yenen engel katmanda boyanır; hücresi ızgara farkında zaten kirlidir
+        camera.sync_layer(core, self.obstacles)
+        dirty = set(camera.changed_cells(core.grid, self.drawn_rows))
+        if head != self.drawn_head:
+            dirty.add(self.drawn_head[0])
+            dirty.add(head[0])
+            self.drawn_head = head
+        # Kayan baş ve kuyruk her karede ilerler: önceki ve şimdiki karede kapladıkları hücreler
+        dirty.update(self.drawn_motion)
+        dirty.update(cells)
+        self.drawn_motion = cells
+        rects = [self.draw_cell(pos, hidden) for pos in dirty if camera.visible(pos)]
+        # Kayan parçalar kendi hücrelerinin içinde kalır; yalnızca o hücreler yeniden çizildiyse
+        # üzerlerine çizilir (panel çizgisi ilk satıra taştığı için tekrar çizmek güvenli değil)
+        if tail_position is not None:
+            self.screen.blit(self.snake.body_part, tail_position)
+        if head_position is not None and core.head_pos in dirty:
+            self.screen.blit(self.snake.heads[core.direction], head_position)
+        if rects and not fruit_visible:
+            # Kenardaki meyve işaretinin altı yeniden çizilmiş olabilir
+            rects.append(self.fruit.draw(self.screen, camera, core.fruit_pos))
+
+        # Panelin 2 piksellik alt çizgisi tahtanın ilk satırına bir piksel taşar; o satırda
+        # yeniden çizilen bir hücre çizgiyi sileceği için panel de yeniden çizilir
+        hud = self.hud_state()
+        if hud != self.drawn_hud or any(rect.top == PANEL_HEIGHT for rect in rects):
+            self.draw_hud()
+            self.drawn_hud = hud
+            rects.append(pygame.Rect(0, 0, SCREEN_WIDTH, PANEL_HEIGHT + 1))
+        if rects:
+            pygame.display.update(rects)
+
     def draw(self):
+        # Oyun sırasında (üstünde mesaj yokken) kirli dikdörtgenlerle çizilir
+        if self.game_active and not self.paused and not self.level_up_message_visible():
+            self.draw_play()
+            return
+        self.drawn_frame = None
+
         self.screen.fill(GREEN)
         
-        # Arka plan karelerini çiz
-        self.draw_grid()
+        # Oyun aktifse kamera başı izler
+        core = self.core
+        if self.game_active:
+            self.camera.follow(core.head_pos)
         
         # Oyun aktifse oyun elemanlarını çiz
         if self.game_active:
-            self.fruit.draw(self.screen)
-            self.snake.draw(self.screen)
-            self.obstacles.draw(self.screen)
-            if self.power_up.active:
-                self.power_up.draw(self.screen)
-            
-            # Skor panelini çiz (güç-up bilgisiyle birlikte)
-            ScorePanel.draw(
-                self.screen, 
-                self.score, 
-                self.level, 
-                self.fruits_eaten, 
-                self.power_up_active, 
-                self.power_up.type if self.power_up_active else "", 
-                self.power_up_effect_duration, 
-                self.power_up_effect_timer,
-                self.high_score
-            )
+            self.draw_board()
+            self.draw_hud()
             
             # Seviye atlama mesajını göster (varsa)
-            if hasattr(self, 'show_level_up_message') and self.show_level_up_message:
-                current_time = pygame.time.get_ticks()
-                if current_time - self.level_up_message_timer < self.level_up_message_duration:
-                    self.draw_level_up_message()
-                else:
-                    self.show_level_up_message = False
+            if self.level_up_message_visible():
+                self.draw_level_up_message()
             
             # Oyun duraklatılmışsa, duraklatma mesajını göster
             if self.paused:
                 self.draw_pause_screen()
         else:
+            # Arka plan karelerini çiz
+            self.camera.draw_background(self.screen)
             # Oyun aktif değilse, oyunu başlatma veya oyun sonu ekranını göster
             if self.score == 0:
                 self.draw_start_screen()
@@ -1230,22 +1478,6 @@ class Game:
         
         pygame.display.update()
         
-    def draw_grid(self):
-        # Arka plan için kareler çiz
-        for row in range(CELL_NUMBER):
-            for col in range(CELL_NUMBER):
-                # Satranç tahtası deseni oluştur
-                if (row + col) % 2 == 0:
-                    # Daha açık yeşil renkli hücreler
-                    color = (175, 215, 70)  # GREEN
-                else:
-                    # Daha koyu yeşil renkli hücreler
-                    color = (167, 209, 61)  # Biraz daha koyu yeşil
-                
-                # Hücre dikdörtgenini çiz
-                rect = pygame.Rect(col * CELL_SIZE, row * CELL_SIZE + PANEL_HEIGHT, CELL_SIZE, CELL_SIZE)
-                pygame.draw.rect(self.screen, color, rect)
-
     def draw_start_screen(self):
         if self.in_menu:
             self.draw_main_menu()
@@ -1254,10 +1486,10 @@ class Game:
         elif self.settings_active:
             self.draw_settings_menu()
         else:
-            title_text = self.font.render("YILAN OYUNU", True, WHITE)
+            title_text = text_cache.render(self.font, "YILAN OYUNU", True, WHITE)
             title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
             
-            start_text = self.small_font.render("Başlamak için SPACE tuşuna basın", True, WHITE)
+            start_text = text_cache.render(self.small_font, "Başlamak için SPACE tuşuna basın", True, WHITE)
             start_rect = start_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
             
             self.screen.blit(title_text, title_rect)
@@ -1267,24 +1499,14 @@ class Game:
         # Önce arka plandaki yılanları çiz (menünün arkasına)
         self.draw_menu_background_snakes()
         
-        # Menü arka planı (yarı saydam)
-        menu_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        menu_overlay.fill((0, 0, 0, 180))  # Daha saydam arka plan
-        self.screen.blit(menu_overlay, (0, 0))
-        
-        # Oyun başlığı - Gölgeli ve daha büyük
-        shadow_offset = 3
-        title_shadow = self.title_font.render("YILAN OYUNU", True, (60, 60, 0))  # Daha koyu gölge rengi
-        title_shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + shadow_offset, SCREEN_HEIGHT//2 - 150 + shadow_offset))
-        self.screen.blit(title_shadow, title_shadow_rect)
-        
-        title_text = self.title_font.render("YILAN OYUNU", True, YELLOW)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 150))
-        self.screen.blit(title_text, title_rect)
+        # Örtü, başlık ve yönergeler tek katmanda
+        layer = screen_cache.layer("main_menu", (self.screen.get_size(), self.control_type),
+                                   self.build_main_menu_layer)
+        self.screen.blit(layer, (0, 0))
         
         # Menü seçenekleri - Daha şık butonlar
-        menu_y_start = SCREEN_HEIGHT//2 - 30
-        menu_y_spacing = 70
+        menu_y_start = SCREEN_HEIGHT//2 - 50
+        menu_y_spacing = 60
         button_width, button_height = 240, 50
         
         # Fare pozisyonunu al
@@ -1321,7 +1543,7 @@ class Game:
             pygame.draw.rect(self.screen, text_color, button_rect, border_width, 10)  # Kenar
             
             # Buton metni
-            menu_text = self.font.render(text, True, text_color)
+            menu_text = text_cache.render(self.font, text, True, text_color)
             menu_rect = menu_text.get_rect(center=button_rect.center)
             self.screen.blit(menu_text, menu_rect)
             
@@ -1340,44 +1562,50 @@ class Game:
                     (button_rect.right + 15 + arrow_size, button_rect.centery - arrow_size),
                     (button_rect.right + 15 + arrow_size, button_rect.centery + arrow_size),
                 ])
+
+    def build_title_layer(self, title, shadow_color, shadow_offset):
+        # Yarı saydam örtü ve gölgeli başlık - tüm menü ekranlarında ortak
+        layer = screen_cache.overlay(self.screen.get_size(), (0, 0, 0, 180)).copy()
+        title_shadow = text_cache.render(self.title_font, title, True, shadow_color)
+        title_shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + shadow_offset, SCREEN_HEIGHT//2 - 150 + shadow_offset))
+        layer.blit(title_shadow, title_shadow_rect)
+        
+        title_text = text_cache.render(self.title_font, title, True, YELLOW)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 150))
+        layer.blit(title_text, title_rect)
+        return layer
+
+    def build_main_menu_layer(self):
+        # Oyun başlığı - Gölgeli ve daha büyük (daha koyu gölge rengi)
+        layer = self.build_title_layer("YILAN OYUNU", (60, 60, 0), 3)
         
         # Yönergeler - Daha şık bir kutu içinde
         info_box = pygame.Rect(SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT - 90, 400, 60)
-        pygame.draw.rect(self.screen, (30, 30, 30, 200), info_box, 0, 10)
-        pygame.draw.rect(self.screen, (100, 100, 100), info_box, 1, 10)
+        pygame.draw.rect(layer, (30, 30, 30), info_box, 0, 10)
+        pygame.draw.rect(layer, (100, 100, 100), info_box, 1, 10)
         
         # Kontrol tipine göre tuş bilgilerini göster
         if self.control_type == "arrow_keys":
-            controls_text1 = self.small_font.render("Yukarı/Aşağı: Seçim", True, WHITE)
+            controls_text1 = text_cache.render(self.small_font, "Yukarı/Aşağı: Seçim", True, WHITE)
         else:  # WASD kontrolleri
-            controls_text1 = self.small_font.render("W/S: Seçim", True, WHITE)
+            controls_text1 = text_cache.render(self.small_font, "W/S: Seçim", True, WHITE)
             
         controls_rect1 = controls_text1.get_rect(center=(SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT - 60))
         
-        controls_text2 = self.small_font.render("Enter/Tık: Onayla", True, WHITE)
+        controls_text2 = text_cache.render(self.small_font, "Enter/Tık: Onayla", True, WHITE)
         controls_rect2 = controls_text2.get_rect(center=(SCREEN_WIDTH//2 + 80, SCREEN_HEIGHT - 60))
         
-        self.screen.blit(controls_text1, controls_rect1)
-        self.screen.blit(controls_text2, controls_rect2)
+        layer.blit(controls_text1, controls_rect1)
+        layer.blit(controls_text2, controls_rect2)
+        return layer
         
     def draw_settings_menu(self):
         # Önce arka plandaki yılanları çiz (menünün arkasına)
         self.draw_menu_background_snakes()
         
-        # Menü arka planı
-        menu_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        menu_overlay.fill((0, 0, 0, 180))  # Koyu saydam arka plan
-        self.screen.blit(menu_overlay, (0, 0))
-        
-        # Menü başlığı - Gölgeli
-        shadow_offset = 2
-        title_shadow = self.title_font.render("AYARLAR", True, (100, 100, 0))
-        title_shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + shadow_offset, SCREEN_HEIGHT//2 - 150 + shadow_offset))
-        self.screen.blit(title_shadow, title_shadow_rect)
-        
-        title_text = self.title_font.render("AYARLAR", True, YELLOW)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 150))
-        self.screen.blit(title_text, title_rect)
+        # Örtü, başlık, etiket ve yönergeler tek katmanda
+        layer = screen_cache.layer("settings", (self.screen.get_size(),), self.build_settings_layer)
+        self.screen.blit(layer, (0, 0))
         
         # Fare pozisyonunu al
         mouse_pos = pygame.mouse.get_pos()
@@ -1385,11 +1613,6 @@ class Game:
         # Ayarlar seçenekleri
         settings_y_start = SCREEN_HEIGHT//2 - 50
         
-        # Kontrol tipi seçimi
-        control_text = self.font.render("Kontrol Tipi:", True, WHITE)
-        control_rect = control_text.get_rect(topleft=(SCREEN_WIDTH//2 - 200, settings_y_start))
-        self.screen.blit(control_text, control_rect)
-        
         # Kontrol tipi butonları
         button_width, button_height = 150, 40
         control_button_spacing = 20
@@ -1426,11 +1649,11 @@ class Game:
         pygame.draw.rect(self.screen, wasd_border_color, wasd_button, 2, 10)
         
         # Buton metinleri
-        arrow_text = self.font.render("Ok Tuşları", True, WHITE)
+        arrow_text = text_cache.render(self.font, "Ok Tuşları", True, WHITE)
         arrow_text_rect = arrow_text.get_rect(center=arrow_button.center)
         self.screen.blit(arrow_text, arrow_text_rect)
         
-        wasd_text = self.font.render("WASD", True, WHITE)
+        wasd_text = text_cache.render(self.font, "WASD", True, WHITE)
         wasd_text_rect = wasd_text.get_rect(center=wasd_button.center)
         self.screen.blit(wasd_text, wasd_text_rect)
         
@@ -1465,7 +1688,7 @@ class Game:
         pygame.draw.rect(self.screen, back_border_color, back_button, back_border_width, 10)
         
         # Geri butonu metni
-        back_text = self.font.render("KAYDET", True, back_border_color)
+        back_text = text_cache.render(self.font, "KAYDET", True, back_border_color)
         back_rect = back_text.get_rect(center=back_button.center)
         self.screen.blit(back_text, back_rect)
         
@@ -1473,31 +1696,32 @@ class Game:
         if back_button.collidepoint(mouse_pos) and pygame.mouse.get_pressed()[0]:
             self.settings_active = False
             self.in_menu = True
+
+    def build_settings_layer(self):
+        # Menü başlığı - Gölgeli
+        layer = self.build_title_layer("AYARLAR", (100, 100, 0), 2)
+        
+        # Kontrol tipi seçimi
+        settings_y_start = SCREEN_HEIGHT//2 - 50
+        control_text = text_cache.render(self.font, "Kontrol Tipi:", True, WHITE)
+        control_rect = control_text.get_rect(topleft=(SCREEN_WIDTH//2 - 200, settings_y_start))
+        layer.blit(control_text, control_rect)
         
         # Yönergeler
         info_box = pygame.Rect(SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT - 50, 500, 30)
-        controls_text = self.small_font.render("Tıklayarak kontrol tipini değiştirin ve kaydedin", True, WHITE)
+        controls_text = text_cache.render(self.small_font, "Tıklayarak kontrol tipini değiştirin ve kaydedin", True, WHITE)
         controls_rect = controls_text.get_rect(center=info_box.center)
-        self.screen.blit(controls_text, controls_rect)
+        layer.blit(controls_text, controls_rect)
+        return layer
         
     def draw_color_selection_menu(self):
         # Önce arka plandaki yılanları çiz (menünün arkasına)
         self.draw_menu_background_snakes()
         
-        # Menü arka planı
-        menu_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        menu_overlay.fill((0, 0, 0, 180))  # Koyu saydam arka plan
-        self.screen.blit(menu_overlay, (0, 0))
-        
-        # Menü başlığı - Gölgeli
-        shadow_offset = 2
-        title_shadow = self.title_font.render("YILAN RENGİ SEÇİN", True, (100, 100, 0))
-        title_shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + shadow_offset, SCREEN_HEIGHT//2 - 150 + shadow_offset))
-        self.screen.blit(title_shadow, title_shadow_rect)
-        
-        title_text = self.title_font.render("YILAN RENGİ SEÇİN", True, YELLOW)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 150))
-        self.screen.blit(title_text, title_rect)
+        # Örtü, başlık ve yönergeler tek katmanda
+        layer = screen_cache.layer("color_selection", (self.screen.get_size(), self.control_type),
+                                   self.build_color_selection_layer)
+        self.screen.blit(layer, (0, 0))
         
         # Fare pozisyonunu al
         mouse_pos = pygame.mouse.get_pos()
@@ -1516,7 +1740,7 @@ class Game:
             
             # Renk adını çiz (butonun üzerinde)
             name_color = color_value if i == self.selected_color_index else WHITE
-            name_text = self.small_font.render(color_name, True, name_color)
+            name_text = text_cache.render(self.small_font, color_name, True, name_color)
             name_rect = name_text.get_rect(center=(color_x, color_y - color_button_size//2 - 20))
             self.screen.blit(name_text, name_rect)
             
@@ -1599,25 +1823,33 @@ class Game:
         pygame.draw.rect(self.screen, back_border_color, back_button, back_border_width, 10)
         
         # Geri butonu metni
-        back_text = self.font.render("GERİ", True, back_border_color)
+        back_text = text_cache.render(self.font, "GERİ", True, back_border_color)
         back_rect = back_text.get_rect(center=back_button.center)
         self.screen.blit(back_text, back_rect)
+
+    def build_color_selection_layer(self):
+        # Menü başlığı - Gölgeli
+        layer = self.build_title_layer("YILAN RENGİ SEÇİN", (100, 100, 0), 2)
         
         # Yönergeler
         info_box = pygame.Rect(SCREEN_WIDTH//2 - 250, SCREEN_HEIGHT - 50, 500, 30)
         # Kontrol tipine göre tuş bilgilerini güncelle
         if self.control_type == "arrow_keys":
-            controls_text = self.small_font.render("Yukarı/Aşağı: Seçim   |   Enter: Onayla   |   Esc: Geri", True, WHITE)
+            controls_text = text_cache.render(self.small_font, "Yukarı/Aşağı: Seçim   |   Enter: Onayla   |   Esc: Geri", True, WHITE)
         else:  # WASD kontrolleri
-            controls_text = self.small_font.render("W/S: Seçim   |   Enter: Onayla   |   Esc: Geri", True, WHITE)
+            controls_text = text_cache.render(self.small_font, "W/S: Seçim   |   Enter: Onayla   |   Esc: Geri", True, WHITE)
         controls_rect = controls_text.get_rect(center=info_box.center)
-        self.screen.blit(controls_text, controls_rect)
+        layer.blit(controls_text, controls_rect)
+        return layer
 
     # Yüksek skoru kaydetme
     def save_high_score(self):
         try:
             with open("high_score.txt", "w") as file:
                 file.write(str(self.high_score))
+            # Skoru doğrulamak için oyunun kaydını da sakla (python replay.py high_score.replay)
+            if self.recorder is not None:
+                self.recorder.to_replay(self.score).save("high_score.replay")
         except:
             print("Yüksek skor kaydedilemedi")
             
@@ -1631,31 +1863,19 @@ class Game:
             return 0
             
     def draw_game_over_screen(self):
-        # Koyu arka plan
-        game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        game_over_overlay.fill((0, 0, 0, 200))  # Koyu saydam siyah
-        self.screen.blit(game_over_overlay, (0, 0))
-        
-        # Daha büyük ve dikkat çekici OYUN BİTTİ yazısı
-        game_over_text = self.title_font.render("OYUNU KAYBETTİNİZ", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
-        
-        # Sarı renk ve daha büyük skor metni
-        score_text = self.font.render(f"SKORUNUZ: {self.score}", True, YELLOW)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
-        
-        # Yeni yüksek skor elde edildi mi kontrol et
-        if self.score > self.high_score:
+        # Yeni yüksek skor elde edildi mi kontrol et (otopilot skorları rekor sayılmaz)
+        if self.score > self.high_score and not self.autopilot_active:
             self.high_score = self.score
             self.save_high_score()
-            high_score_text = self.small_font.render(f"YENİ REKOR!", True, ORANGE)
+            high_score_line = ("YENİ REKOR!", ORANGE)
         else:
-            high_score_text = self.small_font.render(f"En Yüksek Skor: {self.high_score}", True, WHITE)
-        
-        high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 10))
-        
-        level_reached_text = self.small_font.render(f"Ulaşılan Seviye: {self.level + 1}", True, WHITE)
-        level_reached_rect = level_reached_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
+            high_score_line = (f"En Yüksek Skor: {self.high_score}", WHITE)
+
+        # Örtü ve sonuç yazıları tek katmanda; yalnızca sonuç değişince yeniden kurulur
+        key = (self.screen.get_size(), self.core.won, self.score, self.level, high_score_line)
+        layer = screen_cache.layer("game_over", key,
+                                   lambda: self.build_game_over_layer(high_score_line))
+        self.screen.blit(layer, (0, 0))
         
         # Sadece ana menü butonu için dikdörtgen
         button_width, button_height = 240, 50
@@ -1679,14 +1899,8 @@ class Game:
         pygame.draw.rect(self.screen, WHITE, menu_button, 2, 10)
         
         # Buton metni
-        menu_text = self.font.render("ANA MENÜ", True, WHITE)
+        menu_text = text_cache.render(self.font, "ANA MENÜ", True, WHITE)
         menu_rect = menu_text.get_rect(center=menu_button.center)
-        
-        # Metinleri ekrana çiz
-        self.screen.blit(game_over_text, game_over_rect)
-        self.screen.blit(score_text, score_rect)
-        self.screen.blit(high_score_text, high_score_rect)
-        self.screen.blit(level_reached_text, level_reached_rect)
         self.screen.blit(menu_text, menu_rect)
         
         # Ana menü butonuna tıklama işlemi
@@ -1696,52 +1910,136 @@ class Game:
             self.game_active = False  # Oyunu devre dışı bırak
             return  # İşlem tamamlandı, fonksiyondan çık
 
+    def build_game_over_layer(self, high_score_line):
+        # Koyu arka plan
+        layer = screen_cache.overlay(self.screen.get_size(), (0, 0, 0, 200)).copy()
+        
+        # Daha büyük ve dikkat çekici OYUN BİTTİ yazısı
+        if self.core.won:
+            # Tahta tamamen doldu - oyun kazanıldı
+            game_over_text = text_cache.render(self.title_font, "KAZANDINIZ!", True, YELLOW)
+        else:
+            game_over_text = text_cache.render(self.title_font, "OYUNU KAYBETTİNİZ", True, RED)
+        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
+        
+        # Sarı renk ve daha büyük skor metni
+        score_text = text_cache.render(self.font, f"SKORUNUZ: {self.score}", True, YELLOW)
+        score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
+        
+        high_score_text = text_cache.render(self.small_font, high_score_line[0], True, high_score_line[1])
+        high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 10))
+        
+        level_reached_text = text_cache.render(self.small_font, f"Ulaşılan Seviye: {self.level + 1}", True, WHITE)
+        level_reached_rect = level_reached_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
+        
+        # Metinleri katmana çiz
+        layer.blit(game_over_text, game_over_rect)
+        layer.blit(score_text, score_rect)
+        layer.blit(high_score_text, high_score_rect)
+        layer.blit(level_reached_text, level_reached_rect)
+        return layer
+
     def draw_pause_screen(self):
-        pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pause_overlay.fill((0, 0, 0, 128))  # Yarı saydam siyah
-        self.screen.blit(pause_overlay, (0, 0))
+        layer = screen_cache.layer("pause", (self.screen.get_size(),), self.build_pause_layer)
+        self.screen.blit(layer, (0, 0))
+
+    def build_pause_layer(self):
+        layer = screen_cache.overlay(self.screen.get_size(), (0, 0, 0, 128)).copy()  # Yarı saydam siyah
         
-        pause_text = self.font.render("DURAKLADI", True, WHITE)
+        pause_text = text_cache.render(self.font, "DURAKLADI", True, WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         
-        continue_text = self.small_font.render("Devam etmek için SPACE tuşuna basın", True, WHITE)
+        continue_text = text_cache.render(self.small_font, "Devam etmek için SPACE tuşuna basın", True, WHITE)
         continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
         
-        menu_text = self.small_font.render("Menüye dönmek için ESC tuşuna basın", True, WHITE)
+        menu_text = text_cache.render(self.small_font, "Menüye dönmek için ESC tuşuna basın", True, WHITE)
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 90))
         
-        self.screen.blit(pause_text, pause_rect)
-        self.screen.blit(continue_text, continue_rect)
-        self.screen.blit(menu_text, menu_rect)
+        layer.blit(pause_text, pause_rect)
+        layer.blit(continue_text, continue_rect)
+        layer.blit(menu_text, menu_rect)
+        return layer
         
     def draw_level_up_message(self):
         # Seviye atlama mesajını göster
-        level_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        level_overlay.fill((0, 0, 0, 100))  # Hafif saydam siyah
-        self.screen.blit(level_overlay, (0, 0))
+        layer = screen_cache.layer("level_up", (self.screen.get_size(), self.level), self.build_level_up_layer)
+        self.screen.blit(layer, (0, 0))
+
+    def build_level_up_layer(self):
+        layer = screen_cache.overlay(self.screen.get_size(), (0, 0, 0, 100)).copy()  # Hafif saydam siyah
         
         # Seviye metni
-        level_text = self.font.render(f"SEVİYE {self.level + 1}!", True, YELLOW)
+        level_text = text_cache.render(self.font, f"SEVİYE {self.level + 1}!", True, YELLOW)
         level_rect = level_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30))
         
         # Açıklama metni
-        info_text = self.small_font.render("Yeni engeller eklendi!", True, WHITE)
+        info_text = text_cache.render(self.small_font, "Yeni engeller eklendi!", True, WHITE)
         info_rect = info_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30))
         
-        # Ekrana çizim
-        self.screen.blit(level_text, level_rect)
-        self.screen.blit(info_text, info_rect)
+        # Katmana çizim
+        layer.blit(level_text, level_rect)
+        layer.blit(info_text, info_rect)
+        return layer
 
     def run(self):
+        # Sabit adımlı döngü: olaylar, geçen süre kadar simülasyon, ekran hızında çizim
+        previous = time.perf_counter()
         while self.running:
             self.handle_events()
+            now = time.perf_counter()
+            self.advance((now - previous) * 1000)
+            previous = now
             self.draw()
             self.clock.tick(FPS)
 
+def benchmark_draw(lengths=BENCHMARK_LENGTHS, frames=200):
+    # Yılan boyuna göre çizim süresi: gövdeyi hücre başına bir blit ile (eski yol) ve tek
+    # blits çağrısıyla çizmek, ayrıca zemin, meyve ve yılanla birlikte tam kare. Gövde
+    # pencereyi kıvrılarak dolduran bir yılan olarak ızgaraya yazılır; oyun kuralları çalışmaz.
+    game = Game(seed=0, board_size=VIEW_CELLS)
+    core, camera, snake, screen = game.core, game.camera, game.snake, game.screen
+    n = core.cell_number
+    cells = [y * n + (x if y % 2 == 0 else n - 1 - x) for y in range(n) for x in range(n)]
+    for length in lengths:
+        core.reset(0)
+        length = min(length, len(cells))
+        for cell in cells[:length]:
+            core.grid[cell] = BODY
+        camera.follow(core.head_pos)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            for position in camera.screen_cells(core.grid, BODY):
+                screen.blit(snake.body_part, position)
+        single = (time.perf_counter() - start) / frames
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            snake.draw(screen, camera, core.grid, core.head_pos, core.direction)
+        batched = (time.perf_counter() - start) / frames
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            game.draw_board()
+        full = (time.perf_counter() - start) / frames
+        print(f"yılan boyu {length}: tek tek blit {single * 1000:.3f} ms, "
+              f"blits {batched * 1000:.3f} ms, tam kare {full * 1000:.3f} ms")
+
+
 # Ana döngü
 if __name__ == "__main__":
-    game = Game()
+    if "--olcum" in sys.argv:
+        benchmark_draw()
+        pygame.quit()
+        sys.exit()
+
+    # İsteğe bağlı seed ve tahta boyu: python yılanOyunu.py 1234 500
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    board_size = int(sys.argv[2]) if len(sys.argv) > 2 else CELL_NUMBER
+    game = Game(seed, board_size)
     game.run()
+    mean_jitter, max_jitter = game.tick_jitter()
+    print(f"Tik aralığı sapması: ortalama {mean_jitter:.1f} ms, en büyük {max_jitter:.1f} ms")
     pygame.quit()
     sys.exit()
 